@@ -0,0 +1,102 @@
+"""
+Benchmark the per-request overhead of AsyncView on a hello-world view.
+
+    python -m benchmarks.dispatch
+    python -m benchmarks.dispatch --calls 200000
+
+The dispatch of AsyncView (a table built once per class) is compared with
+the dispatch it replaced, which looked the handler up on every request.
+"""
+
+import argparse
+import time
+
+from asgiref.sync import async_to_sync
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from benchmarks import utils
+from django_async_extensions.views.generic.base import AsyncView
+
+
+class HelloView(AsyncView):
+    # Built once, so the benchmark measures the view rather than the response.
+    response = None
+
+    async def get(self, request, *args, **kwargs):
+        return self.response
+
+
+class LookupDispatchView(HelloView):
+    """HelloView with the dispatch looking the handler up on every request."""
+
+    async def dispatch(self, request, *args, **kwargs):
+        if request.method.lower() in self.http_method_names:
+            handler = getattr(
+                self, request.method.lower(), self.http_method_not_allowed
+            )
+        else:
+            handler = self.http_method_not_allowed
+        return await handler(request, *args, **kwargs)
+
+
+def measure(view, request, calls, batch_size):
+    """
+    Return the time of a call to the ``view`` coroutine function in each
+    batch of calls.
+    """
+
+    async def run():
+        timings = []
+        for _ in range(calls // batch_size):
+            start = time.perf_counter()
+            for _ in range(batch_size):
+                await view(request)
+            timings.append((time.perf_counter() - start) / batch_size)
+        return timings
+
+    return sorted(async_to_sync(run)())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Benchmark the per-request overhead of AsyncView."
+    )
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    options = parser.parse_args(argv)
+
+    utils.configure()
+    HelloView.response = HttpResponse("Hello, World!")
+    factory = RequestFactory()
+    header = "%-32s %8s %10s %10s" % ("benchmark", "method", "p50 us", "p99 us")
+    print(header)  # noqa: T201
+    print("-" * len(header))  # noqa: T201
+    for method in ("get", "head", "post"):
+        request = factory.generic(method.upper(), "/")
+        for name, view_class in (
+            ("table", HelloView),
+            ("lookup", LookupDispatchView),
+        ):
+            instance = view_class()
+            instance.setup(request)
+            for label, view in (
+                ("%s dispatch()" % name, instance.dispatch),
+                ("%s as_view() view" % name, view_class.as_view()),
+            ):
+                # Warm up.
+                measure(view, request, options.batch_size, options.batch_size)
+                timings = measure(view, request, options.calls, options.batch_size)
+                print(  # noqa: T201
+                    "%-32s %8s %10.2f %10.2f"
+                    % (
+                        label,
+                        method.upper(),
+                        utils.percentile(timings, 50) * 1_000_000,
+                        utils.percentile(timings, 99) * 1_000_000,
+                    )
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+from django.db import models
+
+_row_models = {}
+
+
+def get_row_model(rows):
+    """
+    Return the model of the table holding ``rows`` rows, each size of the
+    benchmark gets its own table so they can be kept between runs.
+    """
+    if rows not in _row_models:
+
+        class Meta:
+            app_label = "benchmarks"
+            db_table = "benchmarks_row_%s" % rows
+
+        _row_models[rows] = type(
+            "Row%s" % rows,
+            (models.Model,),
+            {
+                "__module__": __name__,
+                "Meta": Meta,
+                "name": models.CharField(max_length=100),
+                "value": models.IntegerField(db_index=True),
+            },
+        )
+    return _row_models[rows]
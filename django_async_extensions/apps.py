@@ -0,0 +1,14 @@
+from django.apps import AppConfig
+from django.core import checks
+
+
+class AsyncExtensionsConfig(AppConfig):
+    name = "django_async_extensions"
+    verbose_name = "Async Extensions"
+
+    def ready(self):
+        from django_async_extensions.core.cache import connect_signals
+        from django_async_extensions.views.checks import check_async_views
+
+        checks.register(check_async_views, checks.Tags.urls)
+        connect_signals()
@@ -1,11 +1,12 @@
 from urllib.parse import urlparse
 
-from asgiref.sync import sync_to_async
 from django.contrib.auth.mixins import AccessMixin
 from django.contrib.auth.views import redirect_to_login
 from django.core.exceptions import PermissionDenied, ImproperlyConfigured
 from django.shortcuts import resolve_url
 
+from django_async_extensions.utils.sync import sync_to_async
+
 
 class AsyncAccessMixin(AccessMixin):
     async def handle_no_permission(self):
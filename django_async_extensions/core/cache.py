@@ -0,0 +1,194 @@
+import hashlib
+import logging
+import time
+from functools import lru_cache, partial
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.exceptions import EmptyResultSet
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+logger = logging.getLogger("django_async_extensions.cache")
+
+
+@lru_cache(maxsize=None)
+def _get_models_by_table():
+    return {
+        model._meta.db_table: model._meta.concrete_model
+        for model in apps.get_models(include_auto_created=True)
+    }
+
+
+def get_queryset_models(queryset):
+    """Return the set of concrete models whose tables the queryset reads from."""
+    models_by_table = _get_models_by_table()
+    models = {queryset.model._meta.concrete_model}
+    for join in queryset.query.alias_map.values():
+        model = models_by_table.get(join.table_name)
+        if model is not None:
+            models.add(model)
+    return models
+
+
+def get_queryset_sql_hash(queryset):
+    """
+    Return a hash of the compiled SQL and params of the queryset, or ``None``
+    if the queryset can't match any row.
+    """
+    try:
+        sql, params = queryset.query.get_compiler(using=queryset.db).as_sql()
+    except EmptyResultSet:
+        return None
+    data = "%s\n%s\n%r" % (queryset.db, sql, params)
+    return hashlib.sha256(data.encode()).hexdigest()
+
+
+def _get_generation_key(model):
+    # The generations are shared by all the key prefixes, so a save bumps
+    # them without knowing which caches were used in which process.
+    return (
+        "async_extensions:generation:%s" % model._meta.concrete_model._meta.label_lower
+    )
+
+
+# The caches this process built keys in, their generations are bumped on save
+# along with the ones of ASYNC_EXTENSIONS_CACHE_ALIASES.
+_used_aliases = set()
+
+
+def get_invalidated_cache_aliases():
+    """
+    Return the aliases of the caches whose generations are bumped when an
+    instance is saved or deleted: the ``ASYNC_EXTENSIONS_CACHE_ALIASES``
+    setting (``["default"]`` by default) and the caches used by this process.
+    """
+    aliases = getattr(settings, "ASYNC_EXTENSIONS_CACHE_ALIASES", [DEFAULT_CACHE_ALIAS])
+    return [*aliases, *sorted(_used_aliases.difference(aliases))]
+
+
+def _get_cache_aliases(cache_alias):
+    if cache_alias is None:
+        return get_invalidated_cache_aliases()
+    return [cache_alias]
+
+
+def bump_model_generation(model, cache_alias=None):
+    """
+    Invalidate all the keys built with the current generation of ``model``,
+    in ``cache_alias`` or in the caches of `get_invalidated_cache_aliases()`
+    if it's None.
+    """
+    key = _get_generation_key(model)
+    for alias in _get_cache_aliases(cache_alias):
+        cache = caches[alias]
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, time.time_ns(), None)
+
+
+async def abump_model_generation(model, cache_alias=None):
+    """Async version of bump_model_generation()."""
+    key = _get_generation_key(model)
+    for alias in _get_cache_aliases(cache_alias):
+        cache = caches[alias]
+        try:
+            await cache.aincr(key)
+        except ValueError:
+            await cache.aset(key, time.time_ns(), None)
+
+
+def _bump_generations(key):
+    for alias in get_invalidated_cache_aliases():
+        try:
+            caches[alias].incr(key)
+        except ValueError:
+            # No key was built with a generation of this model, the next one
+            # starts from a new generation, see aget_model_generations().
+            pass
+        except Exception:
+            # A cache outage mustn't make the save fail, the cached keys expire.
+            logger.warning(
+                "Could not invalidate %s in the %r cache.", key, alias, exc_info=True
+            )
+
+
+def _invalidate_model(sender, using=None, **kwargs):
+    # Bump once the transaction is committed, bumping before would let another
+    # process cache the old rows under the new generation.
+    key = _get_generation_key(sender)
+    transaction.on_commit(partial(_bump_generations, key), using=using)
+
+
+def _invalidate_through_model(sender, action, using=None, **kwargs):
+    if action.startswith("post_"):
+        _invalidate_model(sender, using=using)
+
+
+_signals_connected = False
+
+
+def connect_signals():
+    """
+    Bump the generation of a model whenever one of its instances is saved or
+    deleted (or, for a many-to-many through model, when the relation is
+    changed), once the transaction is committed, see
+    `get_invalidated_cache_aliases()`.
+
+    Called by ``AsyncExtensionsConfig.ready()``, so the saves of every process
+    with the app installed invalidate the cached keys.
+    """
+    global _signals_connected
+    if _signals_connected:
+        return
+    post_save.connect(
+        _invalidate_model, weak=False, dispatch_uid="async_extensions_save"
+    )
+    post_delete.connect(
+        _invalidate_model, weak=False, dispatch_uid="async_extensions_delete"
+    )
+    m2m_changed.connect(
+        _invalidate_through_model, weak=False, dispatch_uid="async_extensions_m2m"
+    )
+    _signals_connected = True
+
+
+async def aget_model_generations(models, cache_alias):
+    """Return the current generation of each of the models, in order."""
+    _used_aliases.add(cache_alias)
+    cache = caches[cache_alias]
+    keys = [_get_generation_key(model) for model in models]
+    generations = await cache.aget_many(keys)
+    for key in keys:
+        if key not in generations:
+            # Start from the current time rather than 0, so a generation
+            # evicted from the cache never brings back old keys.
+            await cache.aadd(key, time.time_ns(), None)
+            generations[key] = await cache.aget(key)
+    return [generations[key] for key in keys]
+
+
+async def aget_queryset_cache_key(queryset, cache_alias, key_prefix):
+    """
+    Return a cache key for the results of ``queryset``, or ``None`` if the
+    queryset can't be cached.
+
+    The key is built from the compiled SQL and params of the queryset and from
+    the generation of every model it reads from, so saving or deleting an
+    instance of any of these models invalidates it, see `connect_signals()`.
+    """
+    sql_hash = get_queryset_sql_hash(queryset)
+    if sql_hash is None:
+        return None
+    models = sorted(get_queryset_models(queryset), key=lambda m: m._meta.label_lower)
+    # Without the app in INSTALLED_APPS, only the saves of the processes that
+    # built a key invalidate it.
+    connect_signals()
+    generations = await aget_model_generations(models, cache_alias)
+    return "%s:%s:%s" % (
+        key_prefix,
+        sql_hash,
+        ".".join(str(generation) for generation in generations),
+    )
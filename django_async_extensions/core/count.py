@@ -0,0 +1,241 @@
+import asyncio
+import inspect
+import json
+from asyncio import iscoroutinefunction
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.exceptions import SynchronousOnlyOperation
+from django.db import connections
+from django.utils.inspect import method_has_no_args
+
+from django_async_extensions.core.cache import aget_queryset_cache_key
+from django_async_extensions.utils.sync import sync_to_async
+
+
+def _is_queryset(object_list):
+    return hasattr(object_list, "query") and hasattr(object_list, "acount")
+
+
+class CountStrategy:
+    """
+    Base class for the strategies an AsyncPaginator uses to count its objects.
+
+    `acount()` returns a ``(count, exact)`` tuple, where ``exact`` tells if
+    ``count`` is the real number of objects or only an approximation.
+    """
+
+    async def acount(self, object_list):
+        raise NotImplementedError(
+            "subclasses of CountStrategy must provide an acount() method"
+        )
+
+    def display(self, count, exact):
+        """Return a string representing the count, to be shown to the user."""
+        if exact:
+            return str(count)
+        return "%s+" % count
+
+    def get_cache_key(self):
+        """
+        Return a string identifying the strategy and its parameters, used in
+        the keys of `CachedCount`.
+        """
+        return type(self).__qualname__
+
+
+class ExactCount(CountStrategy):
+    """Count all the objects, e.g. with a ``SELECT COUNT(*)`` query."""
+
+    async def acount(self, object_list):
+        c = getattr(object_list, "acount", None)
+        if (
+            iscoroutinefunction(c)
+            and not inspect.isbuiltin(c)
+            and method_has_no_args(c)
+        ):
+            return await c(), True
+        try:
+            # if somehow the `__len__` method works in a sync manner
+            return len(object_list), True
+        except SynchronousOnlyOperation:
+            pass
+        except TypeError:
+            if not hasattr(object_list, "__aiter__"):
+                raise
+            # Count an async iterable without keeping its objects around.
+            count = 0
+            async for _obj in object_list:
+                count += 1
+            return count, True
+
+        c = getattr(object_list, "count", None)
+        if callable(c) and not inspect.isbuiltin(c) and method_has_no_args(c):
+            # A queryset-like object without async methods, run its count
+            # (e.g. a ``COUNT`` query) in a thread instead of fetching it.
+            return await sync_to_async(c)(), True
+        # `len()` is run in a thread rather than on a copy of the objects, so
+        # objects caching their results keep them for when a page is fetched.
+        return await sync_to_async(len)(object_list), True
+
+
+class CappedCount(CountStrategy):
+    """
+    Count at most ``cap`` objects.
+
+    The count is done over a ``LIMIT cap + 1`` subquery, so the database stops
+    counting once it knows there are more than ``cap`` objects, in which case
+    the count is reported as ``cap`` and is not exact.
+    """
+
+    def __init__(self, cap=1000):
+        self.cap = int(cap)
+
+    def get_cache_key(self):
+        return "%s(%d)" % (type(self).__qualname__, self.cap)
+
+    async def acount(self, object_list):
+        if not _is_queryset(object_list):
+            return await ExactCount().acount(object_list)
+        count = await object_list[: self.cap + 1].acount()
+        if count > self.cap:
+            return self.cap, False
+        return count, True
+
+
+class EstimatedCount(CountStrategy):
+    """
+    Use the row estimate of the database's query planner as the count.
+
+    The estimate is only used if it is at least ``threshold``, small results
+    are counted with the ``fallback`` strategy instead, so they are exact.
+    Backends without a planner estimate (e.g. SQLite) always use the fallback,
+    which by default is a ``CappedCount`` capped at ``threshold``.
+    """
+
+    def __init__(self, threshold=1000, fallback=None):
+        self.threshold = int(threshold)
+        self.fallback = fallback or CappedCount(self.threshold)
+
+    def get_cache_key(self):
+        return "%s(%d,%s)" % (
+            type(self).__qualname__,
+            self.threshold,
+            self.fallback.get_cache_key(),
+        )
+
+    async def acount(self, object_list):
+        if _is_queryset(object_list):
+            estimate = await self.aestimate(object_list)
+            if estimate is not None and estimate >= self.threshold:
+                return estimate, False
+        return await self.fallback.acount(object_list)
+
+    async def aestimate(self, queryset):
+        """
+        Return the planner's estimate of the number of rows of ``queryset``,
+        or ``None`` if the database can't provide one.
+        """
+        if connections[queryset.db].vendor != "postgresql":
+            return None
+        return await sync_to_async(self._explain_rows)(queryset)
+
+    def _explain_rows(self, queryset):
+        connection = connections[queryset.db]
+        sql, params = queryset.query.get_compiler(connection=connection).as_sql()
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+            plan = cursor.fetchone()[0]
+        if isinstance(plan, str):
+            plan = json.loads(plan)
+        return int(plan[0]["Plan"]["Plan Rows"])
+
+    def display(self, count, exact):
+        if exact:
+            return str(count)
+        return "~%s" % count
+
+
+class CachedCount(CountStrategy):
+    """
+    Cache the counts of another strategy in Django's cache framework, so they
+    are shared across requests and processes.
+
+    Counts are cached for ``timeout`` seconds, keyed by the wrapped strategy
+    (see `CountStrategy.get_cache_key()`) and by the compiled SQL and params
+    of the queryset, and are invalidated when an instance of a model
+    the queryset reads from is saved or deleted (``QuerySet.update()``,
+    ``bulk_create()`` and the like don't send signals, so they only expire).
+
+    Concurrent misses for the same key in one process are coalesced into a
+    single count. Hits and misses are recorded, see `stats()`.
+    """
+
+    def __init__(
+        self,
+        strategy=None,
+        timeout=60,
+        cache_alias=DEFAULT_CACHE_ALIAS,
+        key_prefix="async_extensions_count",
+    ):
+        self.strategy = strategy or ExactCount()
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._pending = {}
+
+    def display(self, count, exact):
+        return self.strategy.display(count, exact)
+
+    def get_cache_key(self):
+        return self.strategy.get_cache_key()
+
+    def stats(self):
+        """Return the number of hits and misses, and the hit rate."""
+        lookups = self.hits + self.misses + self.coalesced
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "hit_rate": (self.hits + self.coalesced) / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = self.coalesced = 0
+
+    async def acount(self, object_list):
+        if not _is_queryset(object_list):
+            return await self.strategy.acount(object_list)
+        # Strategies with different parameters count differently.
+        key = await aget_queryset_cache_key(
+            object_list,
+            self.cache_alias,
+            "%s:%s" % (self.key_prefix, self.strategy.get_cache_key()),
+        )
+        if key is None:
+            return await self.strategy.acount(object_list)
+
+        cached = await caches[self.cache_alias].aget(key)
+        if cached is not None:
+            self.hits += 1
+            return tuple(cached)
+
+        pending_key = (id(asyncio.get_running_loop()), key)
+        task = self._pending.get(pending_key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._acount_and_store(key, object_list))
+            self._pending[pending_key] = task
+            task.add_done_callback(lambda _task: self._pending.pop(pending_key, None))
+        # Shielded so a cancelled request doesn't cancel the count other
+        # requests are waiting for.
+        return await asyncio.shield(task)
+
+    async def _acount_and_store(self, key, object_list):
+        count, exact = await self.strategy.acount(object_list)
+        await caches[self.cache_alias].aset(key, (count, exact), self.timeout)
+        return count, exact
@@ -0,0 +1,109 @@
+import pickle
+import time
+from collections import OrderedDict
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+
+from django_async_extensions.core.cache import (
+    abump_model_generation,
+    aget_queryset_cache_key,
+)
+
+
+class ObjectCache:
+    """
+    Cache the objects fetched with ``queryset.aget()``, in a local LRU of
+    ``maxsize`` objects and in Django's cache framework, for ``timeout``
+    seconds.
+
+    The keys are built from the compiled SQL of the queryset (so from its
+    model and the pk or slug it's filtered by) and are invalidated when an
+    instance of a model the queryset reads from is saved or deleted, by any
+    process with the app in ``INSTALLED_APPS``. Use `ainvalidate()` after
+    changes that don't send signals, like ``QuerySet.update()``.
+
+    Each lookup returns a new copy of the object. Hits and misses are
+    recorded, see `stats()`.
+    """
+
+    def __init__(
+        self,
+        timeout=60,
+        maxsize=128,
+        cache_alias=DEFAULT_CACHE_ALIAS,
+        key_prefix="async_extensions_objects",
+    ):
+        self.timeout = timeout
+        self.maxsize = maxsize
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+        # key -> (expiry time, pickled object)
+        self._local = OrderedDict()
+
+    def stats(self):
+        """Return the number of hits and misses, and the hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = 0
+
+    def _get_local(self, key):
+        try:
+            expires, data = self._local[key]
+        except KeyError:
+            return None
+        if expires is not None and expires <= time.monotonic():
+            del self._local[key]
+            return None
+        self._local.move_to_end(key)
+        return data
+
+    def _set_local(self, key, data):
+        if not self.maxsize:
+            return
+        expires = None if self.timeout is None else time.monotonic() + self.timeout
+        self._local[key] = (expires, data)
+        self._local.move_to_end(key)
+        while len(self._local) > self.maxsize:
+            self._local.popitem(last=False)
+
+    async def aget(self, queryset):
+        """
+        Return ``await queryset.aget()``, from the cache if it's there.
+        ``DoesNotExist`` and ``MultipleObjectsReturned`` aren't cached.
+        """
+        key = await aget_queryset_cache_key(queryset, self.cache_alias, self.key_prefix)
+        if key is None:
+            return await queryset.aget()
+        data = self._get_local(key)
+        if data is None:
+            data = await caches[self.cache_alias].aget(key)
+            if data is not None:
+                self._set_local(key, data)
+        if data is not None:
+            self.hits += 1
+            return pickle.loads(data)  # noqa: S301
+        self.misses += 1
+        obj = await queryset.aget()
+        data = pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+        await caches[self.cache_alias].aset(key, data, self.timeout)
+        self._set_local(key, data)
+        return obj
+
+    async def ainvalidate(self, model):
+        """
+        Invalidate the cached objects (and the other keys of this cache) read
+        from the table of ``model``.
+        """
+        await abump_model_generation(model, self.cache_alias)
+
+    def clear_local(self):
+        """Empty the local LRU, the objects stay in Django's cache."""
+        self._local.clear()
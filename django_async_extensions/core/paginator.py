@@ -1,15 +1,63 @@
-import inspect
-from asyncio import iscoroutinefunction
-from math import ceil
-
-from asgiref.sync import sync_to_async
-
-from django.core.exceptions import SynchronousOnlyOperation
-from django.core.paginator import Paginator, PageNotAnInteger, EmptyPage
-from django.utils.inspect import method_has_no_args
+import asyncio
+import base64
+import binascii
+import datetime
+import json
+from functools import reduce
+from math import ceil, inf
+from operator import or_
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import (
+    Paginator,
+    PageNotAnInteger,
+    EmptyPage,
+    InvalidPage,
+)
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import Count, Q, Window
+from django.db.models.query import ModelIterable, ValuesIterable
+from django.utils.translation import gettext_lazy as _
+
+from django_async_extensions.core.count import ExactCount, _is_queryset
+from django_async_extensions.utils.sync import sync_to_async
+
+
+class InvalidCursor(InvalidPage):
+    pass
+
+
+async def _alist(object_list):
+    if isinstance(object_list, list):
+        return list(object_list)
+    if hasattr(object_list, "__aiter__"):
+        return [obj async for obj in object_list]
+    return await sync_to_async(list)(object_list)
+
+
+async def _abatch(iterable, size):
+    """Group the objects of an async iterable in lists of ``size`` objects."""
+    batch = []
+    async for obj in iterable:
+        batch.append(obj)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
 
 
 class AsyncPaginator(Paginator):
+    # "lazy": count the objects, then return a page whose objects are fetched
+    # when it's iterated. "concurrent": count the objects and fetch the page
+    # at the same time, the page is returned with its objects already fetched.
+    # "window": fetch the page and the count in a single query, by annotating
+    # `COUNT(*) OVER ()` on the rows.
+    fetch_modes = ("lazy", "concurrent", "window")
+    # The name of the annotation holding the count in the "window" mode.
+    window_count_alias = "_paginator_window_count"
+
     def __init__(
         self,
         object_list,
@@ -17,18 +65,147 @@ class AsyncPaginator(Paginator):
         orphans=0,
         allow_empty_first_page=True,
         error_messages=None,
+        count_strategy=None,
+        fetch_mode="lazy",
+        prefetcher=None,
     ):
         super().__init__(
             object_list, per_page, orphans, allow_empty_first_page, error_messages
         )
+        if fetch_mode not in self.fetch_modes:
+            raise ValueError(
+                "fetch_mode must be one of %s, not %r."
+                % (", ".join(repr(mode) for mode in self.fetch_modes), fetch_mode)
+            )
+        self.count_strategy = count_strategy or ExactCount()
+        self.fetch_mode = fetch_mode
+        self.prefetcher = prefetcher
         self._cache_anum_pages = None
         self._cache_acount = None
+        self._cache_acount_is_exact = None
 
     async def __aiter__(self):
         page_range = await self.apage_range()
         for page_number in page_range:
             yield await self.apage(page_number)
 
+    async def aiter_chunks(self, chunk_size=None, *, server_side_cursor=False):
+        """
+        Iterate over all the objects in lists of ``chunk_size`` (``per_page``
+        by default) objects, without counting them.
+
+        Querysets are walked in keyset chunks, a ``WHERE ... LIMIT`` query per
+        chunk, when their ordering allows it. Otherwise, or if
+        ``server_side_cursor`` is ``True``, they are walked with a single
+        `aiterator()` query, which uses a server-side cursor on the databases
+        that support it.
+        """
+        chunk_size = self.per_page if chunk_size is None else int(chunk_size)
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be a positive integer.")
+        object_list = self.object_list
+        if hasattr(object_list, "aiterator"):
+            keyset = None if server_side_cursor else _get_chunk_keyset(object_list)
+            if keyset is not None:
+                chunks = self._aiter_keyset_chunks(keyset, chunk_size)
+            else:
+                chunks = _abatch(
+                    object_list.aiterator(chunk_size=chunk_size), chunk_size
+                )
+        else:
+            chunks = self._aiter_sliced_chunks(chunk_size)
+        async for chunk in chunks:
+            yield chunk
+
+    async def _aiter_keyset_chunks(self, keyset, chunk_size):
+        queryset = self.object_list.order_by(*_keyset_order_by(keyset))
+        opts = queryset.model._meta
+        chunk_queryset = queryset
+        while True:
+            chunk = await _alist(chunk_queryset[:chunk_size])
+            if chunk:
+                yield chunk
+            if len(chunk) < chunk_size:
+                return
+            values = _keyset_values(chunk[-1], keyset, opts)
+            chunk_queryset = queryset.filter(_keyset_filter(keyset, values))
+
+    async def _aiter_sliced_chunks(self, chunk_size):
+        bottom = 0
+        while True:
+            chunk = await _alist(self.object_list[bottom : bottom + chunk_size])
+            if chunk:
+                yield chunk
+            if len(chunk) < chunk_size:
+                return
+            bottom += chunk_size
+
+    async def astream(self, buffer=0, *, server_side_cursor=False):
+        """
+        Iterate over all the pages, with their objects already fetched.
+
+        The objects are fetched with `aiter_chunks()`, so the pages are not
+        counted and no ``OFFSET`` is used. If ``buffer`` is more than 0, up to
+        ``buffer`` pages are fetched in the background while the current one
+        is being used.
+        """
+        pages = self._aiter_pages(server_side_cursor)
+        if buffer <= 0:
+            async for page in pages:
+                yield page
+            return
+
+        # The queue is bounded, so a slow consumer pauses the fetching instead
+        # of having all the pages buffered in memory.
+        queue = asyncio.Queue(maxsize=buffer)
+        done = object()
+
+        async def produce():
+            try:
+                async for page in pages:
+                    await queue.put(page)
+            except Exception as e:
+                await queue.put(e)
+            else:
+                await queue.put(done)
+            finally:
+                await pages.aclose()
+
+        producer = asyncio.ensure_future(produce())
+        try:
+            while (item := await queue.get()) is not done:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            producer.cancel()
+
+    async def _aiter_pages(self, server_side_cursor):
+        # A chunk is only turned into a page once the next one is fetched, so
+        # it's known if the page has a next one, or if the next chunk is small
+        # enough to be added to it as orphans.
+        number = 0
+        object_list = None
+        async for chunk in self.aiter_chunks(server_side_cursor=server_side_cursor):
+            if object_list is None:
+                object_list = chunk
+            elif len(chunk) < self.per_page and len(chunk) <= self.orphans:
+                object_list += chunk
+            else:
+                number += 1
+                yield self._get_streamed_page(object_list, number, has_next=True)
+                object_list = chunk
+        if object_list is None:
+            if not self.allow_empty_first_page:
+                return
+            object_list = []
+        yield self._get_streamed_page(object_list, number + 1, has_next=False)
+
+    def _get_streamed_page(self, object_list, number, has_next):
+        page = self._get_page(object_list, number, self)
+        page._has_next = has_next
+        return page
+
     def _validate_number(self, number, num_pages):
         try:
             if isinstance(number, float) and not number.is_integer():
@@ -46,6 +223,10 @@ class AsyncPaginator(Paginator):
     async def avalidate_number(self, number):
         """Validate the given 1-based page number."""
         num_page = await self.anum_pages()
+        if not await self.ais_count_exact():
+            # The number of pages is only an approximation, pages after it
+            # may still have objects, that is checked when they are fetched.
+            num_page = inf
         return self._validate_number(number, num_page)
 
     async def aget_page(self, number):
@@ -59,20 +240,133 @@ class AsyncPaginator(Paginator):
             number = 1
         except EmptyPage:
             number = await self.anum_pages()
-        return await self.apage(number)
+        try:
+            return await self.apage(number)
+        except EmptyPage:
+            if await self.ais_count_exact():
+                raise
+        # The page is past the end of the approximated count, fall back to the
+        # last page the count knows about, or to the first one.
+        try:
+            return await self.apage(min(number, await self.anum_pages()))
+        except EmptyPage:
+            return await self.apage(1)
 
     async def apage(self, number):
         """Return a AsyncPage object for the given 1-based page number."""
+        if self.fetch_mode == "concurrent":
+            return await self._apage_concurrent(number)
+        if self.fetch_mode == "window" and self._can_count_over_window():
+            return await self._apage_window(number)
         number = await self.avalidate_number(number)
         bottom = (number - 1) * self.per_page
         top = bottom + self.per_page
         count = await self.acount()
-        if top + self.orphans >= count:
+        if not await self.ais_count_exact():
+            if number > 1 and not await self._ahas_objects_from(bottom):
+                raise EmptyPage(self.error_messages["no_results"])
+        elif top + self.orphans >= count:
             top = count
         object_list = self.object_list[bottom:top]
+        if self.prefetcher is not None and _is_queryset(object_list):
+            object_list = await self._aprefetched_object_list(object_list, top, count)
 
         return self._get_page(object_list, number, self)
 
+    async def _aprefetched_object_list(self, object_list, top, count):
+        """
+        Schedule the prefetch of the next page, and return the prefetched
+        objects of this page if there are some.
+        """
+        exact = await self.ais_count_exact()
+        if top < count or not exact:
+            next_top = top + self.per_page
+            if exact and next_top + self.orphans >= count:
+                next_top = count
+            self.prefetcher.schedule(self.object_list[top:next_top])
+        objects = await self.prefetcher.aget(object_list)
+        return object_list if objects is None else objects
+
+    async def _apage_concurrent(self, number):
+        """
+        Count the objects and fetch the page with one extra object at the same
+        time, the extra object tells if there is a next page.
+        """
+        # Reject invalid numbers before running any query.
+        number = self._validate_number(number, inf)
+        bottom = (number - 1) * self.per_page
+        limit = self.per_page + self.orphans
+        _count, object_list = await asyncio.gather(
+            self.acount(), _alist(self.object_list[bottom : bottom + limit + 1])
+        )
+        number = await self.avalidate_number(number)
+        return self._get_fetched_page(object_list, number)
+
+    def _can_count_over_window(self):
+        """
+        Return `True` if the count can be annotated on the rows of the page.
+        """
+        object_list = self.object_list
+        if self._cache_acount is not None or not hasattr(object_list, "query"):
+            return False
+        query = object_list.query
+        return (
+            object_list._iterable_class in (ModelIterable, ValuesIterable)
+            and not query.distinct
+            and not query.combinator
+            and not query.is_sliced
+            and connections[object_list.db].features.supports_over_clause
+        )
+
+    async def _apage_window(self, number):
+        """
+        Fetch the page with one extra object, and the count with a
+        `COUNT(*) OVER ()` annotation in the same query. The count is only
+        done separately if the page is empty.
+        """
+        number = self._validate_number(number, inf)
+        bottom = (number - 1) * self.per_page
+        limit = self.per_page + self.orphans
+        alias = self.window_count_alias
+        queryset = self.object_list.annotate(**{alias: Window(Count("*"))})
+        object_list = [obj async for obj in queryset[bottom : bottom + limit + 1]]
+        if object_list:
+            for obj in object_list:
+                if isinstance(obj, dict):
+                    count = obj.pop(alias)
+                else:
+                    count = getattr(obj, alias)
+                    delattr(obj, alias)
+            self._cache_acount = count
+            self._cache_acount_is_exact = True
+        number = await self.avalidate_number(number)
+        return self._get_fetched_page(object_list, number)
+
+    def _get_fetched_page(self, object_list, number):
+        """
+        Return a page for the already fetched objects, which include one
+        object past the page (and its orphans) if there is a next page.
+        """
+        if not object_list and number > 1:
+            raise EmptyPage(self.error_messages["no_results"])
+        # Same as the lazy fetch: the remaining objects make up the last page
+        # if there are no more than `orphans` of them after this page.
+        limit = self.per_page + self.orphans
+        has_next = len(object_list) > limit
+        if has_next:
+            object_list = object_list[: self.per_page]
+
+        page = self._get_page(object_list, number, self)
+        page._has_next = has_next
+        return page
+
+    async def _ahas_objects_from(self, index):
+        """Return `True` if there is an object at the given 0-based index."""
+        object_list = self.object_list[index : index + 1]
+        if hasattr(object_list, "aexists"):
+            return await object_list.aexists()
+        return len(object_list) > 0
+
     def _get_page(self, *args, **kwargs):
         """
         Return an instance of a single page.
@@ -83,28 +377,32 @@ class AsyncPaginator(Paginator):
         return AsyncPage(*args, **kwargs)
 
     async def acount(self):
-        """Return the total number of objects, across all pages."""
+        """
+        Return the total number of objects, across all pages.
+
+        The count is done by the paginator's `count_strategy`, so it might
+        only be an approximation, see `ais_count_exact()`.
+        """
         if self._cache_acount is not None:
             return self._cache_acount
 
-        c = getattr(self.object_list, "acount", None)
-        if (
-            iscoroutinefunction(c)
-            and not inspect.isbuiltin(c)
-            and method_has_no_args(c)
-        ):
-            count = await c()
-        else:
-            try:
-                # if somehow the `__len__` method works in a sync manner
-                count = len(self.object_list)
-            except SynchronousOnlyOperation:
-                count = len(await sync_to_async(list)(self.object_list))
+        count, is_exact = await self.count_strategy.acount(self.object_list)
 
         self._cache_acount = count
+        self._cache_acount_is_exact = is_exact
 
         return count
 
+    async def ais_count_exact(self):
+        """Return `True` if the result of `acount()` is the exact count."""
+        await self.acount()
+        return self._cache_acount_is_exact
+
+    async def acount_display(self):
+        """Return the count as a string to be shown to the user, e.g. "1000+"."""
+        count = await self.acount()
+        return self.count_strategy.display(count, self._cache_acount_is_exact)
+
     async def anum_pages(self):
         """Return the total number of pages."""
         if self._cache_anum_pages is not None:
@@ -143,6 +441,10 @@ class AsyncPaginator(Paginator):
         number = await self.avalidate_number(number)
         num_pages = await self.anum_pages()
         page_range = await self.apage_range()
+        if not await self.ais_count_exact() and number > num_pages:
+            # The page exists even though the approximated count says otherwise.
+            num_pages = number
+            page_range = range(1, num_pages + 1)
 
         for page in self._get_elided_page_range(
             number, num_pages, page_range, on_each_side, on_ends
@@ -179,6 +481,13 @@ class AsyncPaginator(Paginator):
 
 
 class AsyncPage:
+    # Fetch the objects once, when the page is first used, and serve them from
+    # memory after that. Set to False to fetch them on every use instead, e.g.
+    # for pages too big to be kept in memory.
+    materialize = True
+    # Set by the paginator when it's known without counting the objects.
+    _has_next = None
+
     def __init__(self, object_list, number, paginator):
         self.object_list = object_list
         self.number = number
@@ -188,17 +497,22 @@ class AsyncPage:
         return "<Async Page %s>" % self.number
 
     async def __aiter__(self):
-        if hasattr(self.object_list, "__aiter__"):
-            async for obj in self.object_list:
+        if self.materialize:
+            object_list = await self._afetch_object_list()
+        else:
+            object_list = self.object_list
+        if hasattr(object_list, "__aiter__"):
+            async for obj in object_list:
                 yield obj
         else:
             # this is so if object_list is actually a list, iteration doesn't fail
-            for obj in self.object_list:
+            for obj in object_list:
                 yield obj
 
     async def _afetch_object_list(self):
         if not isinstance(self.object_list, list):
-            self.object_list = await self.alist()
+            self.object_list = await _alist(self.object_list)
+        return self.object_list
 
     async def agetitem(self, index):
         if not isinstance(index, (int, slice)):
@@ -209,20 +523,39 @@ class AsyncPage:
 
         # in the sync version, when `__getitem__` is called it turns the queryset
         # into a list, which errors since this is async code, so we handle that here
-        await self._afetch_object_list()
-        return self.object_list[index]
+        if self.materialize or isinstance(self.object_list, list):
+            object_list = await self._afetch_object_list()
+            return object_list[index]
+        if isinstance(index, slice):
+            return await _alist(self.object_list[index])
+        if index < 0:
+            raise IndexError("Negative indexing is not supported.")
+        objects = await _alist(self.object_list[index : index + 1])
+        if not objects:
+            raise IndexError("AsyncPage index out of range")
+        return objects[0]
 
     async def alen(self):
         """an async interface to be used instead of `len(page)`"""
-        return len(await self.alist())
+        if self.materialize or isinstance(self.object_list, list):
+            return len(await self._afetch_object_list())
+        if hasattr(self.object_list, "acount"):
+            return await self.object_list.acount()
+        return len(await _alist(self.object_list))
 
     async def alist(self):
         """make a list of the items in the queryset"""
-        if hasattr(self.object_list, "__aiter__"):
-            return [obj async for obj in self.object_list]
-        return await sync_to_async(list)(self.object_list)
+        if self.materialize:
+            return list(await self._afetch_object_list())
+        return await _alist(self.object_list)
 
     async def ahas_next(self):
+        if self._has_next is not None:
+            return self._has_next
+        if not await self.paginator.ais_count_exact():
+            return await self.paginator._ahas_objects_from(
+                self.number * self.paginator.per_page
+            )
         num_pages = await self.paginator.anum_pages()
         return self.number < num_pages
 
@@ -235,6 +568,8 @@ class AsyncPage:
         return has_previous or has_next
 
     async def anext_page_number(self):
+        if not await self.paginator.ais_count_exact() and not await self.ahas_next():
+            raise EmptyPage(self.paginator.error_messages["no_results"])
         return await self.paginator.avalidate_number(self.number + 1)
 
     async def aprevious_page_number(self):
@@ -255,8 +590,313 @@ class AsyncPage:
         Return the 1-based index of the last object on this page,
         relative to total objects found (hits).
         """
+        if not await self.paginator.ais_count_exact():
+            return (self.paginator.per_page * (self.number - 1)) + await self.alen()
         # Special case for the last page because there can be orphans.
         num_pages = await self.paginator.anum_pages()
         if self.number == num_pages:
             return await self.paginator.acount()
         return self.number * self.paginator.per_page
+
+
+def _get_keyset_ordering(queryset, ordering=None):
+    """
+    Return the ordering used for keyset pagination as a tuple of
+    ``(field_name, descending)`` pairs.
+
+    The ordering is taken from ``ordering`` if given, otherwise from the
+    queryset (falling back to the model's ``Meta.ordering``). The primary key
+    is appended when none of the fields is unique, so that the ordering is
+    always total.
+
+    Foreign keys are compared by their column (``writer_id``), so a foreign
+    key to a model with a ``Meta.ordering`` (which ``order_by()`` follows)
+    isn't supported, nor are nullable fields, rows with NULLs can't be
+    compared.
+    """
+    opts = queryset.model._meta
+    if ordering is None:
+        ordering = queryset.query.order_by
+        if not ordering and queryset.query.default_ordering:
+            ordering = opts.ordering
+    elif isinstance(ordering, str):
+        ordering = (ordering,)
+
+    keyset = []
+    is_unique = False
+    for item in ordering:
+        if not isinstance(item, str) or item == "?":
+            raise ValueError(
+                "Keyset pagination only supports ordering by field names, "
+                "not %r." % (item,)
+            )
+        descending = item.startswith("-")
+        name = item.lstrip("-+")
+        if name == "pk":
+            name = opts.pk.name
+        try:
+            field = opts.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or not field.concrete or field.many_to_many:
+            raise ValueError(
+                "Keyset pagination only supports ordering by fields of %s, "
+                "not %r." % (opts.label, item)
+            )
+        if field.is_relation and field.related_model._meta.ordering:
+            raise ValueError(
+                "Keyset pagination doesn't support ordering by %r, it follows "
+                "the ordering of %s." % (item, field.related_model._meta.label)
+            )
+        if field.null:
+            raise ValueError(
+                "Keyset pagination doesn't support ordering by the nullable "
+                "field %r." % item
+            )
+        keyset.append((field.attname, descending))
+        is_unique = is_unique or field.unique
+
+    if not is_unique:
+        descending = keyset[-1][1] if keyset else False
+        keyset.append((opts.pk.attname, descending))
+    return tuple(keyset)
+
+
+def _get_chunk_keyset(queryset):
+    """
+    Return the keyset ordering used to walk ``queryset`` in chunks, or
+    ``None`` if it can't be walked by its ordering.
+    """
+    query = queryset.query
+    if queryset._iterable_class not in (ModelIterable, ValuesIterable):
+        return None
+    if query.combinator or query.is_sliced:
+        return None
+    try:
+        keyset = _get_keyset_ordering(queryset)
+    except ValueError:
+        return None
+    opts = queryset.model._meta
+    for name, _descending in keyset:
+        field = opts.get_field(name)
+        if query.values_select and not {field.name, name} & set(query.values_select):
+            return None
+    return keyset
+
+
+def _keyset_order_by(keyset, reverse=False):
+    """Return the ``order_by()`` arguments for the given keyset ordering."""
+    return [
+        "%s%s" % ("-" if descending != reverse else "", name)
+        for name, descending in keyset
+    ]
+
+
+def _keyset_filter(keyset, values, reverse=False):
+    """
+    Return a ``Q`` object matching the rows that come after ``values`` in the
+    keyset ordering (or before them, if ``reverse`` is ``True``).
+
+    For an ordering of ``(a, -b, pk)`` this builds
+    ``a > x OR (a = x AND b < y) OR (a = x AND b = y AND pk > z)``.
+    """
+    clauses = []
+    equal = {}
+    for (name, descending), value in zip(keyset, values):
+        lookup = "lt" if descending != reverse else "gt"
+        clauses.append(Q(**equal, **{"%s__%s" % (name, lookup): value}))
+        equal[name] = value
+    return reduce(or_, clauses)
+
+
+def _keyset_values(row, keyset, opts):
+    """Return the values of the keyset fields for a row of the queryset."""
+    values = []
+    for name, _descending in keyset:
+        if isinstance(row, dict):
+            values.append(row[name] if name in row else row[opts.get_field(name).name])
+        else:
+            values.append(getattr(row, name))
+    return values
+
+
+class _CursorJSONEncoder(DjangoJSONEncoder):
+    """
+    DjangoJSONEncoder without its truncation of datetimes and times to
+    milliseconds, a cursor has to point exactly at its row.
+    """
+
+    def default(self, o):
+        if isinstance(o, (datetime.datetime, datetime.time)):
+            return o.isoformat()
+        return super().default(o)
+
+
+class AsyncCursorPaginator:
+    """
+    Paginate a queryset by its ordering (also known as keyset or seek
+    pagination).
+
+    Pages are addressed by opaque cursors instead of page numbers, each page is
+    fetched with a single ``WHERE ... LIMIT`` query, and no ``OFFSET`` or
+    ``COUNT`` query is ever issued, so the cost of a page doesn't depend on
+    how deep it is.
+    """
+
+    default_error_messages = {
+        "invalid_cursor": _("That cursor is not valid"),
+        "no_results": _("That page contains no results"),
+    }
+
+    def __init__(
+        self,
+        object_list,
+        per_page,
+        orphans=0,
+        allow_empty_first_page=True,
+        error_messages=None,
+        ordering=None,
+    ):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        self.orphans = int(orphans)
+        self.allow_empty_first_page = allow_empty_first_page
+        self.error_messages = (
+            self.default_error_messages
+            if error_messages is None
+            else self.default_error_messages | error_messages
+        )
+        self.ordering = _get_keyset_ordering(object_list, ordering)
+
+    def encode_cursor(self, values, reverse=False):
+        """Return an opaque cursor pointing at the row with the given values."""
+        data = json.dumps(
+            {"v": values, "r": reverse},
+            cls=_CursorJSONEncoder,
+            separators=(",", ":"),
+        )
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+    def decode_cursor(self, cursor):
+        """Return the ``(values, reverse)`` pair encoded in ``cursor``."""
+        try:
+            padding = "=" * (-len(cursor) % 4)
+            data = json.loads(base64.urlsafe_b64decode(cursor + padding))
+            values, reverse = data["v"], data["r"]
+        except (
+            TypeError,
+            ValueError,
+            KeyError,
+            binascii.Error,
+        ):
+            raise InvalidCursor(self.error_messages["invalid_cursor"])
+        if not isinstance(values, list) or len(values) != len(self.ordering):
+            raise InvalidCursor(self.error_messages["invalid_cursor"])
+        opts = self.object_list.model._meta
+        try:
+            values = [
+                opts.get_field(name).to_python(value)
+                for (name, _descending), value in zip(self.ordering, values)
+            ]
+        except (TypeError, ValueError, ValidationError):
+            raise InvalidCursor(self.error_messages["invalid_cursor"])
+        return values, bool(reverse)
+
+    async def aget_page(self, cursor=None):
+        """
+        Return a valid page, even if the cursor is invalid or points past the
+        end of the results.
+        """
+        try:
+            return await self.apage(cursor)
+        except InvalidPage:
+            return await self.apage(None)
+
+    async def apage(self, cursor=None):
+        """
+        Return an AsyncCursorPage for the given cursor, or the first page if
+        the cursor is ``None``.
+        """
+        values, reverse = (
+            (None, False) if cursor is None else self.decode_cursor(cursor)
+        )
+        queryset = self.object_list
+        if values is not None:
+            queryset = queryset.filter(_keyset_filter(self.ordering, values, reverse))
+        queryset = queryset.order_by(*_keyset_order_by(self.ordering, reverse))
+
+        # Fetch one extra row to know if there is a page after this one.
+        page_size = self.per_page if reverse else self.per_page + self.orphans
+        object_list = [obj async for obj in queryset[: page_size + 1]]
+        has_more = len(object_list) > page_size
+        if has_more:
+            object_list = object_list[: self.per_page]
+        if reverse:
+            object_list.reverse()
+
+        if not object_list and (cursor is not None or not self.allow_empty_first_page):
+            raise EmptyPage(self.error_messages["no_results"])
+
+        if reverse:
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, values is not None
+
+        opts = self.object_list.model._meta
+        next_cursor = previous_cursor = None
+        if has_next:
+            next_cursor = self.encode_cursor(
+                _keyset_values(object_list[-1], self.ordering, opts)
+            )
+        if has_previous:
+            previous_cursor = self.encode_cursor(
+                _keyset_values(object_list[0], self.ordering, opts), reverse=True
+            )
+        return self._get_page(object_list, next_cursor, previous_cursor, self)
+
+    def _get_page(self, *args, **kwargs):
+        """
+        Return an instance of a single page.
+
+        This hook can be used by subclasses to use an alternative to the
+        standard :cls:`AsyncCursorPage` object.
+        """
+        return AsyncCursorPage(*args, **kwargs)
+
+
+class AsyncCursorPage:
+    def __init__(self, object_list, next_cursor, previous_cursor, paginator):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+        self.paginator = paginator
+
+    def __repr__(self):
+        return "<Async Cursor Page>"
+
+    async def __aiter__(self):
+        for obj in self.object_list:
+            yield obj
+
+    async def agetitem(self, index):
+        if not isinstance(index, (int, slice)):
+            raise TypeError(
+                "AsyncCursorPage indices must be integers or slices, not %s."
+                % type(index).__name__
+            )
+        return self.object_list[index]
+
+    async def alen(self):
+        return len(self.object_list)
+
+    async def alist(self):
+        return list(self.object_list)
+
+    async def ahas_next(self):
+        return self.next_cursor is not None
+
+    async def ahas_previous(self):
+        return self.previous_cursor is not None
+
+    async def ahas_other_pages(self):
+        return self.next_cursor is not None or self.previous_cursor is not None
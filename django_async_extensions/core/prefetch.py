@@ -0,0 +1,117 @@
+import asyncio
+import logging
+
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+
+from django_async_extensions.core.cache import aget_queryset_cache_key
+
+logger = logging.getLogger("django_async_extensions.prefetch")
+
+
+class PagePrefetcher:
+    """
+    Fetch pages in the background and keep their objects in Django's cache
+    framework, so a later request for one of them doesn't hit the database.
+
+    Given to an AsyncPaginator, the page after the one being served is
+    prefetched. At most ``max_concurrency`` prefetches run at the same time,
+    pages scheduled while that many are running are dropped rather than
+    queued. Cached pages expire after ``timeout`` seconds and are invalidated
+    when an instance of a model their queryset reads from is saved or deleted.
+
+    Hits and misses are recorded, see `stats()`. Call `aclose()` on shutdown
+    to cancel the prefetches still running.
+    """
+
+    def __init__(
+        self,
+        timeout=60,
+        max_concurrency=2,
+        cache_alias=DEFAULT_CACHE_ALIAS,
+        key_prefix="async_extensions_prefetch",
+    ):
+        self.timeout = timeout
+        self.max_concurrency = int(max_concurrency)
+        self.cache_alias = cache_alias
+        self.key_prefix = key_prefix
+        self.hits = 0
+        self.misses = 0
+        self.scheduled = 0
+        self.dropped = 0
+        self._tasks = set()
+        self._pending_keys = set()
+
+    def stats(self):
+        """Return the number of hits, misses and prefetches, and the hit rate."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "scheduled": self.scheduled,
+            "dropped": self.dropped,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+    def reset_stats(self):
+        self.hits = self.misses = self.scheduled = self.dropped = 0
+
+    async def aget(self, queryset):
+        """
+        Return the list of prefetched objects of ``queryset``, or ``None`` if
+        it wasn't prefetched.
+        """
+        key = await aget_queryset_cache_key(queryset, self.cache_alias, self.key_prefix)
+        if key is None:
+            return None
+        objects = await caches[self.cache_alias].aget(key)
+        if objects is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return objects
+
+    def schedule(self, queryset):
+        """
+        Fetch ``queryset`` in a background task and cache its objects. Return
+        the task, or ``None`` if the prefetch was dropped.
+        """
+        if len(self._tasks) >= self.max_concurrency:
+            self.dropped += 1
+            return None
+        self.scheduled += 1
+        task = asyncio.ensure_future(self._aprefetch(queryset))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _aprefetch(self, queryset):
+        try:
+            key = await aget_queryset_cache_key(
+                queryset, self.cache_alias, self.key_prefix
+            )
+            if key is None or key in self._pending_keys:
+                return
+            self._pending_keys.add(key)
+            try:
+                cache = caches[self.cache_alias]
+                if await cache.ahas_key(key):
+                    return
+                objects = [obj async for obj in queryset]
+                await cache.aset(key, objects, self.timeout)
+            finally:
+                self._pending_keys.discard(key)
+        except Exception:
+            # Nobody waits for the task, so the error would be lost.
+            logger.exception("Error prefetching %r", queryset.query)
+
+    async def ajoin(self):
+        """Wait for the running prefetches to be done."""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def aclose(self):
+        """Cancel the running prefetches."""
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
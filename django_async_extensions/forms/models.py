@@ -1,10 +1,9 @@
 from itertools import chain
 
-from asgiref.sync import sync_to_async
-
 from django.forms.models import ModelForm
 
 from django_async_extensions.forms.utils import AsyncRenderableFormMixin
+from django_async_extensions.utils.sync import sync_to_async
 
 
 class AsyncModelForm(AsyncRenderableFormMixin, ModelForm):
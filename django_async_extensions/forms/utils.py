@@ -1,15 +1,32 @@
-from asgiref.sync import sync_to_async
-
+from django.forms.models import ModelChoiceField
 from django.utils.safestring import mark_safe
 
+from django_async_extensions.utils.sync import pooled_sync_to_async
+
 
 class AsyncRenderableMixin:
+    # Render in the sync pool (True), on the sync thread (False) or according
+    # to ASYNC_EXTENSIONS_SYNC_POOL (None), see get_use_sync_pool().
+    use_sync_pool = None
+
+    def get_use_sync_pool(self):
+        """
+        Return ``use_sync_pool``, or False if one of the fields renders a
+        queryset: the database can't be used in the sync pool.
+        """
+        fields = getattr(self, "fields", None) or {}
+        if any(isinstance(field, ModelChoiceField) for field in fields.values()):
+            return False
+        return self.use_sync_pool
+
     async def arender(self, template_name=None, context=None, renderer=None):
         renderer = renderer or self.renderer
         template = template_name or self.template_name
         context = context or self.get_context()
         return mark_safe(  # noqa:S308
-            await sync_to_async(renderer.render)(template, context)
+            await pooled_sync_to_async(
+                renderer.render, use_pool=self.get_use_sync_pool()
+            )(template, context)
         )
 
 
@@ -0,0 +1,27 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from django_async_extensions.views.checks import check_async_views
+
+
+class Command(BaseCommand):
+    help = "Checks that all the async class-based views in the URLconf are valid."
+
+    requires_system_checks = []
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--urlconf",
+            help="The Python path of the URLconf to check, defaults to "
+            "settings.ROOT_URLCONF.",
+        )
+
+    def handle(self, *args, **options):
+        errors = check_async_views(urlconf=options["urlconf"])
+        for error in errors:
+            self.stderr.write(str(error))
+        if errors:
+            raise CommandError(
+                "%s issue%s found in the async views."
+                % (len(errors), "" if len(errors) == 1 else "s")
+            )
+        self.stdout.write(self.style.SUCCESS("All the async views are valid."))
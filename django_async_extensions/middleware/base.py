@@ -2,10 +2,44 @@ from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 
 from django.core.exceptions import ImproperlyConfigured
 
+from django_async_extensions.middleware.profiling import (
+    is_profiling_enabled,
+    profile_middleware,
+)
+from django_async_extensions.utils.sync import sync_to_async
+
+HOOK_NAMES = (
+    "process_request",
+    "process_view",
+    "process_exception",
+    "process_template_response",
+    "process_response",
+)
+
+
+def get_async_hook(middleware, name):
+    """
+    Return the ``name`` hook of the middleware as a coroutine function, or
+    ``None`` if the middleware doesn't define it. Sync hooks are wrapped with
+    sync_to_async().
+    """
+    hook = getattr(middleware, name, None)
+    if hook is None or iscoroutinefunction(hook):
+        return hook
+    return sync_to_async(hook)
+
+
+def get_async_hooks(middleware):
+    """Return a dict of the hooks of the middleware, see get_async_hook()."""
+    return {name: get_async_hook(middleware, name) for name in HOOK_NAMES}
+
 
 class AsyncMiddlewareMixin:
     sync_capable = False
     async_capable = True
+    # With make_middleware_decorator, render the template responses of async
+    # views before awaiting process_response, see decorate_views.md.
+    async_render = False
 
     def __init__(self, get_response):
         if get_response is None:
@@ -21,6 +55,7 @@ class AsyncMiddlewareMixin:
         else:
             raise ImproperlyConfigured("get_response must be async")
 
+        self.resolve_hooks()
         super().__init__()
 
     def __repr__(self):
@@ -33,11 +68,37 @@ class AsyncMiddlewareMixin:
             ),
         )
 
+    def resolve_hooks(self):
+        """
+        Look the hooks of the middleware up once, rather than on every
+        request. Call it again after adding or removing a hook on the
+        instance.
+
+        All the hooks are stored in ``async_hooks`` as coroutine functions
+        (or ``None``), ``__call__`` uses ``process_request`` and
+        ``process_response`` and make_middleware_decorator uses the others.
+        In MIDDLEWARE, django's handler calls ``process_view``,
+        ``process_exception`` and ``process_template_response`` itself.
+
+        With ``ASYNC_EXTENSIONS_PROFILE_MIDDLEWARE``, the hooks used by
+        ``__call__`` are timed, see django_async_extensions.middleware.profiling.
+        """
+        self.async_hooks = hooks = get_async_hooks(self)
+        self._call_hooks = (hooks["process_request"], hooks["process_response"])
+        if is_profiling_enabled():
+            self._call_hooks = profile_middleware(self, *self._call_hooks)
+        return self._call_hooks
+
     async def __call__(self, request):
+        try:
+            process_request, process_response = self._call_hooks
+        except AttributeError:
+            # __init__() was overridden without calling super().__init__().
+            process_request, process_response = self.resolve_hooks()
         response = None
-        if hasattr(self, "process_request"):
-            response = await self.process_request(request)
+        if process_request is not None:
+            response = await process_request(request)
         response = response or await self.get_response(request)
-        if hasattr(self, "process_response"):
-            response = await self.process_response(request, response)
+        if process_response is not None:
+            response = await process_response(request, response)
         return response
@@ -0,0 +1,375 @@
+"""
+Async versions of Django's cache middleware and of the ``cache_page``
+decorator, using the async API of the cache framework.
+
+Concurrent requests missing the cache for the same key wait for the first
+one to render the page, instead of all rendering it. With
+``stale_while_revalidate``, expired pages are kept that many more seconds and
+served while one request renders the page again.
+"""
+
+import asyncio
+import time
+
+from django.conf import settings
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.utils.cache import (
+    _generate_cache_header_key,
+    _generate_cache_key,
+    cc_delim_re,
+    get_max_age,
+    has_vary_header,
+    patch_response_headers,
+    patch_vary_headers,
+)
+from django.utils.http import parse_http_date_safe
+
+from django_async_extensions.middleware.base import AsyncMiddlewareMixin
+from django_async_extensions.utils.decorators import make_middleware_decorator
+
+# (event loop, cache key) -> asyncio.Event set when the page is cached.
+_renders = {}
+
+
+async def aget_cache_key(request, key_prefix=None, method="GET", cache=None):
+    """Async version of django.utils.cache.get_cache_key()."""
+    if key_prefix is None:
+        key_prefix = settings.CACHE_MIDDLEWARE_KEY_PREFIX
+    cache_key = _generate_cache_header_key(key_prefix, request)
+    if cache is None:
+        cache = caches[settings.CACHE_MIDDLEWARE_ALIAS]
+    headerlist = await cache.aget(cache_key)
+    if headerlist is not None:
+        return _generate_cache_key(request, method, headerlist, key_prefix)
+    else:
+        return None
+
+
+async def alearn_cache_key(
+    request, response, cache_timeout=None, key_prefix=None, cache=None
+):
+    """Async version of django.utils.cache.learn_cache_key()."""
+    if key_prefix is None:
+        key_prefix = settings.CACHE_MIDDLEWARE_KEY_PREFIX
+    if cache_timeout is None:
+        cache_timeout = settings.CACHE_MIDDLEWARE_SECONDS
+    cache_key = _generate_cache_header_key(key_prefix, request)
+    if cache is None:
+        cache = caches[settings.CACHE_MIDDLEWARE_ALIAS]
+    headerlist = []
+    if response.has_header("Vary"):
+        # If i18n is used, the generated cache key will be suffixed with the
+        # current locale. Adding the raw value of Accept-Language is redundant
+        # in that case and would result in storing the same content under
+        # multiple keys in the cache. See Django's #18191 for details.
+        is_accept_language_redundant = settings.USE_I18N
+        for header in cc_delim_re.split(response.headers["Vary"]):
+            header = header.upper().replace("-", "_")
+            if header != "ACCEPT_LANGUAGE" or not is_accept_language_redundant:
+                headerlist.append("HTTP_" + header)
+        headerlist.sort()
+    await cache.aset(cache_key, headerlist, cache_timeout)
+    return _generate_cache_key(request, request.method, headerlist, key_prefix)
+
+
+def _release_render(request):
+    """Wake up the requests waiting for the render of ``request``."""
+    render = getattr(request, "_cache_render", None)
+    if render is None:
+        return
+    del request._cache_render
+    key, loop, event = render
+    if _renders.get(key) is event:
+        del _renders[key]
+    try:
+        loop.call_soon_threadsafe(event.set)
+    except RuntimeError:
+        # The loop is closed, nobody can be waiting on it.
+        pass
+
+
+class AsyncUpdateCacheMiddleware(AsyncMiddlewareMixin):
+    """
+    Response-phase cache middleware that updates the cache if the response is
+    cacheable.
+
+    Must be used as part of the two-part update/fetch cache middleware.
+    AsyncUpdateCacheMiddleware must be the first piece of middleware in
+    MIDDLEWARE so that it'll get called last during the response phase.
+    """
+
+    # Seconds an expired page is still served while it's rendered again.
+    stale_while_revalidate = 0
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.cache_timeout = settings.CACHE_MIDDLEWARE_SECONDS
+        self.page_timeout = None
+        self.key_prefix = settings.CACHE_MIDDLEWARE_KEY_PREFIX
+        self.cache_alias = settings.CACHE_MIDDLEWARE_ALIAS
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    def _should_update_cache(self, request, response):
+        return hasattr(request, "_cache_update_cache") and request._cache_update_cache
+
+    async def process_response(self, request, response):
+        """Set the cache, if needed."""
+        deferred = False
+        try:
+            deferred = await self._aupdate_cache(request, response)
+        finally:
+            if not deferred:
+                _release_render(request)
+        return response
+
+    async def _aupdate_cache(self, request, response):
+        """
+        Cache the response if it's cacheable. Return True if it's cached once
+        rendered, by a post-render callback.
+        """
+        if not self._should_update_cache(request, response):
+            # We don't need to update the cache, just return.
+            return
+
+        if response.streaming or response.status_code not in (200, 304):
+            return
+
+        # Don't cache responses that set a user-specific (and maybe security
+        # sensitive) cookie while varying on Cookie.
+        if response.cookies and has_vary_header(response, "Cookie"):
+            return
+
+        # Don't cache responses when the Cache-Control header is set to
+        # private, no-cache, or no-store.
+        cache_control = response.get("Cache-Control", "").lower()
+        if cache_control and any(
+            directive in cache_control
+            for directive in (
+                "private",
+                "no-cache",
+                "no-store",
+            )
+        ):
+            return
+
+        # Don't cache responses when the Vary header contains '*'.
+        if has_vary_header(response, "*"):
+            return
+
+        # Page timeout takes precedence over the "max-age" and the default
+        # cache timeout.
+        timeout = self.page_timeout
+        if timeout is None:
+            # The timeout from the "max-age" section of the "Cache-Control"
+            # header takes precedence over the default cache timeout.
+            timeout = get_max_age(response)
+            if timeout is None:
+                timeout = self.cache_timeout
+            elif timeout == 0:
+                # max-age was set to 0, don't cache.
+                return
+        patch_response_headers(response, timeout)
+        # Make the response vary on Authorization if the request bears that
+        # header, unless allowed by "public" per RFC 9111, Section 3.5.
+        if request.headers.get("Authorization") and "public" not in cache_control:
+            patch_vary_headers(response, ("Authorization",))
+        if timeout and response.status_code == 200:
+            # Keep the page in the cache while it can be served stale.
+            cache_timeout = timeout + self.stale_while_revalidate
+            cache_key = await alearn_cache_key(
+                request, response, cache_timeout, self.key_prefix, cache=self.cache
+            )
+            if hasattr(response, "render") and not response.is_rendered:
+                # The callbacks run in a sync context, once rendered.
+                def set_cache(r):
+                    try:
+                        self.cache.set(cache_key, r, cache_timeout)
+                    finally:
+                        _release_render(request)
+
+                response.add_post_render_callback(set_cache)
+                return True
+            else:
+                await self.cache.aset(cache_key, response, cache_timeout)
+
+
+class AsyncFetchFromCacheMiddleware(AsyncMiddlewareMixin):
+    """
+    Request-phase cache middleware that fetches a page from the cache.
+
+    Must be used as part of the two-part update/fetch cache middleware.
+    AsyncFetchFromCacheMiddleware must be the last piece of middleware in
+    MIDDLEWARE so that it'll get called last during the request phase.
+    """
+
+    stale_while_revalidate = 0
+    # Seconds a request waits for another one rendering the same page.
+    coalesce_timeout = 30
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.key_prefix = settings.CACHE_MIDDLEWARE_KEY_PREFIX
+        self.cache_alias = settings.CACHE_MIDDLEWARE_ALIAS
+
+    @property
+    def cache(self):
+        return caches[self.cache_alias]
+
+    async def _aget_cached_response(self, request):
+        cache_key = await aget_cache_key(
+            request, self.key_prefix, "GET", cache=self.cache
+        )
+        if cache_key is None:
+            return None, None
+        response = await self.cache.aget(cache_key)
+        # if it wasn't found and we are looking for a HEAD, try looking just
+        # for that
+        if response is None and request.method == "HEAD":
+            head_key = await aget_cache_key(
+                request, self.key_prefix, "HEAD", cache=self.cache
+            )
+            response = await self.cache.aget(head_key)
+        return cache_key, response
+
+    def _is_stale(self, response):
+        expires = parse_http_date_safe(response.get("Expires", ""))
+        return expires is not None and expires < time.time()
+
+    async def process_request(self, request):
+        """
+        Check whether the page is already cached and return the cached
+        version if available.
+        """
+        if request.method not in ("GET", "HEAD"):
+            request._cache_update_cache = False
+            return None  # Don't bother checking the cache.
+
+        cache_key, response = await self._aget_cached_response(request)
+        if cache_key is None:
+            request._cache_update_cache = True
+            return None  # No cache information available, need to rebuild.
+
+        if response is None or (
+            self.stale_while_revalidate and self._is_stale(response)
+        ):
+            loop = asyncio.get_running_loop()
+            event = _renders.get((loop, cache_key))
+            if event is not None and response is None:
+                # Another request is rendering the page, wait for it.
+                try:
+                    await asyncio.wait_for(
+                        asyncio.shield(event.wait()), self.coalesce_timeout
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                cache_key, response = await self._aget_cached_response(request)
+            if event is None or response is None:
+                # Render the page, the other requests wait for it (or get
+                # the stale page).
+                event = asyncio.Event()
+                _renders[(loop, cache_key)] = event
+                request._cache_render = ((loop, cache_key), loop, event)
+                task = asyncio.current_task()
+                if task is not None:
+                    # Release the render if the request's task ends before
+                    # process_response(), e.g. when the client disconnects.
+                    task.add_done_callback(lambda task: _release_render(request))
+                request._cache_update_cache = True
+                return None
+
+        # Derive the age estimation of the cached response.
+        if (max_age_seconds := get_max_age(response)) is not None and (
+            expires_timestamp := parse_http_date_safe(response["Expires"])
+        ) is not None:
+            now_timestamp = int(time.time())
+            remaining_seconds = expires_timestamp - now_timestamp
+            # Use Age: 0 if local clock got turned back.
+            response["Age"] = max(0, max_age_seconds - remaining_seconds)
+
+        # hit, return cached response
+        request._cache_update_cache = False
+        return response
+
+    async def process_exception(self, request, exception):
+        _release_render(request)
+        return None
+
+
+class AsyncCacheMiddleware(AsyncUpdateCacheMiddleware, AsyncFetchFromCacheMiddleware):
+    """
+    Cache middleware that provides basic behavior for many simple sites.
+
+    Also used as the hook point for the async_cache_page decorator, which is
+    generated using make_middleware_decorator.
+    """
+
+    def __init__(
+        self,
+        get_response,
+        cache_timeout=None,
+        page_timeout=None,
+        stale_while_revalidate=None,
+        **kwargs,
+    ):
+        super().__init__(get_response)
+        # We need to differentiate between "provided, but using default value",
+        # and "not provided". If the value is provided using a default, then
+        # we fall back to system defaults. If it is not provided at all,
+        # we need to use middleware defaults.
+
+        try:
+            key_prefix = kwargs["key_prefix"]
+            if key_prefix is None:
+                key_prefix = ""
+            self.key_prefix = key_prefix
+        except KeyError:
+            pass
+        try:
+            cache_alias = kwargs["cache_alias"]
+            if cache_alias is None:
+                cache_alias = DEFAULT_CACHE_ALIAS
+            self.cache_alias = cache_alias
+        except KeyError:
+            pass
+
+        if cache_timeout is not None:
+            self.cache_timeout = cache_timeout
+        self.page_timeout = page_timeout
+        if stale_while_revalidate is not None:
+            self.stale_while_revalidate = stale_while_revalidate
+
+    async def __call__(self, request):
+        try:
+            return await super().__call__(request)
+        finally:
+            # In case process_response() isn't reached, e.g. when the request
+            # is cancelled.
+            _release_render(request)
+
+
+def async_cache_page(timeout, *, cache=None, key_prefix=None, stale_while_revalidate=0):
+    """
+    Decorator for async views that tries getting the page from the cache and
+    populates the cache if the page isn't in the cache yet.
+
+    The cache is keyed by the URL and some data from the headers.
+    Additionally there is the key prefix that is used to distinguish different
+    cache areas in a multi-site setup. You could use the
+    get_current_site().domain, for example, as that is unique across a Django
+    project.
+
+    Additionally, all headers from the response's Vary header will be taken
+    into account on caching -- just like the middleware does.
+
+    Expired pages are served for ``stale_while_revalidate`` more seconds while
+    a request renders them again.
+    """
+    return make_middleware_decorator(AsyncCacheMiddleware)(
+        page_timeout=timeout,
+        cache_alias=cache,
+        key_prefix=key_prefix,
+        stale_while_revalidate=stale_while_revalidate,
+    )
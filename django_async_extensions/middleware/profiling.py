@@ -0,0 +1,187 @@
+"""
+Opt-in profiling of the AsyncMiddlewareMixin middlewares in MIDDLEWARE.
+
+Set ``ASYNC_EXTENSIONS_PROFILE_MIDDLEWARE = True`` to time the middlewares
+created from then on. For each request and middleware, the total time (from
+``process_request`` to the end of ``process_response``) and the self time
+(the total time minus the time spent in ``get_response``) are:
+
+* added to the ``Server-Timing`` header of the response,
+* logged at the DEBUG level by the
+  ``django_async_extensions.middleware.profiling`` logger,
+* added to the histograms of ``profiler``, see `MiddlewareProfiler`.
+
+When the setting is off, the middlewares aren't wrapped at all.
+"""
+
+import logging
+import threading
+import time
+from bisect import bisect_left
+from functools import wraps
+
+from django.conf import settings
+
+logger = logging.getLogger("django_async_extensions.middleware.profiling")
+
+# Upper bounds of the buckets of the histograms, in milliseconds.
+DEFAULT_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+def is_profiling_enabled():
+    return getattr(settings, "ASYNC_EXTENSIONS_PROFILE_MIDDLEWARE", False)
+
+
+class Histogram:
+    """A cumulative histogram of durations, in milliseconds."""
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        # The last count is for the durations above the last bucket.
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def as_dict(self):
+        """
+        Return the count, the sum and the cumulative count of each bucket, the
+        last one being ``"+Inf"``.
+        """
+        buckets = {}
+        cumulative = 0
+        for bound, count in zip((*self.buckets, "+Inf"), self.counts):
+            cumulative += count
+            buckets[bound] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class MiddlewareProfiler:
+    """
+    Aggregate the self and total times of the middlewares, by middleware
+    class name, in histograms that can be read with `snapshot()`.
+
+    Set ``server_timing`` to False to not add the ``Server-Timing`` header.
+    """
+
+    server_timing = True
+
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._histograms = {}
+        self._lock = threading.Lock()
+
+    def record(self, name, self_time, total_time):
+        """Record the times, in milliseconds, of a request to middleware ``name``."""
+        with self._lock:
+            try:
+                self_histogram, total_histogram = self._histograms[name]
+            except KeyError:
+                self_histogram = Histogram(self.buckets)
+                total_histogram = Histogram(self.buckets)
+                self._histograms[name] = (self_histogram, total_histogram)
+            self_histogram.observe(self_time)
+            total_histogram.observe(total_time)
+
+    def snapshot(self):
+        """
+        Return a dict mapping the name of each middleware to the histograms of
+        its self and total times, see `Histogram.as_dict()`.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "self_time": self_histogram.as_dict(),
+                    "total_time": total_histogram.as_dict(),
+                }
+                for name, (self_histogram, total_histogram) in self._histograms.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self._histograms.clear()
+
+
+profiler = MiddlewareProfiler()
+
+
+class _Timing:
+    __slots__ = ("start", "downstream")
+
+    def __init__(self, start):
+        self.start = start
+        self.downstream = 0.0
+
+
+def _add_server_timing(response, name, self_time, total_time):
+    value = "%s;dur=%.3f, %s-total;dur=%.3f" % (name, self_time, name, total_time)
+    if response.has_header("Server-Timing"):
+        value = "%s, %s" % (response["Server-Timing"], value)
+    response["Server-Timing"] = value
+
+
+def profile_middleware(middleware, process_request, process_response):
+    """
+    Return timed versions of the ``process_request`` and ``process_response``
+    hooks of the middleware (either may be None), and time its
+    ``get_response``.
+    """
+    name = middleware.__class__.__name__
+    key = id(middleware)
+    get_response = getattr(
+        middleware.get_response, "_unprofiled", middleware.get_response
+    )
+
+    @wraps(get_response, updated=())
+    async def timed_get_response(request):
+        start = time.perf_counter()
+        try:
+            return await get_response(request)
+        finally:
+            timing = getattr(request, "_middleware_timings", {}).get(key)
+            if timing is not None:
+                timing.downstream += time.perf_counter() - start
+
+    timed_get_response._unprofiled = get_response
+    middleware.get_response = timed_get_response
+
+    async def timed_process_request(request):
+        try:
+            timings = request._middleware_timings
+        except AttributeError:
+            timings = request._middleware_timings = {}
+        timings[key] = _Timing(time.perf_counter())
+        if process_request is not None:
+            return await process_request(request)
+        return None
+
+    async def timed_process_response(request, response):
+        if process_response is not None:
+            response = await process_response(request, response)
+        timing = getattr(request, "_middleware_timings", {}).pop(key, None)
+        if timing is None:
+            return response
+        total_time = (time.perf_counter() - timing.start) * 1000
+        self_time = total_time - timing.downstream * 1000
+        profiler.record(name, self_time, total_time)
+        logger.debug(
+            "%s: %.3fms self, %.3fms total",
+            name,
+            self_time,
+            total_time,
+            extra={
+                "middleware": name,
+                "self_time": self_time,
+                "total_time": total_time,
+                "request": request,
+            },
+        )
+        if profiler.server_timing:
+            _add_server_timing(response, name, self_time, total_time)
+        return response
+
+    return timed_process_request, timed_process_response
@@ -0,0 +1,61 @@
+import logging
+
+from django_async_extensions.middleware.base import AsyncMiddlewareMixin
+from django_async_extensions.utils.sync import record_hops
+
+logger = logging.getLogger("django_async_extensions.thread_hops")
+
+
+class AsyncThreadHopMiddleware(AsyncMiddlewareMixin):
+    """
+    Record the sync_to_async() hops made by django_async_extensions while
+    handling the request, and report them in the ``Server-Timing`` header of
+    the response and with the ``django_async_extensions.thread_hops`` logger.
+
+    Hops made once the middleware returned, like the ones made while
+    streaming the response, aren't recorded.
+    """
+
+    # Add the hops to the Server-Timing header of the response.
+    server_timing = True
+    log_level = logging.DEBUG
+
+    async def __call__(self, request):
+        with record_hops() as recorder:
+            response = await self.get_response(request)
+        self.report_hops(request, response, recorder)
+        return response
+
+    def report_hops(self, request, response, recorder):
+        """Report the hops recorded while handling ``request``."""
+        if self.server_timing:
+            value = (
+                'sync-hops;desc="%d hops (%d thread sensitive)";dur=%.3f, '
+                "sync-hops-wait;dur=%.3f"
+                % (
+                    len(recorder),
+                    recorder.thread_sensitive_count,
+                    recorder.run * 1000,
+                    recorder.wait * 1000,
+                )
+            )
+            if response.has_header("Server-Timing"):
+                value = "%s, %s" % (response["Server-Timing"], value)
+            response["Server-Timing"] = value
+        if recorder.hops and logger.isEnabledFor(self.log_level):
+            logger.log(
+                self.log_level,
+                "%s %s: %d sync_to_async hops (%d thread sensitive), "
+                "%.3fms waiting, %.3fms running: %s",
+                request.method,
+                request.path,
+                len(recorder),
+                recorder.thread_sensitive_count,
+                recorder.wait * 1000,
+                recorder.run * 1000,
+                ", ".join(
+                    "%s (%.3fms + %.3fms)" % (hop.name, hop.wait * 1000, hop.run * 1000)
+                    for hop in recorder.hops
+                ),
+                extra={"request": request, "hops": recorder.hops},
+            )
@@ -0,0 +1,76 @@
+from django.template.backends.utils import csrf_input_lazy, csrf_token_lazy
+
+from django_async_extensions.utils.sync import pooled_sync_to_async
+
+
+def _is_async_jinja2(template):
+    """
+    Return whether ``template`` is a template of Django's Jinja2 backend with
+    ``enable_async`` set, which can be rendered natively.
+    """
+    environment = getattr(getattr(template, "template", None), "environment", None)
+    return bool(getattr(environment, "is_async", False)) and hasattr(
+        template, "backend"
+    )
+
+
+async def _arender_jinja2(template, context, request):
+    # Same context as the Jinja2 backend's Template.render().
+    context = {} if context is None else dict(context)
+    if request is not None:
+        context["request"] = request
+        context["csrf_input"] = csrf_input_lazy(request)
+        context["csrf_token"] = csrf_token_lazy(request)
+        for context_processor in template.backend.template_context_processors:
+            context.update(context_processor(request))
+    return await template.template.render_async(context)
+
+
+async def arender_response(response, use_pool=None, thread_sensitive=False):
+    """
+    Render a SimpleTemplateResponse (or TemplateResponse) without blocking the
+    event loop, and return it like ``response.render()`` does.
+
+    The template is resolved and rendered in a thread that isn't
+    thread-sensitive, so concurrent renders don't wait for each other.
+    Templates of a Jinja2 backend with ``enable_async`` are rendered natively
+    with ``render_async()``. ``use_pool`` runs the thread in the sync pool,
+    see pooled_sync_to_async(), ``thread_sensitive`` renders on the sync
+    thread instead, for templates that query the database. The post-render
+    callbacks run in the same thread as the render.
+    """
+    if response.is_rendered:
+        return response
+    context = response.resolve_context(response.context_data)
+    request = response._request
+
+    def set_content(content):
+        # Like SimpleTemplateResponse.render(), the post-render callbacks are
+        # sync (e.g. async_to_sync() wrappers), they can't run on the loop.
+        response.content = content
+        retval = response
+        for post_callback in response._post_render_callbacks:
+            newretval = post_callback(retval)
+            if newretval is not None:
+                retval = newretval
+        return retval
+
+    def render():
+        template = response.resolve_template(response.template_name)
+        if _is_async_jinja2(template):
+            return template, None
+        return None, set_content(template.render(context, request))
+
+    template, retval = await pooled_sync_to_async(
+        render, use_pool=use_pool, thread_sensitive=thread_sensitive
+    )()
+    if template is not None:
+        content = await _arender_jinja2(template, context, request)
+        if response._post_render_callbacks:
+            retval = await pooled_sync_to_async(
+                set_content, use_pool=use_pool, thread_sensitive=thread_sensitive
+            )(content)
+        else:
+            response.content = content
+            retval = response
+    return retval
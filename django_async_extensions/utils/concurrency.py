@@ -0,0 +1,36 @@
+import asyncio
+import inspect
+
+
+async def agather(*aws, limit=None):
+    """
+    Like asyncio.gather(), but run at most ``limit`` of the awaitables at the
+    same time (all of them if ``limit`` is None).
+
+    If one of them raises, the others are cancelled and the exception is
+    raised.
+    """
+    if not aws:
+        return []
+    if limit is not None and limit < 1:
+        raise ValueError("limit must be a positive integer or None.")
+    semaphore = asyncio.Semaphore(limit or len(aws))
+
+    async def run(aw):
+        async with semaphore:
+            return await aw
+
+    tasks = [asyncio.ensure_future(run(aw)) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        # Close the coroutines whose task was cancelled before awaiting them.
+        for aw in aws:
+            if (
+                inspect.iscoroutine(aw)
+                and inspect.getcoroutinestate(aw) == inspect.CORO_CREATED
+            ):
+                aw.close()
+        raise
@@ -1,6 +1,11 @@
 from functools import wraps
 
-from asgiref.sync import async_to_sync, iscoroutinefunction, sync_to_async
+from asgiref.sync import async_to_sync, iscoroutinefunction
+
+from django.template.response import SimpleTemplateResponse
+
+from django_async_extensions.middleware.base import get_async_hooks
+from django_async_extensions.template.response import arender_response
 
 
 def decorator_from_middleware_with_args(middleware_class):
@@ -33,58 +38,72 @@ def make_middleware_decorator(middleware_class):
         def _decorator(view_func):
             middleware = middleware_class(view_func, *m_args, **m_kwargs)
 
+            # Look the hooks up once rather than on every request.
+            hooks = getattr(middleware, "async_hooks", None)
+            if hooks is None:
+                hooks = get_async_hooks(middleware)
+            process_request = hooks["process_request"]
+            process_view = hooks["process_view"]
+            process_exception = hooks["process_exception"]
+            process_template_response = hooks["process_template_response"]
+            process_response = hooks["process_response"]
+            # Render the template responses of async views before awaiting
+            # process_response, rather than in a post-render callback.
+            async_render = getattr(middleware, "async_render", False)
+
             async def _pre_process_request(request, *args, **kwargs):
-                if hasattr(middleware, "process_request"):
-                    result = await middleware.process_request(request)
+                if process_request is not None:
+                    result = await process_request(request)
                     if result is not None:
                         return result
-                if hasattr(middleware, "process_view"):
-                    if iscoroutinefunction(middleware.process_view):
-                        result = await middleware.process_view(
-                            request, view_func, args, kwargs
-                        )
-                    else:
-                        result = await sync_to_async(middleware.process_view)(
-                            request, view_func, args, kwargs
-                        )
+                if process_view is not None:
+                    result = await process_view(request, view_func, args, kwargs)
                     if result is not None:
                         return result
                 return None
 
             async def _process_exception(request, exception):
-                if hasattr(middleware, "process_exception"):
-                    if iscoroutinefunction(middleware.process_exception):
-                        result = await middleware.process_exception(request, exception)
-                    else:
-                        result = await sync_to_async(middleware.process_exception)(
-                            request, exception
-                        )
+                if process_exception is not None:
+                    result = await process_exception(request, exception)
                     if result is not None:
                         return result
                 raise
 
-            async def _post_process_request(request, response):
+            async def _post_process_request(request, response, render=False):
                 if hasattr(response, "render") and callable(response.render):
-                    if hasattr(middleware, "process_template_response"):
-                        if iscoroutinefunction(middleware.process_template_response):
-                            response = await middleware.process_template_response(
-                                request, response
-                            )
-                        else:
-                            response = await sync_to_async(
-                                middleware.process_template_response
-                            )(request, response)
+                    if process_template_response is not None:
+                        response = await process_template_response(request, response)
+                    if (
+                        render
+                        and async_render
+                        and process_response is not None
+                        and isinstance(response, SimpleTemplateResponse)
+                    ):
+                        # Render the template now, so process_response runs on
+                        # this event loop. The render stays on the sync thread,
+                        # the template may query the database.
+                        response = await arender_response(
+                            response, use_pool=False, thread_sensitive=True
+                        )
+                        return await process_response(request, response)
+                    if process_response is not None and getattr(
+                        response, "is_rendered", False
+                    ):
+                        # Already rendered (e.g. by a view with async_render),
+                        # add_post_render_callback() would run the callback
+                        # right away, on this event loop.
+                        return await process_response(request, response)
                     # Defer running of process_response until after the template
                     # has been rendered:
-                    if hasattr(middleware, "process_response"):
+                    if process_response is not None:
 
                         async def callback(response):
-                            return await middleware.process_response(request, response)
+                            return await process_response(request, response)
 
                         response.add_post_render_callback(async_to_sync(callback))
                 else:
-                    if hasattr(middleware, "process_response"):
-                        return await middleware.process_response(request, response)
+                    if process_response is not None:
+                        return await process_response(request, response)
                 return response
 
             if iscoroutinefunction(view_func):
@@ -101,7 +120,7 @@ def make_middleware_decorator(middleware_class):
                         if result is not None:
                             return result
 
-                    return await _post_process_request(request, response)
+                    return await _post_process_request(request, response, render=True)
 
             else:
 
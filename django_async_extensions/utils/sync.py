@@ -0,0 +1,213 @@
+"""
+A sync_to_async() that can record the thread hops made by the package.
+
+Inside `record_hops()`, every call of a function wrapped with
+`sync_to_async()` is recorded with the time it waited to be picked up by a
+thread (the single sync thread if it's thread sensitive, where the calls
+of concurrent requests queue up) and the time it ran.
+
+With ``ASYNC_EXTENSIONS_SYNC_POOL``, the calls that don't use the database
+run in a dedicated thread pool instead, see `pooled_sync_to_async()`.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from asgiref.sync import sync_to_async as asgiref_sync_to_async
+
+from django.conf import settings
+
+_recorder = ContextVar("async_extensions_hop_recorder", default=None)
+
+
+class Hop:
+    """A call of a sync function from async code, the times are in seconds."""
+
+    __slots__ = ("name", "thread_sensitive", "wait", "run")
+
+    def __init__(self, name, thread_sensitive, wait, run):
+        self.name = name
+        self.thread_sensitive = thread_sensitive
+        self.wait = wait
+        self.run = run
+
+    def __repr__(self):
+        return "<Hop %s thread_sensitive=%s wait=%.6f run=%.6f>" % (
+            self.name,
+            self.thread_sensitive,
+            self.wait,
+            self.run,
+        )
+
+
+class HopRecorder:
+    """The hops recorded by `record_hops()`."""
+
+    def __init__(self):
+        self.hops = []
+
+    def __len__(self):
+        return len(self.hops)
+
+    @property
+    def thread_sensitive_count(self):
+        return sum(hop.thread_sensitive for hop in self.hops)
+
+    @property
+    def wait(self):
+        return sum(hop.wait for hop in self.hops)
+
+    @property
+    def run(self):
+        return sum(hop.run for hop in self.hops)
+
+
+@contextmanager
+def record_hops():
+    """Record the hops made in the current context, yield a `HopRecorder`."""
+    recorder = HopRecorder()
+    token = _recorder.set(recorder)
+    try:
+        yield recorder
+    finally:
+        _recorder.reset(token)
+
+
+def get_hop_recorder():
+    """Return the `HopRecorder` of the current context, or ``None``."""
+    return _recorder.get()
+
+
+def sync_to_async(func, *, thread_sensitive=True, executor=None):
+    """
+    Like asgiref's sync_to_async(), and record the call when the hops are
+    recorded, see `record_hops()`.
+    """
+    async_func = asgiref_sync_to_async(
+        func, thread_sensitive=thread_sensitive, executor=executor
+    )
+    name = getattr(func, "__qualname__", None) or repr(func)
+
+    @wraps(func, updated=())
+    async def wrapper(*args, **kwargs):
+        recorder = _recorder.get()
+        if recorder is None:
+            return await async_func(*args, **kwargs)
+
+        started = finished = None
+
+        def timed(*args, **kwargs):
+            nonlocal started, finished
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                finished = time.perf_counter()
+
+        submitted = time.perf_counter()
+        try:
+            return await asgiref_sync_to_async(
+                timed, thread_sensitive=thread_sensitive, executor=executor
+            )(*args, **kwargs)
+        finally:
+            if started is not None:
+                recorder.hops.append(
+                    Hop(name, thread_sensitive, started - submitted, finished - started)
+                )
+
+    return wrapper
+
+
+class SyncPoolExecutor(ThreadPoolExecutor):
+    """A ThreadPoolExecutor keeping track of its queue, see `stats()`."""
+
+    def __init__(self, max_workers=None):
+        super().__init__(max_workers, thread_name_prefix="async_extensions_sync")
+        self._stats_lock = threading.Lock()
+        self.queued = 0
+        self.max_queued = 0
+        self.running = 0
+        self.completed = 0
+
+    def submit(self, fn, /, *args, **kwargs):
+        def run():
+            with self._stats_lock:
+                self.queued -= 1
+                self.running += 1
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                with self._stats_lock:
+                    self.running -= 1
+                    self.completed += 1
+
+        with self._stats_lock:
+            self.queued += 1
+            self.max_queued = max(self.max_queued, self.queued)
+        try:
+            return super().submit(run)
+        except BaseException:
+            with self._stats_lock:
+                self.queued -= 1
+            raise
+
+    def stats(self):
+        """
+        Return the number of threads, of calls waiting for a thread (the
+        queue depth) and its maximum so far, of running and of completed
+        calls.
+        """
+        with self._stats_lock:
+            return {
+                "max_workers": self._max_workers,
+                "queued": self.queued,
+                "max_queued": self.max_queued,
+                "running": self.running,
+                "completed": self.completed,
+            }
+
+
+_sync_pool = None
+_sync_pool_size = None
+_sync_pool_lock = threading.Lock()
+
+
+def get_sync_pool():
+    """
+    Return the SyncPoolExecutor of ``ASYNC_EXTENSIONS_SYNC_POOL_SIZE``
+    threads (ThreadPoolExecutor's default if None), created on first use.
+    """
+    global _sync_pool, _sync_pool_size
+    size = getattr(settings, "ASYNC_EXTENSIONS_SYNC_POOL_SIZE", None)
+    with _sync_pool_lock:
+        if _sync_pool is None or _sync_pool_size != size:
+            if _sync_pool is not None:
+                _sync_pool.shutdown(wait=False)
+            _sync_pool = SyncPoolExecutor(size)
+            _sync_pool_size = size
+        return _sync_pool
+
+
+def use_sync_pool(override=None):
+    """
+    Return whether to use the sync pool: ``override`` if it isn't None, the
+    ``ASYNC_EXTENSIONS_SYNC_POOL`` setting otherwise.
+    """
+    if override is not None:
+        return override
+    return getattr(settings, "ASYNC_EXTENSIONS_SYNC_POOL", False)
+
+
+def pooled_sync_to_async(func, *, use_pool=None, thread_sensitive=True):
+    """
+    sync_to_async() for functions that don't use the database, like template
+    rendering. They run in the sync pool if `use_sync_pool(use_pool)`, so
+    they don't queue up on the single thread of the thread sensitive calls.
+    """
+    if use_sync_pool(use_pool):
+        return sync_to_async(func, thread_sensitive=False, executor=get_sync_pool())
+    return sync_to_async(func, thread_sensitive=thread_sensitive)
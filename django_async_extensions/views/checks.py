@@ -0,0 +1,62 @@
+from asgiref.sync import iscoroutinefunction
+
+from django.conf import settings
+from django.core import checks
+from django.core.exceptions import ImproperlyConfigured
+from django.urls import URLResolver, get_resolver
+
+from django_async_extensions.views.generic.base import AsyncView
+
+
+def _iter_url_callbacks(patterns, prefix=""):
+    """Yield a ``(route, callback)`` pair for each view in the URL patterns."""
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            yield from _iter_url_callbacks(
+                pattern.url_patterns, prefix + str(pattern.pattern)
+            )
+        else:
+            yield prefix + str(pattern.pattern), pattern.callback
+
+
+def check_async_views(app_configs=None, urlconf=None, **kwargs):
+    """
+    Check that all the AsyncView subclasses in the URLconf can be served
+    asynchronously: their HTTP handlers are all async, and the view isn't
+    wrapped in a sync decorator.
+    """
+    if urlconf is None and not getattr(settings, "ROOT_URLCONF", None):
+        # Like django's check_url_config(), e.g. for worker-only settings.
+        return []
+    errors = []
+    checked = set()
+    resolver = get_resolver(urlconf)
+    for route, callback in _iter_url_callbacks(resolver.url_patterns):
+        view_class = getattr(callback, "view_class", None)
+        if not isinstance(view_class, type) or not issubclass(view_class, AsyncView):
+            continue
+        if view_class not in checked:
+            checked.add(view_class)
+            try:
+                view_class._get_dispatch_table()
+            except ImproperlyConfigured as e:
+                errors.append(
+                    checks.Error(
+                        str(e),
+                        hint="Make all the HTTP handlers of the view async.",
+                        obj=view_class,
+                        id="django_async_extensions.E001",
+                    )
+                )
+        if not iscoroutinefunction(callback):
+            errors.append(
+                checks.Error(
+                    f"The view of {view_class.__qualname__} for the route "
+                    f"'{route}' is not a coroutine function.",
+                    hint="The view is probably wrapped in a decorator that "
+                    "doesn't support async views.",
+                    obj=view_class,
+                    id="django_async_extensions.E002",
+                )
+            )
+    return errors
@@ -19,9 +19,12 @@ from django_async_extensions.views.generic.edit import (
     AsyncFormView,
     AsyncUpdateView,
 )
+from django_async_extensions.views.generic.json_views import (
+    AsyncJSONDetailView,
+    AsyncJSONListView,
+)
 from django_async_extensions.views.generic.list import AsyncListView
 
-
 __all__ = [
     "AsyncView",
     "AsyncTemplateView",
@@ -39,4 +42,6 @@ __all__ = [
     "AsyncDeleteView",
     "AsyncListView",
     "AsyncUpdateView",
+    "AsyncJSONListView",
+    "AsyncJSONDetailView",
 ]
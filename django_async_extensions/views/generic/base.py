@@ -1,18 +1,28 @@
+import datetime
 import logging
+from calendar import timegm
+from inspect import isawaitable
+from types import MappingProxyType
 
-from asgiref.sync import iscoroutinefunction, markcoroutinefunction, sync_to_async
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
 
 from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpResponse, HttpResponseNotAllowed
 
+from django.utils.cache import get_conditional_response
 from django.utils.decorators import classonlymethod
 from django.utils.functional import classproperty
+from django.utils.http import http_date, quote_etag
 from django.views.generic.base import (
     View,
     TemplateResponseMixin,
     RedirectView,
 )
 
+from django_async_extensions.template.response import arender_response
+from django_async_extensions.utils.concurrency import agather
+from django_async_extensions.utils.sync import pooled_sync_to_async
+
 logger = logging.getLogger("django.request")
 
 
@@ -23,17 +33,126 @@ class AsyncContextMixin:
     """
 
     extra_context = None
+    # A mapping of context names to async functions called with the view,
+    # e.g. {"author_count": lambda view: Author.objects.acount()}.
+    context_providers = None
+    # The maximum number of awaitables resolved at the same time.
+    context_concurrency = None
 
     async def get_context_data(self, **kwargs):
         kwargs.setdefault("view", self)
         if self.extra_context is not None:
             kwargs.update(self.extra_context)
-        return kwargs
+        for name, provider in (self.context_providers or {}).items():
+            if name not in kwargs:
+                kwargs[name] = provider(self)
+        return await self.aresolve_context(kwargs)
+
+    async def aresolve_context(self, context):
+        """
+        Replace the awaitables in the values of ``context`` by their results,
+        awaiting them concurrently.
+        """
+        names = [name for name, value in context.items() if isawaitable(value)]
+        if names:
+            results = await agather(
+                *(context[name] for name in names), limit=self.context_concurrency
+            )
+            context.update(zip(names, results))
+        return context
+
+
+class AsyncConditionalMixin:
+    """
+    Answer the conditional GET and HEAD requests (If-None-Match and
+    If-Modified-Since) with a 304 Not Modified response, from the ETag and
+    the last modification date of the view, before fetching any object.
+    """
+
+    async def aget_etag(self):
+        """Return the ETag of the response, or ``None``."""
+        return None
+
+    async def aget_last_modified(self):
+        """
+        Return the last modification datetime (or date) of the response, or
+        ``None``.
+        """
+        return None
+
+    async def aget_conditional_response(self, request):
+        """
+        Return a 304 Not Modified response if the resource wasn't modified
+        since the client fetched it, otherwise ``None``.
+        """
+        etag = await self.aget_etag()
+        if etag is not None:
+            etag = quote_etag(etag)
+        last_modified = await self.aget_last_modified()
+        if isinstance(last_modified, datetime.datetime):
+            last_modified = timegm(last_modified.utctimetuple())
+        elif last_modified is not None:
+            last_modified = timegm(last_modified.timetuple())
+        self._validators = (etag, last_modified)
+        if etag is None and last_modified is None:
+            return None
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is not None:
+            self.set_validator_headers(response)
+        return response
+
+    def set_validator_headers(self, response):
+        """Set the ETag and Last-Modified headers of the response."""
+        etag, last_modified = getattr(self, "_validators", (None, None))
+        if last_modified is not None and not response.has_header("Last-Modified"):
+            response.headers["Last-Modified"] = http_date(last_modified)
+        if etag is not None:
+            response.headers.setdefault("ETag", etag)
+        return response
 
 
-class AsyncView(View):
+def _reset_handler_caches(cls):
+    """Reset the handlers cached on ``cls`` and on all its subclasses."""
+    classes = [cls]
+    while classes:
+        klass = classes.pop()
+        if "_dispatch_table" in klass.__dict__:
+            type.__setattr__(klass, "_dispatch_table", (None, None))
+        if "_view_is_async" in klass.__dict__:
+            type.__delattr__(klass, "_view_is_async")
+        classes.extend(type.__subclasses__(klass))
+
+
+class AsyncViewType(type):
+    """
+    Metaclass of AsyncView, resets the handlers cached on a view class and its
+    subclasses when one of the class attributes is set or deleted.
+    """
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        if name not in ("_dispatch_table", "_view_is_async"):
+            _reset_handler_caches(cls)
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        _reset_handler_caches(cls)
+
+
+class AsyncView(View, metaclass=AsyncViewType):
     @classproperty
     def view_is_async(cls):
+        # Cached per class, until an attribute of the class is changed.
+        is_async = cls.__dict__.get("_view_is_async")
+        if is_async is None:
+            is_async = cls._get_view_is_async()
+            cls._view_is_async = is_async
+        return is_async
+
+    @classmethod
+    def _get_view_is_async(cls):
         handlers = [
             getattr(cls, method)
             for method in cls.http_method_names
@@ -63,6 +182,9 @@ class AsyncView(View):
                     f"only accepts arguments that are already "
                     f"attributes of the class."
                 )
+        # Build the handlers table now, so sync handlers are reported when the
+        # URLconf is loaded rather than on the first request.
+        cls._get_dispatch_table()
 
         async def view(request, *args, **kwargs):
             self = cls(**initkwargs)
@@ -92,17 +214,70 @@ class AsyncView(View):
 
         return view
 
+    # The (class, table) pair of the last class the table was built for, the
+    # class is checked so subclasses don't use the table of their parent.
+    _dispatch_table = (None, None)
+
+    @classmethod
+    def _get_dispatch_table(cls):
+        """
+        Return a read-only mapping of the HTTP methods the view accepts to a
+        ``(name, function)`` pair, where ``function`` is the unbound handler
+        of the method, or ``None`` if the view doesn't implement it.
+
+        The table is built once per class and stored on it.
+        """
+        owner, table = cls._dispatch_table
+        if owner is not cls:
+            table = cls._build_dispatch_table()
+            cls._dispatch_table = (cls, table)
+        return table
+
+    @classmethod
+    def _build_dispatch_table(cls):
+        table = {}
+        for name in cls.http_method_names:
+            function = getattr(cls, name, None)
+            if function is None and name == "head":
+                # setup() makes HEAD requests use get() when there's no head().
+                function = getattr(cls, "get", None)
+            if function is not None and not iscoroutinefunction(function):
+                raise ImproperlyConfigured(
+                    f"{cls.__qualname__} HTTP handlers must all be async."
+                )
+            table[name.upper()] = (name, function)
+        return MappingProxyType(table)
+
     async def dispatch(self, request, *args, **kwargs):
         # Try to dispatch to the right method; if a method doesn't exist,
         # defer to the error handler. Also defer to the error handler if the
         # request method isn't on the approved list.
-        if request.method.lower() in self.http_method_names:
-            handler = getattr(
-                self, request.method.lower(), self.http_method_not_allowed
-            )
-        else:
-            handler = self.http_method_not_allowed
-        return await handler(request, *args, **kwargs)
+        if "http_method_names" in self.__dict__:
+            # Set on the instance (e.g. by as_view()), the table of the class
+            # doesn't apply.
+            method = request.method.lower()
+            if method in self.http_method_names:
+                handler = getattr(self, method, self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            return await handler(request, *args, **kwargs)
+        owner, table = self._dispatch_table
+        if owner is not self.__class__:
+            table = self._get_dispatch_table()
+        try:
+            name, function = table[request.method]
+        except KeyError:
+            try:
+                name, function = table[request.method.upper()]
+            except KeyError:
+                return await self.http_method_not_allowed(request, *args, **kwargs)
+        # Handlers set on the instance (e.g. head() by setup()) take precedence.
+        handler = self.__dict__.get(name)
+        if handler is not None:
+            return await handler(request, *args, **kwargs)
+        if function is None:
+            return await self.http_method_not_allowed(request, *args, **kwargs)
+        return await function(self, request, *args, **kwargs)
 
     async def http_method_not_allowed(self, request, *args, **kwargs):
         logger.warning(
@@ -125,6 +300,13 @@ class AsyncView(View):
 
 
 class AsyncTemplateResponseMixin(TemplateResponseMixin):
+    # Render the template in render_to_response() without blocking the event
+    # loop, see arender_response().
+    async_render = False
+    # Instantiate and render the templates in the sync pool (True), on the
+    # sync thread (False) or according to ASYNC_EXTENSIONS_SYNC_POOL (None).
+    use_sync_pool = None
+
     async def render_to_response(self, context, **response_kwargs):
         """
         Return a response, using the `response_class` for this view, with a
@@ -133,13 +315,24 @@ class AsyncTemplateResponseMixin(TemplateResponseMixin):
         Pass response_kwargs to the constructor of the response class.
         """
         response_kwargs.setdefault("content_type", self.content_type)
-        return await sync_to_async(self.response_class)(
+        if not self.async_render:
+            return await pooled_sync_to_async(
+                self.response_class, use_pool=self.use_sync_pool
+            )(
+                request=self.request,
+                template=self.get_template_names(),
+                context=context,
+                using=self.template_engine,
+                **response_kwargs,
+            )
+        response = self.response_class(
             request=self.request,
             template=self.get_template_names(),
             context=context,
             using=self.template_engine,
             **response_kwargs,
         )
+        return await arender_response(response, use_pool=self.use_sync_pool)
 
 
 class AsyncTemplateView(AsyncTemplateResponseMixin, AsyncContextMixin, AsyncView):
@@ -23,6 +23,7 @@ from django_async_extensions.views.generic.detail import (
 from django_async_extensions.views.generic.list import (
     AsyncMultipleObjectMixin,
     AsyncMultipleObjectTemplateResponseMixin,
+    _ais_empty,
 )
 
 
@@ -121,13 +122,14 @@ class AsyncBaseDateListView(AsyncMultipleObjectMixin, AsyncDateMixin, AsyncView)
             qs = qs.filter(**{"%s__lte" % date_field: now})
 
         if not allow_empty:
-            # When pagination is enabled, it's better to do a cheap query
-            # than to load the unpaginated queryset in memory.
-            is_empty = (
-                not [i async for i in qs]
-                if paginate_by is None
-                else not await qs.aexists()
-            )
+            # When the objects are rendered from this queryset, fetch them:
+            # they're cached on it and not queried again. Otherwise (when
+            # pagination is enabled or the objects aren't listed), it's better
+            # to do a cheap query than to load the queryset in memory.
+            if paginate_by is None and self._lists_dated_objects():
+                is_empty = await _ais_empty(qs)
+            else:
+                is_empty = not await qs.aexists()
             if is_empty:
                 raise Http404(
                     _("No %(verbose_name_plural)s available")
@@ -138,6 +140,13 @@ class AsyncBaseDateListView(AsyncMultipleObjectMixin, AsyncDateMixin, AsyncView)
 
         return qs
 
+    def _lists_dated_objects(self):
+        """
+        Return whether the queryset of get_dated_queryset() is rendered as
+        the object list.
+        """
+        return True
+
     def get_date_list_period(self):
         """
         Get the aggregation period for the list of dates: 'year', 'month', or
@@ -245,6 +254,9 @@ class AsyncBaseYearArchiveView(AsyncYearMixin, AsyncBaseDateListView):
         """
         return self.make_object_list
 
+    def _lists_dated_objects(self):
+        return self.get_make_object_list()
+
 
 class AsyncYearArchiveView(
     AsyncMultipleObjectTemplateResponseMixin, AsyncBaseYearArchiveView
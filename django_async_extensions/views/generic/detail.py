@@ -5,6 +5,7 @@ from django.utils.translation import gettext as _
 
 from django_async_extensions.views.generic.base import (
     AsyncView,
+    AsyncConditionalMixin,
     AsyncContextMixin,
     AsyncTemplateResponseMixin,
 )
@@ -22,6 +23,10 @@ class AsyncSingleObjectMixin(AsyncContextMixin):
     slug_url_kwarg = "slug"
     pk_url_kwarg = "pk"
     query_pk_and_slug = False
+    # An ObjectCache used by get_object() on GET and HEAD requests.
+    object_cache = None
+    # A datetime field of the model answering conditional requests.
+    last_modified_field = None
 
     async def get_object(self, queryset=None):
         """
@@ -34,7 +39,20 @@ class AsyncSingleObjectMixin(AsyncContextMixin):
         # like DateDetailView
         if queryset is None:
             queryset = await self.get_queryset()
+        queryset = self._filter_object_queryset(queryset)
 
+        try:
+            # Get the single item from the filtered queryset
+            obj = await self.aget_single_object(queryset)
+        except queryset.model.DoesNotExist:
+            raise Http404(
+                _("No %(verbose_name)s found matching the query")
+                % {"verbose_name": queryset.model._meta.verbose_name}
+            )
+        return obj
+
+    def _filter_object_queryset(self, queryset):
+        """Filter the queryset by the pk or the slug of the URLconf."""
         # Next, try looking up by primary key.
         pk = self.kwargs.get(self.pk_url_kwarg)
         slug = self.kwargs.get(self.slug_url_kwarg)
@@ -52,16 +70,38 @@ class AsyncSingleObjectMixin(AsyncContextMixin):
                 "Generic detail view %s must be called with either an object "
                 "pk or a slug in the URLconf." % self.__class__.__name__
             )
+        return queryset
 
+    async def aget_last_modified(self):
+        """
+        Return the value of ``last_modified_field`` of the object, fetched
+        without loading the object, or ``None``.
+        """
+        if self.last_modified_field is None:
+            return None
+        queryset = self._filter_object_queryset(await self.get_queryset())
         try:
-            # Get the single item from the filtered queryset
-            obj = await queryset.aget()
+            return await queryset.values_list(
+                self.last_modified_field, flat=True
+            ).aget()
         except queryset.model.DoesNotExist:
-            raise Http404(
-                _("No %(verbose_name)s found matching the query")
-                % {"verbose_name": queryset.model._meta.verbose_name}
-            )
-        return obj
+            # get_object() raises the 404.
+            return None
+
+    async def aget_single_object(self, queryset):
+        """
+        Return the single object of the filtered queryset, from the object
+        cache for the requests with a safe method.
+        """
+        object_cache = self.get_object_cache()
+        request = getattr(self, "request", None)
+        if object_cache is not None and request and request.method in ("GET", "HEAD"):
+            return await object_cache.aget(queryset)
+        return await queryset.aget()
+
+    def get_object_cache(self):
+        """Return the ObjectCache of the view, or ``None`` to not cache."""
+        return self.object_cache
 
     async def get_queryset(self):
         """
@@ -108,7 +148,7 @@ class AsyncSingleObjectMixin(AsyncContextMixin):
         return await super().get_context_data(**context)
 
 
-class AsyncBaseDetailView(AsyncSingleObjectMixin, AsyncView):
+class AsyncBaseDetailView(AsyncSingleObjectMixin, AsyncConditionalMixin, AsyncView):
     """
     Base view for displaying a single object.
 
@@ -116,9 +156,12 @@ class AsyncBaseDetailView(AsyncSingleObjectMixin, AsyncView):
     """
 
     async def get(self, request, *args, **kwargs):
+        response = await self.aget_conditional_response(request)
+        if response is not None:
+            return response
         self.object = await self.get_object()
         context = await self.get_context_data(object=self.object)
-        return await self.render_to_response(context)
+        return self.set_validator_headers(await self.render_to_response(context))
 
 
 class AsyncSingleObjectTemplateResponseMixin(AsyncTemplateResponseMixin):
@@ -1,10 +1,10 @@
-from asgiref.sync import sync_to_async
 from django.core.exceptions import ImproperlyConfigured, SynchronousOnlyOperation
 from django.forms import Form
 from django.forms import models as model_forms
 from django.http import HttpResponseRedirect
 
 from django_async_extensions.forms.models import AsyncModelForm
+from django_async_extensions.utils.sync import sync_to_async
 from django_async_extensions.views.generic.base import (
     AsyncView,
     AsyncContextMixin,
@@ -0,0 +1,102 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import QuerySet
+from django.db.models.query import ModelIterable
+from django.http import HttpResponse, StreamingHttpResponse
+
+from django_async_extensions.core.paginator import AsyncCursorPage, _abatch
+from django_async_extensions.views.generic.detail import AsyncBaseDetailView
+from django_async_extensions.views.generic.list import (
+    AsyncBaseListView,
+    _aiter_objects,
+)
+
+
+class AsyncJSONResponseMixin:
+    """
+    A mixin that responds with the objects of the view encoded as JSON,
+    fetched with ``values()`` instead of as model instances.
+    """
+
+    # The fields given to values(), all the concrete fields if None.
+    json_fields = None
+    json_encoder = DjangoJSONEncoder
+    json_dumps_params = None
+    content_type = "application/json"
+
+    def get_json_fields(self):
+        """Return the fields of the objects to include in the JSON."""
+        return self.json_fields or ()
+
+    def encode_json(self, data):
+        """
+        Return ``data`` encoded as a JSON string. Override to use another JSON
+        library.
+        """
+        return json.dumps(data, cls=self.json_encoder, **(self.json_dumps_params or {}))
+
+    async def get_queryset(self):
+        queryset = await super().get_queryset()
+        if isinstance(queryset, QuerySet) and queryset._iterable_class is ModelIterable:
+            queryset = queryset.values(*self.get_json_fields())
+        return queryset
+
+
+class AsyncJSONListView(AsyncJSONResponseMixin, AsyncBaseListView):
+    """
+    Stream a list of objects, set by `self.model` or `self.queryset`, as a
+    JSON object with the objects in "objects" and the pagination data, if
+    the view is paginated, in "pagination".
+    """
+
+    stream_chunk_size = 100
+
+    async def render_to_response(self, context, **response_kwargs):
+        response_kwargs.setdefault("content_type", self.content_type)
+        return StreamingHttpResponse(self.astream_json(context), **response_kwargs)
+
+    async def get_pagination_data(self, context):
+        """Return the pagination data of the response, ``None`` if not paginated."""
+        page = context["page_obj"]
+        if page is None:
+            return None
+        if isinstance(page, AsyncCursorPage):
+            return {
+                "next_cursor": page.next_cursor,
+                "previous_cursor": page.previous_cursor,
+            }
+        return {
+            "number": page.number,
+            "count": await page.paginator.acount(),
+            "num_pages": await page.paginator.anum_pages(),
+            "has_next": await page.ahas_next(),
+            "has_previous": await page.ahas_previous(),
+        }
+
+    async def astream_json(self, context):
+        """
+        Yield the JSON of the response, the objects being encoded in chunks of
+        ``stream_chunk_size`` objects as they're fetched.
+        """
+        yield '{"objects": ['
+        separator = ""
+        objects = _aiter_objects(context["object_list"], self.stream_chunk_size)
+        async for chunk in _abatch(objects, self.stream_chunk_size):
+            yield separator + ", ".join(self.encode_json(obj) for obj in chunk)
+            separator = ", "
+        yield "]"
+        pagination = await self.get_pagination_data(context)
+        if pagination is not None:
+            yield ', "pagination": ' + self.encode_json(pagination)
+        yield "}"
+
+
+class AsyncJSONDetailView(AsyncJSONResponseMixin, AsyncBaseDetailView):
+    """
+    Render the object of the view, fetched by `self.get_object()`, as JSON.
+    """
+
+    async def render_to_response(self, context, **response_kwargs):
+        response_kwargs.setdefault("content_type", self.content_type)
+        return HttpResponse(self.encode_json(self.object), **response_kwargs)
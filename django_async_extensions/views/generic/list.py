@@ -1,12 +1,21 @@
+import os
+
 from django.core.exceptions import ImproperlyConfigured
 from django.core.paginator import InvalidPage
 from django.db.models import QuerySet
-from django.http import Http404
+from django.http import Http404, StreamingHttpResponse
+from django.template import loader
 from django.utils.translation import gettext as _
 
-from django_async_extensions.core.paginator import AsyncPaginator
+from django_async_extensions.core.paginator import (
+    AsyncCursorPaginator,
+    AsyncPaginator,
+    _abatch,
+)
+from django_async_extensions.utils.sync import pooled_sync_to_async
 from django_async_extensions.views.generic.base import (
     AsyncView,
+    AsyncConditionalMixin,
     AsyncContextMixin,
     AsyncTemplateResponseMixin,
 )
@@ -20,9 +29,13 @@ class AsyncMultipleObjectMixin(AsyncContextMixin):
     model = None
     paginate_by = None
     paginate_orphans = 0
+    paginate_count_strategy = None
+    paginate_fetch_mode = None
+    paginate_prefetcher = None
     context_object_name = None
     paginator_class = AsyncPaginator
     page_kwarg = "page"
+    cursor_kwarg = "cursor"
     ordering = None
 
     async def get_queryset(self):
@@ -58,12 +71,25 @@ class AsyncMultipleObjectMixin(AsyncContextMixin):
 
     async def paginate_queryset(self, queryset, page_size):
         """Paginate the queryset, if needed."""
+        paginator_kwargs = {}
+        count_strategy = self.get_paginate_count_strategy()
+        if count_strategy is not None:
+            paginator_kwargs["count_strategy"] = count_strategy
+        fetch_mode = self.get_paginate_fetch_mode()
+        if fetch_mode is not None:
+            paginator_kwargs["fetch_mode"] = fetch_mode
+        prefetcher = self.get_paginate_prefetcher()
+        if prefetcher is not None:
+            paginator_kwargs["prefetcher"] = prefetcher
         paginator = self.get_paginator(
             queryset,
             page_size,
             orphans=self.get_paginate_orphans(),
             allow_empty_first_page=self.get_allow_empty(),
+            **paginator_kwargs,
         )
+        if isinstance(paginator, AsyncCursorPaginator):
+            return await self.paginate_queryset_by_cursor(paginator)
         page_kwargs = self.page_kwarg
         page = self.kwargs.get(page_kwargs) or self.request.GET.get(page_kwargs) or 1
         try:
@@ -84,6 +110,17 @@ class AsyncMultipleObjectMixin(AsyncContextMixin):
                 % {"page_number": page_number, "message": str(e)}
             )
 
+    async def paginate_queryset_by_cursor(self, paginator):
+        """Paginate the queryset using the cursor given in the request."""
+        cursor = self.kwargs.get(self.cursor_kwarg) or self.request.GET.get(
+            self.cursor_kwarg
+        )
+        try:
+            page = await paginator.apage(cursor)
+            return paginator, page, page.object_list, await page.ahas_other_pages()
+        except InvalidPage as e:
+            raise Http404(_("Invalid cursor: %(message)s") % {"message": str(e)})
+
     def get_paginate_by(self, queryset):
         """
         Get the number of items to paginate by, or ``None`` for no pagination.
@@ -109,6 +146,27 @@ class AsyncMultipleObjectMixin(AsyncContextMixin):
         """
         return self.paginate_orphans
 
+    def get_paginate_count_strategy(self):
+        """
+        Return the strategy the paginator uses to count the objects, or
+        ``None`` to use the paginator's default.
+        """
+        return self.paginate_count_strategy
+
+    def get_paginate_fetch_mode(self):
+        """
+        Return how the paginator fetches the page, or ``None`` to use the
+        paginator's default.
+        """
+        return self.paginate_fetch_mode
+
+    def get_paginate_prefetcher(self):
+        """
+        Return the `PagePrefetcher` used to prefetch the next page, or ``None``
+        to not prefetch it.
+        """
+        return self.paginate_prefetcher
+
     def get_allow_empty(self):
         """
         Return ``True`` if the view should display empty lists and ``False``
@@ -153,7 +211,20 @@ class AsyncMultipleObjectMixin(AsyncContextMixin):
         return await super().get_context_data(**context)
 
 
-class AsyncBaseListView(AsyncMultipleObjectMixin, AsyncView):
+async def _ais_empty(object_list):
+    """
+    Return whether ``object_list`` is empty. The rows of a queryset are
+    fetched and cached on it, so they're not queried again when it's
+    rendered.
+    """
+    if hasattr(object_list, "__aiter__"):
+        async for _obj in object_list:
+            return False
+        return True
+    return not object_list
+
+
+class AsyncBaseListView(AsyncMultipleObjectMixin, AsyncConditionalMixin, AsyncView):
     """
     Base view for displaying a list of objects.
 
@@ -161,6 +232,9 @@ class AsyncBaseListView(AsyncMultipleObjectMixin, AsyncView):
     """
 
     async def get(self, request, *args, **kwargs):
+        response = await self.aget_conditional_response(request)
+        if response is not None:
+            return response
         self.object_list = await self.get_queryset()
         allow_empty = self.get_allow_empty()
 
@@ -173,7 +247,7 @@ class AsyncBaseListView(AsyncMultipleObjectMixin, AsyncView):
             ):
                 is_empty = not await self.object_list.aexists()
             else:
-                is_empty = not [object async for object in self.object_list]
+                is_empty = await _ais_empty(self.object_list)
             if is_empty:
                 raise Http404(
                     _("Empty list and “%(class_name)s.allow_empty” is False.")
@@ -182,13 +256,78 @@ class AsyncBaseListView(AsyncMultipleObjectMixin, AsyncView):
                     }
                 )
         context = await self.get_context_data()
-        return await self.render_to_response(context)
+        return self.set_validator_headers(await self.render_to_response(context))
+
+
+async def _aiter_objects(object_list, chunk_size):
+    if isinstance(object_list, QuerySet) and object_list._result_cache is None:
+        async for obj in object_list.aiterator(chunk_size=chunk_size):
+            yield obj
+    elif hasattr(object_list, "__aiter__"):
+        async for obj in object_list:
+            yield obj
+    else:
+        for obj in object_list:
+            yield obj
 
 
 class AsyncMultipleObjectTemplateResponseMixin(AsyncTemplateResponseMixin):
     """Mixin for responding with a template and list of objects."""
 
     template_name_suffix = "_list"
+    # Stream the response: render the header template, then the row template
+    # for each object as they're fetched, then the footer template.
+    stream_response = False
+    stream_chunk_size = 100
+
+    async def render_to_response(self, context, **response_kwargs):
+        if not self.stream_response:
+            return await super().render_to_response(context, **response_kwargs)
+        response_kwargs.setdefault("content_type", self.content_type)
+        return StreamingHttpResponse(self.astream_content(context), **response_kwargs)
+
+    def get_stream_template_names(self, part):
+        """
+        Return the names of the template rendering the ``part`` ("header",
+        "row" or "footer") of a streamed response, e.g.
+        "app/author_list_row.html" for "app/author_list.html".
+        """
+        names = []
+        for name in self.get_template_names():
+            root, ext = os.path.splitext(name)
+            names.append("%s_%s%s" % (root, part, ext))
+        return names
+
+    async def astream_content(self, context):
+        """
+        Yield the content of a streamed response. The rows are rendered in
+        chunks of ``stream_chunk_size`` objects, with the object of each row
+        as ``object`` in the context.
+        """
+
+        def get_templates():
+            return [
+                loader.select_template(
+                    self.get_stream_template_names(part), using=self.template_engine
+                )
+                for part in ("header", "row", "footer")
+            ]
+
+        def to_async(func):
+            return pooled_sync_to_async(func, use_pool=self.use_sync_pool)
+
+        header, row, footer = await to_async(get_templates)()
+        yield await to_async(header.render)(context, self.request)
+
+        def render_rows(objects):
+            return "".join(
+                row.render({**context, "object": obj}, self.request) for obj in objects
+            )
+
+        objects = _aiter_objects(context["object_list"], self.stream_chunk_size)
+        async for chunk in _abatch(objects, self.stream_chunk_size):
+            yield await to_async(render_rows)(chunk)
+        yield await to_async(footer.render)(context, self.request)
 
     def get_template_names(self):
         """
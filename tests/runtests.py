@@ -22,6 +22,7 @@ ALWAYS_INSTALLED_APPS = [
     "django.contrib.messages",
     "django.contrib.admin.apps.SimpleAdminConfig",
     "django.contrib.staticfiles",
+    "django_async_extensions",
 ]
 
 ALWAYS_MIDDLEWARE = [
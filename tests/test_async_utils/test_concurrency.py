@@ -0,0 +1,62 @@
+import asyncio
+
+import pytest
+
+from django_async_extensions.utils.concurrency import agather
+
+
+async def test_agather():
+    async def double(x):
+        await asyncio.sleep(0)
+        return x * 2
+
+    assert await agather() == []
+    assert await agather(double(1), double(2), double(3)) == [2, 4, 6]
+
+
+async def test_agather_limit():
+    running = 0
+    max_running = 0
+
+    async def task():
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    await agather(*(task() for _ in range(6)), limit=2)
+    assert max_running == 2
+    await agather(*(task() for _ in range(6)))
+    assert max_running == 6
+
+
+async def test_agather_invalid_limit():
+    coroutine = asyncio.sleep(0)
+    with pytest.raises(ValueError, match="limit must be a positive integer or None."):
+        await agather(coroutine, limit=0)
+    coroutine.close()
+
+
+async def test_agather_error_cancels_others():
+    cancelled = asyncio.Event()
+
+    async def fail():
+        raise ValueError("failed")
+
+    async def slow():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    async def never_started():
+        pass
+
+    coroutine = never_started()
+    with pytest.raises(ValueError, match="failed"):
+        await agather(slow(), fail(), coroutine, limit=2)
+    await asyncio.sleep(0)
+    assert cancelled.is_set()
+    assert coroutine.cr_frame is None
@@ -1,3 +1,5 @@
+import asyncio
+
 from asgiref.sync import sync_to_async
 
 import pytest
@@ -9,6 +11,8 @@ from django.test import RequestFactory
 
 from django_async_extensions.middleware.base import AsyncMiddlewareMixin
 from django_async_extensions.utils.decorators import decorator_from_middleware
+from django_async_extensions.utils.sync import record_hops
+from django_async_extensions.views.generic import AsyncTemplateView
 
 
 class ProcessViewMiddleware(AsyncMiddlewareMixin):
@@ -195,3 +199,82 @@ class TestDecoratorFromMiddleware:
         assert getattr(request, "process_response_reached", False)
         # process_response saw the rendered content
         assert request.process_response_content == b"Hello world"
+
+    async def test_async_render_templateresponse(self, async_rf):
+        """
+        With async_render, the response of an async view is rendered on the
+        sync thread and process_response is awaited on the event loop.
+        """
+
+        class LoopMiddleware(AsyncMiddlewareMixin):
+            async_render = True
+
+            async def process_response(self, request, response):
+                request.process_response_loop = asyncio.get_running_loop()
+                request.process_response_content = response.content
+                return response
+
+        @decorator_from_middleware(LoopMiddleware)
+        async def template_response_view(request):
+            template = engines["django"].from_string("Hello world")
+            return TemplateResponse(request, template)
+
+        request = async_rf.get("/")
+        with record_hops() as recorder:
+            response = await template_response_view(request)
+        assert response._is_rendered is True
+        assert request.process_response_content == b"Hello world"
+        assert request.process_response_loop is asyncio.get_running_loop()
+        assert [hop.thread_sensitive for hop in recorder.hops] == [True]
+
+    async def test_async_render_over_default_decorator(self, async_rf):
+        """
+        The post-render callback of an inner decorator runs in the render
+        thread when an outer decorator renders the response.
+        """
+
+        class RenderMiddleware(AsyncMiddlewareMixin):
+            async_render = True
+
+            async def process_response(self, request, response):
+                request.outer_response_content = response.content
+                return response
+
+        @decorator_from_middleware(RenderMiddleware)
+        @full_dec
+        async def template_response_view(request):
+            template = engines["django"].from_string("Hello world")
+            return TemplateResponse(request, template)
+
+        request = async_rf.get("/")
+        response = await template_response_view(request)
+        assert response._is_rendered is True
+        assert request.process_response_content == b"Hello world"
+        assert request.outer_response_content == b"Hello world"
+
+    async def test_rendered_templateresponse_async(self, async_rf):
+        """
+        A template response already rendered by the view goes through
+        process_response on the event loop, not in a post-render callback.
+        """
+
+        class AboutView(AsyncTemplateView):
+            template_name = "test_generic_views/about.html"
+            async_render = True
+
+        view = full_dec(AboutView.as_view())
+        request = async_rf.get("/")
+        response = await view(request)
+        assert response._is_rendered is True
+        assert getattr(request, "process_template_response_reached", False)
+        assert request.process_response_content.startswith(b"<h1>About</h1>")
+
+    async def test_templateresponse_without_process_response_async(self, async_rf):
+        @process_view_dec
+        async def template_response_view(request):
+            template = engines["django"].from_string("Hello world")
+            return TemplateResponse(request, template)
+
+        response = await template_response_view(async_rf.get("/"))
+        # Nothing to run after the render, it's left to the caller.
+        assert response._is_rendered is False
@@ -0,0 +1,113 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from django_async_extensions.utils.sync import (
+    get_hop_recorder,
+    get_sync_pool,
+    pooled_sync_to_async,
+    record_hops,
+    sync_to_async,
+)
+
+
+def slow(duration):
+    time.sleep(duration)
+    return threading.current_thread()
+
+
+class TestSyncToAsync:
+    async def test_not_recorded(self):
+        assert get_hop_recorder() is None
+        thread = await sync_to_async(slow)(0)
+        assert thread is not threading.current_thread()
+
+    async def test_record_hops(self):
+        with record_hops() as recorder:
+            assert get_hop_recorder() is recorder
+            await sync_to_async(slow)(0.01)
+            await sync_to_async(slow, thread_sensitive=False)(0)
+        assert get_hop_recorder() is None
+
+        assert len(recorder) == 2
+        assert recorder.thread_sensitive_count == 1
+        first, second = recorder.hops
+        assert first.name == "slow"
+        assert first.thread_sensitive is True
+        assert first.run >= 0.01
+        assert second.thread_sensitive is False
+        assert recorder.run == first.run + second.run
+        assert recorder.wait == first.wait + second.wait
+
+    async def test_thread_sensitive_hops_queue_up(self):
+        with record_hops() as recorder:
+            await asyncio.gather(*(sync_to_async(slow)(0.02) for _ in range(3)))
+        waits = sorted(hop.wait for hop in recorder.hops)
+        # Each hop waited for the ones before it on the sync thread.
+        assert waits[1] >= 0.015
+        assert waits[2] >= 0.035
+
+    async def test_exception(self):
+        def fail():
+            raise ValueError
+
+        with record_hops() as recorder:
+            with pytest.raises(ValueError):
+                await sync_to_async(fail)()
+        assert [hop.name for hop in recorder.hops] == [fail.__qualname__]
+
+    async def test_wraps(self):
+        wrapped = sync_to_async(slow)
+        assert wrapped.__wrapped__ is slow
+        assert wrapped.__name__ == "slow"
+        assert not hasattr(sync_to_async(dict), "fromkeys")
+
+
+class TestSyncPool:
+    async def test_pooled_sync_to_async(self, settings):
+        settings.ASYNC_EXTENSIONS_SYNC_POOL_SIZE = 2
+        pool = get_sync_pool()
+        completed = pool.stats()["completed"]
+        thread = await pooled_sync_to_async(slow, use_pool=True)(0)
+        assert thread.name.startswith("async_extensions_sync")
+        assert pool.stats()["completed"] == completed + 1
+
+        thread = await pooled_sync_to_async(slow, use_pool=False)(0)
+        assert not thread.name.startswith("async_extensions_sync")
+
+    async def test_setting(self, settings):
+        thread = await pooled_sync_to_async(slow)(0)
+        assert not thread.name.startswith("async_extensions_sync")
+        settings.ASYNC_EXTENSIONS_SYNC_POOL = True
+        thread = await pooled_sync_to_async(slow)(0)
+        assert thread.name.startswith("async_extensions_sync")
+        assert await pooled_sync_to_async(slow, use_pool=False)(0) is not thread
+
+    async def test_stats(self, settings):
+        settings.ASYNC_EXTENSIONS_SYNC_POOL_SIZE = 1
+        pool = get_sync_pool()
+        assert pool.stats() == {
+            "max_workers": 1,
+            "queued": 0,
+            "max_queued": 0,
+            "running": 0,
+            "completed": 0,
+        }
+        with record_hops() as recorder:
+            await asyncio.gather(
+                *(pooled_sync_to_async(slow, use_pool=True)(0.01) for _ in range(3))
+            )
+        stats = pool.stats()
+        # The first call may start before the others are queued.
+        assert stats.pop("max_queued") >= 2
+        assert stats == {"max_workers": 1, "queued": 0, "running": 0, "completed": 3}
+        assert recorder.thread_sensitive_count == 0
+
+    def test_pool_size(self, settings):
+        settings.ASYNC_EXTENSIONS_SYNC_POOL_SIZE = 1
+        pool = get_sync_pool()
+        assert get_sync_pool() is pool
+        settings.ASYNC_EXTENSIONS_SYNC_POOL_SIZE = 3
+        assert get_sync_pool().stats()["max_workers"] == 3
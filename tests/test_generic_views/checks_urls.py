@@ -0,0 +1,37 @@
+from django.http import HttpResponse
+from django.urls import path
+
+from django_async_extensions.views.generic import AsyncView
+
+
+def sync_decorator(view):
+    def wrapper(request, *args, **kwargs):
+        return view(request, *args, **kwargs)
+
+    wrapper.view_class = view.view_class
+    return wrapper
+
+
+class ValidView(AsyncView):
+    async def get(self, request):
+        return HttpResponse()
+
+
+class MutatedView(AsyncView):
+    async def get(self, request):
+        return HttpResponse()
+
+
+urlpatterns = [
+    path("valid/", ValidView.as_view()),
+    path("mutated/", MutatedView.as_view()),
+    path("decorated/", sync_decorator(ValidView.as_view())),
+]
+
+
+# A sync handler added once the URLconf is loaded.
+def post(self, request):
+    return HttpResponse()
+
+
+MutatedView.post = post
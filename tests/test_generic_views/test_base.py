@@ -1,9 +1,12 @@
+import asyncio
 import pathlib
 import re
+import threading
 import time
 
 from django.core.exceptions import ImproperlyConfigured
 from django.http import HttpResponse
+from django.template.response import TemplateResponse
 from django.test import RequestFactory, Client
 from django.urls import resolve
 
@@ -14,6 +17,8 @@ from django_async_extensions.views.generic import (
     AsyncTemplateView,
     AsyncRedirectView,
 )
+from django_async_extensions.utils.sync import get_sync_pool
+from django_async_extensions.views.generic.base import AsyncContextMixin
 
 try:
     import jinja2
@@ -120,6 +125,20 @@ class TestAsyncView:
         response = await SimpleView.as_view()(self.rf.get("/", REQUEST_METHOD="FAKE"))
         assert response.status_code == 405
 
+    async def test_http_method_names_initkwarg(self):
+        """
+        http_method_names passed to as_view() restricts the allowed methods.
+        """
+        view = SimplePostView.as_view(http_method_names=["get"])
+        self._assert_simple(await view(self.rf.get("/")))
+        response = await view(self.rf.post("/"))
+        assert response.status_code == 405
+        assert response.headers["Allow"] == "GET"
+        response = await view(self.rf.head("/"))
+        assert response.status_code == 405
+        # The class keeps accepting POST.
+        self._assert_simple(await SimplePostView.as_view()(self.rf.post("/")))
+
     async def test_get_and_head(self):
         """
         Test a view which supplies a GET method also responds correctly to HEAD.
@@ -304,6 +323,60 @@ class TestAsyncView:
         response = await view.dispatch(self.rf.head("/"))
         assert response.status_code == 405
 
+    def test_dispatch_table(self):
+        """
+        The handlers of a view are looked up once per class, in a read-only
+        table built by as_view().
+        """
+
+        class TableView(SimplePostView):
+            pass
+
+        assert "_dispatch_table" not in TableView.__dict__
+        TableView.as_view()
+        owner, table = TableView.__dict__["_dispatch_table"]
+        assert owner is TableView
+        assert table["GET"] == ("get", SimpleView.get)
+        assert table["POST"] == ("post", SimpleView.get)
+        assert table["HEAD"] == ("head", SimpleView.get)
+        assert table["PUT"] == ("put", None)
+        with pytest.raises(TypeError):
+            table["PUT"] = ("put", SimpleView.get)
+        TableView.as_view()
+        assert TableView._get_dispatch_table() is table
+        # Subclasses get their own table.
+        assert SimplePostView._get_dispatch_table() is not table
+
+    def test_sync_handler(self):
+        class SyncView(AsyncView):
+            async def get(self, request):
+                return HttpResponse()
+
+            def post(self, request):
+                return HttpResponse()
+
+        msg = "SyncView HTTP handlers must all be async."
+        with pytest.raises(ImproperlyConfigured, match=msg):
+            SyncView.as_view()
+
+    async def test_instance_handler(self):
+        """Handlers set on the instance are used over the class ones."""
+
+        class InstanceHandlerView(SimpleView):
+            def setup(self, request, *args, **kwargs):
+                super().setup(request, *args, **kwargs)
+                self.put = self.get
+
+        view = InstanceHandlerView.as_view()
+        self._assert_simple(await view(self.rf.put("/")))
+        response = await view(self.rf.get("/", REQUEST_METHOD="REQUEST"))
+        assert response.status_code == 405
+
+    async def test_lowercase_method(self):
+        self._assert_simple(
+            await SimpleView.as_view()(self.rf.get("/", REQUEST_METHOD="get"))
+        )
+
 
 @pytest.fixture(autouse=True)
 def urlconf_setting_set(settings):
@@ -397,6 +470,68 @@ class TestAsyncTemplateView:
         view = await view(request)
         assert view.render().content == b"Jinja2\n"
 
+    async def test_async_render(self):
+        view = AsyncTemplateView.as_view(
+            template_name="test_generic_views/about.html", async_render=True
+        )
+        response = await view(self.rf.get("/about/"))
+        assert response.is_rendered
+        assert b"<h1>About</h1>" in response.content
+        assert response.template_name == ["test_generic_views/about.html"]
+        assert isinstance(response.context_data["view"], AsyncView)
+
+    async def test_async_render_post_render_callback(self):
+        threads = []
+
+        def callback(response):
+            threads.append(threading.get_ident())
+            return HttpResponse("ok")
+
+        class CallbackResponse(TemplateResponse):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.add_post_render_callback(callback)
+
+        view = AsyncTemplateView.as_view(
+            template_name="test_generic_views/about.html",
+            response_class=CallbackResponse,
+            async_render=True,
+        )
+        response = await view(self.rf.get("/about/"))
+        assert response.content == b"ok"
+        # Run with the render, off the event loop.
+        assert threads != [threading.get_ident()]
+
+    @pytest.mark.parametrize("async_render", [False, True])
+    async def test_use_sync_pool(self, async_render):
+        pool = get_sync_pool()
+        completed = pool.stats()["completed"]
+        view = AsyncTemplateView.as_view(
+            template_name="test_generic_views/about.html",
+            async_render=async_render,
+            use_sync_pool=True,
+        )
+        response = await view(self.rf.get("/about/"))
+        assert pool.stats()["completed"] == completed + 1
+        if not async_render:
+            response.render()
+        assert b"<h1>About</h1>" in response.content
+
+    @pytest.mark.skipif(jinja2 is None, reason="this test requires jinja2")
+    async def test_async_render_jinja2(self, settings):
+        settings.TEMPLATES = [
+            {
+                "BACKEND": "django.template.backends.jinja2.Jinja2",
+                "APP_DIRS": True,
+                "OPTIONS": {"keep_trailing_newline": True, "enable_async": True},
+            },
+        ]
+        view = AsyncTemplateView.as_view(
+            template_name="test_generic_views/using.html", async_render=True
+        )
+        response = await view(self.rf.get("/using/"))
+        assert response.content == b"Jinja2\n"
+
     def test_template_params(self):
         """
         A generic template view passes kwargs as context.
@@ -456,6 +591,47 @@ class TestAsyncTemplateView:
         assert response.context["title"] == "Title"
 
 
+class TestAsyncContextMixin:
+    async def test_awaitables_are_resolved(self):
+        async def get_title():
+            return "Title"
+
+        async def get_count(view):
+            return 3
+
+        class ContextView(AsyncContextMixin, AsyncView):
+            extra_context = {"static": "value"}
+            context_providers = {"count": get_count, "title": get_count}
+
+        context = await ContextView().get_context_data(title=get_title())
+        assert context["title"] == "Title"
+        assert context["count"] == 3
+        assert context["static"] == "value"
+
+    async def test_awaitables_are_resolved_concurrently(self):
+        running = 0
+        max_running = 0
+
+        async def query(view):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return "result"
+
+        class ContextView(AsyncContextMixin, AsyncView):
+            context_providers = {"a": query, "b": query, "c": query}
+
+        context = await ContextView().get_context_data()
+        assert [context["a"], context["b"], context["c"]] == ["result"] * 3
+        assert max_running == 3
+
+        max_running = 0
+        await ContextView(context_concurrency=2).get_context_data()
+        assert max_running == 2
+
+
 class TestAsyncRedirectView:
     rf = RequestFactory()
 
@@ -0,0 +1,74 @@
+import pytest
+
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import CommandError, call_command
+from django.http import HttpResponse
+
+from django_async_extensions.management.commands.check_async_views import Command
+from django_async_extensions.views.checks import check_async_views
+from django_async_extensions.views.generic import AsyncView
+
+from .checks_urls import MutatedView, ValidView
+
+
+class CachedView(AsyncView):
+    async def get(self, request):
+        return HttpResponse()
+
+
+class CachedSubView(CachedView):
+    pass
+
+
+def test_view_is_async_is_cached():
+    assert CachedSubView.view_is_async is True
+    assert CachedSubView.__dict__["_view_is_async"] is True
+
+
+def test_caches_reset_when_class_changes():
+    CachedSubView.as_view()
+    assert CachedSubView.view_is_async is True
+
+    def get(self, request):
+        return HttpResponse()
+
+    original_get = CachedView.get
+    CachedView.get = get
+    try:
+        assert "_view_is_async" not in CachedSubView.__dict__
+        assert CachedSubView.view_is_async is False
+        with pytest.raises(ImproperlyConfigured):
+            CachedSubView.as_view()
+    finally:
+        CachedView.get = original_get
+    assert CachedSubView.view_is_async is True
+    assert CachedSubView._get_dispatch_table()["GET"] == ("get", original_get)
+
+
+def test_check_async_views():
+    errors = check_async_views(urlconf="test_generic_views.checks_urls")
+    assert [(error.id, error.obj) for error in errors] == [
+        ("django_async_extensions.E001", MutatedView),
+        ("django_async_extensions.E002", ValidView),
+    ]
+    assert errors[0].msg == "MutatedView HTTP handlers must all be async."
+    assert errors[1].msg == (
+        "The view of ValidView for the route 'decorated/' is not a coroutine "
+        "function."
+    )
+
+
+def test_valid_urlconf():
+    assert check_async_views(urlconf="test_generic_views.urls") == []
+
+
+def test_without_root_urlconf(settings):
+    del settings.ROOT_URLCONF
+    assert check_async_views() == []
+
+
+def test_command(capsys):
+    call_command(Command(), urlconf="test_generic_views.urls")
+    assert "All the async views are valid." in capsys.readouterr().out
+    with pytest.raises(CommandError, match="2 issues found in the async views."):
+        call_command(Command(), urlconf="test_generic_views.checks_urls")
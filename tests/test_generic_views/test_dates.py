@@ -6,7 +6,7 @@ from pytest_django.asserts import assertNumQueries
 from django.core.exceptions import ImproperlyConfigured
 from django.db import connection
 from django.test import Client
-from django.test.utils import TZ_SUPPORT
+from django.test.utils import TZ_SUPPORT, CaptureQueriesContext
 
 from .models import Artist, Author, Book, BookSigning, Page
 
@@ -333,6 +333,18 @@ class TestYearArchiveView(TestDataMixin):
         with assertNumQueries(4):
             client.get("/dates/books/2008/reverse/")
 
+    def test_year_view_checks_emptiness_without_fetching_objects(self):
+        # The objects aren't listed, a cheap query is enough.
+        with CaptureQueriesContext(connection) as queries:
+            client.get("/dates/books/2008/")
+        assert "LIMIT 1" in queries[0]["sql"]
+        # The objects are listed, they're fetched once.
+        with CaptureQueriesContext(connection) as queries:
+            res = client.get("/dates/books/2006/make_object_list/")
+        assert len(res.context["object_list"]) == 1
+        assert "LIMIT 1" not in queries[0]["sql"]
+        assert len(queries) == 4
+
     def test_datetime_year_view(self):
         BookSigning.objects.create(event_date=datetime.datetime(2008, 4, 2, 12, 0))
         res = client.get("/dates/booksignings/2008/")
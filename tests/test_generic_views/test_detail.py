@@ -1,15 +1,23 @@
 import datetime
 
+from asgiref.sync import async_to_sync, sync_to_async
+
 import pytest
 
+from django.core.cache import caches
 from django.core.exceptions import ImproperlyConfigured, ObjectDoesNotExist
+from django.db import connection
 from django.test import Client
 from django.test.client import RequestFactory
+from django.test.utils import CaptureQueriesContext
 from django.views.generic.detail import SingleObjectTemplateResponseMixin
 
+from django_async_extensions.core.cache import bump_model_generation
+from django_async_extensions.core.object_cache import ObjectCache
 from django_async_extensions.views.generic.base import AsyncView
 
 from .models import Artist, Author, Book, Page
+from .views import CachedAuthorDetail
 
 
 client = Client()
@@ -220,3 +228,137 @@ class TestAsyncDetailView:
         res = client.get("/detail/nonmodel/1/")
         assert res.status_code == 200
         assert res.context["object"].id == "non_model_1"
+
+
+@pytest.mark.django_db(transaction=True)
+class TestObjectCache:
+    @pytest.fixture(autouse=True)
+    async def setup(self):
+        await caches["default"].aclear()
+        self.author = await Author.objects.acreate(name="Author", slug="author")
+
+    async def test_aget(self):
+        object_cache = ObjectCache()
+        queryset = Author.objects.filter(pk=self.author.pk)
+        obj = await object_cache.aget(queryset)
+        assert obj == self.author
+        cached = await object_cache.aget(queryset)
+        assert cached == self.author
+        assert cached is not obj
+        assert object_cache.stats() == {"hits": 1, "misses": 1, "hit_rate": 0.5}
+        # Served from Django's cache once the local LRU is emptied.
+        object_cache.clear_local()
+        assert await object_cache.aget(queryset) == self.author
+        assert object_cache.hits == 2
+        object_cache.reset_stats()
+        assert object_cache.stats()["hit_rate"] == 0.0
+
+    async def test_does_not_exist_is_not_cached(self):
+        object_cache = ObjectCache()
+        with pytest.raises(Author.DoesNotExist):
+            await object_cache.aget(Author.objects.filter(slug="missing"))
+        with pytest.raises(Author.DoesNotExist):
+            await object_cache.aget(Author.objects.none())
+        assert object_cache.misses == 1
+
+    async def test_invalidated_on_save(self):
+        object_cache = ObjectCache()
+        queryset = Author.objects.filter(pk=self.author.pk)
+        await object_cache.aget(queryset)
+        self.author.name = "Updated"
+        await self.author.asave()
+        assert (await object_cache.aget(queryset)).name == "Updated"
+        await Author.objects.filter(pk=self.author.pk).aupdate(name="Updated again")
+        assert (await object_cache.aget(queryset)).name == "Updated"
+        await object_cache.ainvalidate(Author)
+        assert (await object_cache.aget(queryset)).name == "Updated again"
+
+    async def test_invalidated_by_another_process(self):
+        object_cache = ObjectCache()
+        queryset = Author.objects.filter(pk=self.author.pk)
+        await object_cache.aget(queryset)
+        object_cache.clear_local()
+        await Author.objects.filter(pk=self.author.pk).aupdate(name="Updated")
+        # What the receivers of another process do on save, with only the
+        # model known and no key built there.
+        await sync_to_async(bump_model_generation)(Author)
+        assert (await object_cache.aget(queryset)).name == "Updated"
+        assert object_cache.misses == 2
+
+    async def test_local_lru(self):
+        object_cache = ObjectCache(maxsize=1)
+        other = await Author.objects.acreate(name="Other", slug="other")
+        await object_cache.aget(Author.objects.filter(pk=self.author.pk))
+        await object_cache.aget(Author.objects.filter(pk=other.pk))
+        assert len(object_cache._local) == 1
+        # Expired entries are dropped.
+        object_cache = ObjectCache(timeout=0)
+        await object_cache.aget(Author.objects.filter(pk=self.author.pk))
+        key = next(iter(object_cache._local))
+        assert object_cache._get_local(key) is None
+        assert not object_cache._local
+
+    def test_view(self):
+        url = "/detail/author/%s/cached/" % self.author.pk
+        with CaptureQueriesContext(connection) as queries:
+            res = client.get(url)
+        assert res.status_code == 200
+        assert res.context["object"] == self.author
+        assert len(queries) == 1
+        with CaptureQueriesContext(connection) as queries:
+            res = client.get(url)
+        assert res.context["object"] == self.author
+        assert len(queries) == 0
+        # Unsafe methods bypass the cache.
+        view = CachedAuthorDetail(request=RequestFactory().post(url))
+        view.kwargs = {"pk": self.author.pk}
+        with CaptureQueriesContext(connection) as queries:
+            async_to_sync(view.get_object)()
+        assert len(queries) == 1
+        res = client.get("/detail/author/0/cached/")
+        assert res.status_code == 404
+
+
+@pytest.mark.django_db
+class TestConditionalDetailView:
+    @pytest.fixture(autouse=True)
+    def setup(self):
+        self.book = Book.objects.create(
+            name="2066", slug="2066", pages=800, pubdate=datetime.date(2008, 10, 1)
+        )
+        self.url = "/detail/book/%s/conditional/" % self.book.pk
+
+    def test_validator_headers(self):
+        res = client.get(self.url)
+        assert res.status_code == 200
+        assert res.headers["ETag"] == '"book-%s"' % self.book.pk
+        assert res.headers["Last-Modified"] == "Wed, 01 Oct 2008 00:00:00 GMT"
+
+    def test_not_modified(self):
+        # The date is fetched with a single query, without loading the object
+        # or rendering the template.
+        with CaptureQueriesContext(connection) as queries:
+            res = client.get(
+                self.url, headers={"If-Modified-Since": "Wed, 01 Oct 2008 00:00:00 GMT"}
+            )
+        assert res.status_code == 304
+        assert len(queries) == 1
+        assert '"pubdate"' in queries[0]["sql"]
+        assert '"name"' not in queries[0]["sql"]
+        assert res.headers["ETag"] == '"book-%s"' % self.book.pk
+        res = client.get(
+            self.url, headers={"If-None-Match": '"book-%s"' % self.book.pk}
+        )
+        assert res.status_code == 304
+
+    def test_modified(self):
+        res = client.get(
+            self.url, headers={"If-Modified-Since": "Tue, 30 Sep 2008 00:00:00 GMT"}
+        )
+        assert res.status_code == 200
+        res = client.get(self.url, headers={"If-None-Match": '"other"'})
+        assert res.status_code == 200
+
+    def test_not_found(self):
+        res = client.get("/detail/book/0/conditional/")
+        assert res.status_code == 404
@@ -0,0 +1,90 @@
+import json
+
+import pytest
+
+from django.test import TestCase
+
+from .models import Author
+
+
+@pytest.fixture(autouse=True)
+def url_setting_set(settings):
+    old_root_urlconf = settings.ROOT_URLCONF
+    settings.ROOT_URLCONF = "test_generic_views.urls"
+    yield settings
+    settings.ROOT_URLCONF = old_root_urlconf
+
+
+@pytest.mark.django_db(transaction=True)
+class JSONViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.authors = [
+            Author.objects.create(name="Author %s" % i, slug="author-%s" % i)
+            for i in range(3)
+        ]
+
+    async def _aget_json(self, path, data=None):
+        res = await self.async_client.get(path, data)
+        assert res.status_code == 200
+        assert res.headers["Content-Type"] == "application/json"
+        return res, json.loads(
+            b"".join([chunk async for chunk in res.streaming_content])
+        )
+
+    async def test_list(self):
+        res, data = await self._aget_json("/json/authors/")
+        assert data == {
+            "objects": [
+                {"name": "Author 0", "slug": "author-0"},
+                {"name": "Author 1", "slug": "author-1"},
+                {"name": "Author 2", "slug": "author-2"},
+            ]
+        }
+
+    async def test_empty_list(self):
+        await Author.objects.all().adelete()
+        res, data = await self._aget_json("/json/authors/")
+        assert data == {"objects": []}
+
+    async def test_paginated_list(self):
+        res, data = await self._aget_json("/json/authors/paginated/", {"page": "2"})
+        assert data == {
+            "objects": [{"name": "Author 2", "slug": "author-2"}],
+            "pagination": {
+                "number": 2,
+                "count": 3,
+                "num_pages": 2,
+                "has_next": False,
+                "has_previous": True,
+            },
+        }
+
+    async def test_paginated_list_by_cursor(self):
+        res, data = await self._aget_json("/json/authors/paginated/cursor/")
+        assert [author["name"] for author in data["objects"]] == [
+            "Author 0",
+            "Author 1",
+        ]
+        assert data["pagination"]["previous_cursor"] is None
+        res, data = await self._aget_json(
+            "/json/authors/paginated/cursor/",
+            {"cursor": data["pagination"]["next_cursor"]},
+        )
+        assert [author["name"] for author in data["objects"]] == ["Author 2"]
+        assert data["pagination"]["next_cursor"] is None
+
+    async def test_detail(self):
+        author = self.authors[1]
+        res = await self.async_client.get("/json/author/%s/" % author.pk)
+        assert res.status_code == 200
+        assert res.headers["Content-Type"] == "application/json"
+        assert json.loads(res.content) == {
+            "id": author.pk,
+            "name": "Author 1",
+            "slug": "author-1",
+        }
+
+    async def test_detail_not_found(self):
+        res = await self.async_client.get("/json/author/0/")
+        assert res.status_code == 404
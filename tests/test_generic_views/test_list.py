@@ -1,14 +1,17 @@
 import datetime
 import re
 
+from asgiref.sync import async_to_sync
+
 import pytest
 
 from django.core.exceptions import ImproperlyConfigured
-from django.test import Client, TestCase
+from django.test import Client, RequestFactory, TestCase
 
 from django_async_extensions.views.generic.base import AsyncView
 
 from .models import Artist, Author, Book, Page
+from .views import AuthorList, BookList
 
 client = Client()
 
@@ -152,6 +155,87 @@ class ListViewTests(TestCase):
         # Custom pagination allows for 2 orphans on a page size of 5
         assert len(res.context["object_list"]) == 7
 
+    def test_paginated_with_count_strategy(self):
+        self._make_authors(100)
+        res = client.get("/list/authors/paginated/capped_count/", {"page": "4"})
+        assert res.status_code == 200
+        assert res.context["paginator"].count_strategy.cap == 50
+        assert len(res.context["object_list"]) == 10
+        assert res.context["author_list"][0].name == "Author 90"
+        res = client.get("/list/authors/paginated/capped_count/", {"page": "5"})
+        assert res.status_code == 404
+
+    def test_paginated_with_concurrent_fetch(self):
+        self._make_authors(100)
+        res = client.get("/list/authors/paginated/concurrent/", {"page": "2"})
+        assert res.status_code == 200
+        assert res.context["paginator"].fetch_mode == "concurrent"
+        assert len(res.context["object_list"]) == 30
+        assert res.context["author_list"][0].name == "Author 30"
+        assert res.context["is_paginated"]
+        res = client.get("/list/authors/paginated/concurrent/", {"page": "5"})
+        assert res.status_code == 404
+
+    def test_paginated_with_window_fetch(self):
+        self._make_authors(100)
+        # The page and the count are fetched in a single query.
+        with self.assertNumQueries(1):
+            res = client.get("/list/authors/paginated/window/", {"page": "4"})
+        assert res.status_code == 200
+        assert res.context["paginator"].num_pages == 4
+        assert len(res.context["object_list"]) == 10
+        assert res.context["author_list"][0].name == "Author 90"
+        res = client.get("/list/authors/paginated/window/", {"page": "5"})
+        assert res.status_code == 404
+
+    async def test_streamed(self):
+        await self._amake_authors(3)
+        res = await self.async_client.get("/list/authors/streamed/")
+        assert res.status_code == 200
+        assert res.streaming
+        content = b"".join([chunk async for chunk in res.streaming_content])
+        assert content == (
+            b"<ul>\n<li>Author 00</li>\n<li>Author 01</li>\n<li>Author 02</li>\n"
+            b"</ul>\n"
+        )
+
+    async def test_streamed_paginated(self):
+        await self._amake_authors(100)
+        res = await self.async_client.get(
+            "/list/authors/streamed/paginated/", {"page": "2"}
+        )
+        assert res.status_code == 200
+        # The header, the 30 rows in chunks of 7 objects and the footer.
+        chunks = [chunk async for chunk in res.streaming_content]
+        assert len(chunks) == 7
+        assert chunks[1].startswith(b"<li>Author 30</li>")
+        assert chunks[-2].endswith(b"<li>Author 59</li>\n")
+
+    def test_paginated_by_cursor(self):
+        self._make_authors(100)
+        res = client.get("/list/authors/paginated/cursor/")
+        assert res.status_code == 200
+        assert res.template_name[0] == "test_generic_views/author_list.html"
+        assert len(res.context["object_list"]) == 30
+        assert res.context["author_list"] is res.context["object_list"]
+        assert res.context["author_list"][0].name == "Author 00"
+        assert res.context["is_paginated"]
+        page = res.context["page_obj"]
+        assert page.previous_cursor is None
+
+        res = client.get(
+            "/list/authors/paginated/cursor/", {"cursor": page.next_cursor}
+        )
+        assert res.status_code == 200
+        assert res.context["author_list"][0].name == "Author 30"
+        assert res.context["page_obj"].previous_cursor is not None
+
+    def test_paginated_by_invalid_cursor(self):
+        self._make_authors(3)
+        res = client.get("/list/authors/paginated/cursor/", {"cursor": "frog"})
+        assert res.status_code == 404
+        assert res.context.get("reason") == "Invalid cursor: That cursor is not valid"
+
     def test_paginated_orphaned_queryset(self):
         self._make_authors(92)
         res = client.get("/list/authors/paginated-orphaned/")
@@ -245,6 +329,46 @@ class ListViewTests(TestCase):
         with self.assertNumQueries(3):
             client.get("/list/authors/notempty/paginated/")
 
+    def test_streamed_list_view_does_not_query_twice(self):
+        self._make_authors(3)
+        view = AuthorList.as_view(stream_response=True, allow_empty=False)
+
+        async def get():
+            res = await view(RequestFactory().get("/"))
+            return b"".join([chunk async for chunk in res.streaming_content])
+
+        # The objects fetched to check the list isn't empty are streamed.
+        with self.assertNumQueries(1):
+            content = async_to_sync(get)()
+        assert content.count(b"<li>") == 3
+
+    def test_conditional_list_view(self):
+        Book.objects.create(
+            name="2066", slug="2066", pages=800, pubdate=datetime.date(2008, 10, 1)
+        )
+        res = client.get("/list/books/conditional/")
+        assert res.status_code == 200
+        assert res.headers["Last-Modified"] == "Wed, 01 Oct 2008 00:00:00 GMT"
+        with self.assertNumQueries(1):
+            res = client.get(
+                "/list/books/conditional/",
+                headers={"If-Modified-Since": "Wed, 01 Oct 2008 00:00:00 GMT"},
+            )
+        assert res.status_code == 304
+        Book.objects.create(
+            name="Later", slug="later", pages=1, pubdate=datetime.date(2009, 1, 1)
+        )
+        res = client.get(
+            "/list/books/conditional/",
+            headers={"If-Modified-Since": "Wed, 01 Oct 2008 00:00:00 GMT"},
+        )
+        assert res.status_code == 200
+
+    def test_list_view_has_no_last_modified_field(self):
+        # Max() doesn't change when a row is deleted, it's left to the views.
+        with pytest.raises(TypeError, match="last_modified_field"):
+            BookList.as_view(last_modified_field="pubdate")
+
     def test_explicitly_ordered_list_view(self):
         Book.objects.create(
             name="Zebras for Dummies", pages=800, pubdate=datetime.date(2006, 9, 1)
@@ -276,6 +400,11 @@ class ListViewTests(TestCase):
             == "Invalid page (2): That page contains no results"
         )
 
+    async def _amake_authors(self, n):
+        await Author.objects.all().adelete()
+        for i in range(n):
+            await Author.objects.acreate(name="Author %02i" % i, slug="a%s" % i)
+
     def _make_authors(self, n):
         Author.objects.all().delete()
         for i in range(n):
@@ -3,6 +3,8 @@ from django.contrib.auth.decorators import login_required
 from django.urls import path, re_path
 from django.views.decorators.cache import cache_page
 
+from django_async_extensions.core.count import CappedCount
+from django_async_extensions.core.paginator import AsyncCursorPaginator
 from django_async_extensions.views.generic import AsyncTemplateView, dates
 
 from .models import Book
@@ -43,6 +45,11 @@ urlpatterns = [
     path("detail/obj/", views.ObjectDetail.as_view()),
     path("detail/artist/<int:pk>/", views.ArtistDetail.as_view(), name="artist_detail"),
     path("detail/author/<int:pk>/", views.AuthorDetail.as_view(), name="author_detail"),
+    path("detail/author/<int:pk>/cached/", views.CachedAuthorDetail.as_view()),
+    path(
+        "detail/book/<int:pk>/conditional/",
+        views.ConditionalBookDetail.as_view(),
+    ),
     path(
         "detail/author/bycustompk/<foo>/",
         views.AuthorDetail.as_view(pk_url_kwarg="foo"),
@@ -188,11 +195,40 @@ urlpatterns = [
         "list/authors/paginated/custom_page_kwarg/",
         views.AuthorList.as_view(paginate_by=30, page_kwarg="pagina"),
     ),
+    path(
+        "list/authors/paginated/capped_count/",
+        views.AuthorList.as_view(
+            paginate_by=30, paginate_count_strategy=CappedCount(50)
+        ),
+    ),
+    path(
+        "list/authors/paginated/concurrent/",
+        views.AuthorList.as_view(paginate_by=30, paginate_fetch_mode="concurrent"),
+    ),
+    path("list/authors/streamed/", views.AuthorList.as_view(stream_response=True)),
+    path(
+        "list/authors/streamed/paginated/",
+        views.AuthorList.as_view(
+            paginate_by=30, stream_response=True, stream_chunk_size=7
+        ),
+    ),
+    path(
+        "list/authors/paginated/window/",
+        views.AuthorList.as_view(paginate_by=30, paginate_fetch_mode="window"),
+    ),
+    path(
+        "list/authors/paginated/cursor/",
+        views.AuthorList.as_view(paginate_by=30, paginator_class=AsyncCursorPaginator),
+    ),
     path(
         "list/authors/paginated/custom_constructor/",
         views.AuthorListCustomPaginator.as_view(),
     ),
     path("list/books/sorted/", views.BookList.as_view(ordering="name")),
+    path(
+        "list/books/conditional/",
+        views.ConditionalBookList.as_view(),
+    ),
     path(
         "list/books/sortedbypagesandnamedec/",
         views.BookList.as_view(ordering=("pages", "-name")),
@@ -377,6 +413,25 @@ urlpatterns = [
         "dates/booksignings/<int:year>/<month>/<int:day>/<int:pk>/",
         views.BookSigningDetail.as_view(),
     ),
+    # JSON views
+    path(
+        "json/authors/",
+        views.AuthorJSONList.as_view(),
+    ),
+    path(
+        "json/authors/paginated/",
+        views.AuthorJSONList.as_view(paginate_by=2, stream_chunk_size=1),
+    ),
+    path(
+        "json/authors/paginated/cursor/",
+        # The cursor is made of the fields of the ordering and the pk.
+        views.AuthorJSONList.as_view(
+            json_fields=["id", "name"],
+            paginate_by=2,
+            paginator_class=AsyncCursorPaginator,
+        ),
+    ),
+    path("json/author/<int:pk>/", views.AuthorJSONDetail.as_view()),
     # Useful for testing redirects
     path("accounts/login/", auth_views.LoginView.as_view()),
     path("BaseDateListViewTest/", dates.AsyncBaseDateListView.as_view()),
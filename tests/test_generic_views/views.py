@@ -1,7 +1,9 @@
 from django.contrib.auth.decorators import login_required
+from django.db.models import Max
 from django.urls import reverse_lazy, reverse
 from django.utils.decorators import method_decorator
 
+from django_async_extensions.core.object_cache import ObjectCache
 from django_async_extensions.core.paginator import AsyncPaginator
 from django_async_extensions.views import generic
 
@@ -37,6 +39,19 @@ class AuthorDetail(generic.AsyncDetailView):
     queryset = Author.objects.all()
 
 
+class ConditionalBookDetail(generic.AsyncDetailView):
+    model = Book
+    last_modified_field = "pubdate"
+
+    async def aget_etag(self):
+        return "book-%s" % self.kwargs["pk"]
+
+
+class CachedAuthorDetail(generic.AsyncDetailView):
+    queryset = Author.objects.all()
+    object_cache = ObjectCache()
+
+
 class AuthorCustomDetail(generic.AsyncDetailView):
     template_name = "test_generic_views/author_detail.html"
     queryset = Author.objects.all()
@@ -234,6 +249,13 @@ class BookList(generic.AsyncListView):
     model = Book
 
 
+class ConditionalBookList(BookList):
+    async def aget_last_modified(self):
+        return (await Book.objects.aaggregate(last_modified=Max("pubdate")))[
+            "last_modified"
+        ]
+
+
 class CustomPaginator(AsyncPaginator):
     def __init__(self, queryset, page_size, orphans=0, allow_empty_first_page=True):
         super().__init__(
@@ -349,3 +371,12 @@ class BookArchiveWithoutDateField(generic.AsyncArchiveIndexView):
 
 class BookSigningDetail(BookSigningConfig, generic.AsyncDateDetailView):
     context_object_name = "book"
+
+
+class AuthorJSONList(generic.AsyncJSONListView):
+    queryset = Author.objects.all()
+    json_fields = ["name", "slug"]
+
+
+class AuthorJSONDetail(generic.AsyncJSONDetailView):
+    queryset = Author.objects.all()
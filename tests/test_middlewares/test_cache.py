@@ -0,0 +1,151 @@
+import asyncio
+
+import pytest
+
+from django.core.cache import caches
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from django_async_extensions.middleware import cache as cache_module
+from django_async_extensions.middleware.cache import (
+    AsyncCacheMiddleware,
+    AsyncFetchFromCacheMiddleware,
+    aget_cache_key,
+    async_cache_page,
+)
+
+rf = RequestFactory()
+
+
+@pytest.fixture(autouse=True)
+async def clear_cache():
+    await caches["default"].aclear()
+    yield
+    assert cache_module._renders == {}
+
+
+def make_view(delay=0, **decorator_kwargs):
+    calls = []
+
+    @async_cache_page(60, **decorator_kwargs)
+    async def view(request):
+        calls.append(request)
+        await asyncio.sleep(delay)
+        response = HttpResponse("call %s" % len(calls))
+        response["Vary"] = "X-Test"
+        return response
+
+    return view, calls
+
+
+async def test_page_is_cached():
+    view, calls = make_view()
+    response = await view(rf.get("/page/"))
+    assert response.content == b"call 1"
+    response = await view(rf.get("/page/"))
+    assert response.content == b"call 1"
+    assert response["Cache-Control"] == "max-age=60"
+    assert "Age" in response
+    assert len(calls) == 1
+    response = await view(rf.post("/page/"))
+    assert response.content == b"call 2"
+
+
+async def test_vary_headers():
+    view, calls = make_view()
+    assert (await view(rf.get("/page/", headers={"X-Test": "a"}))).content == b"call 1"
+    assert (await view(rf.get("/page/", headers={"X-Test": "b"}))).content == b"call 2"
+    assert (await view(rf.get("/page/", headers={"X-Test": "a"}))).content == b"call 1"
+    assert len(calls) == 2
+
+
+async def test_concurrent_misses_are_coalesced():
+    view, calls = make_view(delay=0.05)
+    await view(rf.get("/page/"))
+    # The page expired, the list of headers it varies on is still cached.
+    cache_key = await aget_cache_key(rf.get("/page/"), cache=caches["default"])
+    await caches["default"].adelete(cache_key)
+
+    responses = await asyncio.gather(*(view(rf.get("/page/")) for _ in range(5)))
+    assert [response.content for response in responses] == [b"call 2"] * 5
+    assert len(calls) == 2
+
+
+async def test_errors_release_the_render():
+    calls = []
+
+    @async_cache_page(60)
+    async def view(request):
+        calls.append(request)
+        if len(calls) == 2:
+            raise ValueError("failed")
+        return HttpResponse("call %s" % len(calls))
+
+    await view(rf.get("/page/"))
+    cache_key = await aget_cache_key(rf.get("/page/"), cache=caches["default"])
+    await caches["default"].adelete(cache_key)
+    with pytest.raises(ValueError):
+        await view(rf.get("/page/"))
+    assert (await view(rf.get("/page/"))).content == b"call 3"
+
+
+async def test_cancelled_render_is_released():
+    rendering = asyncio.Event()
+    calls = []
+
+    @async_cache_page(60)
+    async def view(request):
+        calls.append(request)
+        if len(calls) == 2:
+            rendering.set()
+            await asyncio.sleep(10)
+        return HttpResponse("call %s" % len(calls))
+
+    await view(rf.get("/page/"))
+    cache_key = await aget_cache_key(rf.get("/page/"), cache=caches["default"])
+    await caches["default"].adelete(cache_key)
+
+    task = asyncio.create_task(view(rf.get("/page/")))
+    await rendering.wait()
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    # The next request renders the page rather than waiting for the cancelled one.
+    response = await asyncio.wait_for(view(rf.get("/page/")), 1)
+    assert response.content == b"call 3"
+
+
+async def test_stale_while_revalidate(mocker):
+    view, calls = make_view(delay=0.05, stale_while_revalidate=30)
+    await view(rf.get("/page/"))
+    mocker.patch.object(AsyncFetchFromCacheMiddleware, "_is_stale", return_value=True)
+    # One request renders the page again, the others get the stale page.
+    responses = await asyncio.gather(*(view(rf.get("/page/")) for _ in range(3)))
+    assert sorted(response.content for response in responses) == [
+        b"call 1",
+        b"call 1",
+        b"call 2",
+    ]
+    assert len(calls) == 2
+
+
+async def test_stale_page_expires_later():
+    view, calls = make_view(stale_while_revalidate=30)
+    await view(rf.get("/page/"))
+    cache_key = await aget_cache_key(rf.get("/page/"), cache=caches["default"])
+    assert caches["default"]._expire_info[
+        caches["default"].make_and_validate_key(cache_key)
+    ] == pytest.approx(cache_module.time.time() + 90, abs=5)
+
+
+async def test_middleware():
+    calls = []
+
+    async def get_response(request):
+        calls.append(request)
+        return HttpResponse("call %s" % len(calls))
+
+    middleware = AsyncCacheMiddleware(get_response, page_timeout=60)
+    assert (await middleware(rf.get("/page/"))).content == b"call 1"
+    assert (await middleware(rf.get("/page/"))).content == b"call 1"
+    assert len(calls) == 1
@@ -86,3 +86,61 @@ class TestMiddlewareMixin:
 
         assert spy1.call_count == 1
         assert spy1.spy_return == req
+
+    async def test_middleware_process_response_only(self, client):
+        class OnlyResponseMiddleware(AsyncMiddlewareMixin):
+            async def process_response(self, request, response):
+                assert response is resp_for_get_response
+                return resp
+
+        middleware = OnlyResponseMiddleware(async_get_response)
+        assert await middleware(client) is resp
+
+    async def test_middleware_without_hooks(self, client):
+        middleware = AsyncMiddlewareMixin(async_get_response)
+        assert await middleware(client) is resp_for_get_response
+        assert middleware.async_hooks == dict.fromkeys(middleware.async_hooks)
+
+    async def test_hooks_are_resolved_once(self, client, mocker):
+        middleware = RequestMiddleware(async_get_response)
+        spy = mocker.spy(AsyncMiddlewareMixin, "resolve_hooks")
+        await middleware(client)
+        await middleware(client)
+        assert spy.call_count == 0
+
+    async def test_hooks_added_after_init(self, client):
+        middleware = AsyncMiddlewareMixin(async_get_response)
+
+        async def process_request(request):
+            return resp
+
+        middleware.process_request = process_request
+        assert await middleware(client) is resp_for_get_response
+        middleware.resolve_hooks()
+        assert await middleware(client) is resp
+
+    async def test_init_without_super(self, client):
+        class NoSuperMiddleware(RequestMiddleware):
+            def __init__(self, get_response):
+                self.get_response = get_response
+
+        middleware = NoSuperMiddleware(async_get_response)
+        assert await middleware(client) is resp
+        assert middleware.async_hooks["process_request"] == middleware.process_request
+
+    def test_async_hooks(self):
+        class HooksMiddleware(AsyncMiddlewareMixin):
+            async def process_view(self, request, view_func, view_args, view_kwargs):
+                pass
+
+            def process_exception(self, request, exception):
+                pass
+
+        middleware = HooksMiddleware(async_get_response)
+        hooks = middleware.async_hooks
+        assert hooks["process_request"] is None
+        assert hooks["process_response"] is None
+        assert hooks["process_template_response"] is None
+        assert hooks["process_view"] == middleware.process_view
+        # Sync hooks are wrapped with sync_to_async().
+        assert hooks["process_exception"].__wrapped__ == middleware.process_exception
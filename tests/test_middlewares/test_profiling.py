@@ -0,0 +1,146 @@
+import asyncio
+import logging
+
+import pytest
+
+from django.http import HttpResponse
+from django.test import RequestFactory, override_settings
+
+from django_async_extensions.middleware.base import AsyncMiddlewareMixin
+from django_async_extensions.middleware.profiling import (
+    Histogram,
+    MiddlewareProfiler,
+    profiler,
+)
+
+rf = RequestFactory()
+
+
+async def view(request):
+    await asyncio.sleep(0.02)
+    return HttpResponse()
+
+
+class SlowRequestMiddleware(AsyncMiddlewareMixin):
+    async def process_request(self, request):
+        await asyncio.sleep(0.01)
+
+
+class ShortCircuitMiddleware(AsyncMiddlewareMixin):
+    async def process_request(self, request):
+        return HttpResponse("short")
+
+
+class ResponseMiddleware(AsyncMiddlewareMixin):
+    async def process_response(self, request, response):
+        return response
+
+
+@pytest.fixture(autouse=True)
+def reset_profiler():
+    profiler.reset()
+    yield
+    profiler.reset()
+
+
+def parse_server_timing(response):
+    timings = {}
+    for entry in response["Server-Timing"].split(", "):
+        name, duration = entry.split(";dur=")
+        timings[name] = float(duration)
+    return timings
+
+
+class TestProfiling:
+    async def test_disabled(self):
+        middleware = SlowRequestMiddleware(view)
+        assert middleware.get_response is view
+        response = await middleware(rf.get("/"))
+        assert not response.has_header("Server-Timing")
+        assert profiler.snapshot() == {}
+
+    @override_settings(ASYNC_EXTENSIONS_PROFILE_MIDDLEWARE=True)
+    async def test_self_and_total_time(self, caplog):
+        middleware = ResponseMiddleware(SlowRequestMiddleware(view))
+        with caplog.at_level(
+            logging.DEBUG, logger="django_async_extensions.middleware.profiling"
+        ):
+            response = await middleware(rf.get("/"))
+
+        timings = parse_server_timing(response)
+        assert list(timings) == [
+            "SlowRequestMiddleware",
+            "SlowRequestMiddleware-total",
+            "ResponseMiddleware",
+            "ResponseMiddleware-total",
+        ]
+        assert timings["SlowRequestMiddleware"] >= 10
+        assert timings["SlowRequestMiddleware-total"] >= 30
+        assert timings["ResponseMiddleware"] < 10
+        assert (
+            timings["ResponseMiddleware-total"]
+            >= timings["SlowRequestMiddleware-total"]
+        )
+
+        assert [record.middleware for record in caplog.records] == [
+            "SlowRequestMiddleware",
+            "ResponseMiddleware",
+        ]
+        assert caplog.records[0].self_time == pytest.approx(
+            timings["SlowRequestMiddleware"], abs=0.001
+        )
+
+        snapshot = profiler.snapshot()
+        assert snapshot["SlowRequestMiddleware"]["self_time"]["count"] == 1
+        assert snapshot["SlowRequestMiddleware"]["total_time"]["buckets"][25] == 0
+        assert snapshot["SlowRequestMiddleware"]["total_time"]["buckets"]["+Inf"] == 1
+
+    @override_settings(ASYNC_EXTENSIONS_PROFILE_MIDDLEWARE=True)
+    async def test_short_circuit(self):
+        middleware = ShortCircuitMiddleware(view)
+        response = await middleware(rf.get("/"))
+        assert response.content == b"short"
+        timings = parse_server_timing(response)
+        assert timings["ShortCircuitMiddleware"] < 10
+        assert (
+            timings["ShortCircuitMiddleware"] == timings["ShortCircuitMiddleware-total"]
+        )
+
+    @override_settings(ASYNC_EXTENSIONS_PROFILE_MIDDLEWARE=True)
+    async def test_resolve_hooks_again(self):
+        middleware = ResponseMiddleware(view)
+        middleware.resolve_hooks()
+        assert middleware.get_response._unprofiled is view
+        await middleware(rf.get("/"))
+        assert profiler.snapshot()["ResponseMiddleware"]["self_time"]["count"] == 1
+
+    @override_settings(ASYNC_EXTENSIONS_PROFILE_MIDDLEWARE=True)
+    async def test_server_timing_disabled(self, monkeypatch):
+        monkeypatch.setattr(profiler, "server_timing", False)
+        response = await ResponseMiddleware(view)(rf.get("/"))
+        assert not response.has_header("Server-Timing")
+        assert profiler.snapshot()["ResponseMiddleware"]["self_time"]["count"] == 1
+
+
+class TestHistogram:
+    def test_observe(self):
+        histogram = Histogram(buckets=(1, 10))
+        for value in (0.5, 1, 5, 50):
+            histogram.observe(value)
+        assert histogram.as_dict() == {
+            "count": 4,
+            "sum": 56.5,
+            "buckets": {1: 2, 10: 3, "+Inf": 4},
+        }
+
+    def test_profiler(self):
+        middleware_profiler = MiddlewareProfiler(buckets=(1,))
+        middleware_profiler.record("Middleware", 0.5, 2)
+        assert middleware_profiler.snapshot() == {
+            "Middleware": {
+                "self_time": {"count": 1, "sum": 0.5, "buckets": {1: 1, "+Inf": 1}},
+                "total_time": {"count": 1, "sum": 2, "buckets": {1: 0, "+Inf": 1}},
+            }
+        }
+        middleware_profiler.reset()
+        assert middleware_profiler.snapshot() == {}
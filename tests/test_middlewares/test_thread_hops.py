@@ -0,0 +1,57 @@
+import logging
+
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from django_async_extensions.middleware.thread_hops import AsyncThreadHopMiddleware
+from django_async_extensions.utils.sync import sync_to_async
+
+rf = RequestFactory()
+
+
+def render():
+    return "content"
+
+
+async def view(request):
+    content = await sync_to_async(render)()
+    await sync_to_async(render, thread_sensitive=False)()
+    response = HttpResponse(content)
+    response["Server-Timing"] = "view;dur=1"
+    return response
+
+
+class TestThreadHopMiddleware:
+    async def test_server_timing(self):
+        response = await AsyncThreadHopMiddleware(view)(rf.get("/"))
+        entries = response["Server-Timing"].split(", ")
+        assert entries[0] == "view;dur=1"
+        assert entries[1].startswith(
+            'sync-hops;desc="2 hops (1 thread sensitive)";dur='
+        )
+        assert entries[2].startswith("sync-hops-wait;dur=")
+
+    async def test_logging(self, caplog):
+        with caplog.at_level(
+            logging.DEBUG, logger="django_async_extensions.thread_hops"
+        ):
+            await AsyncThreadHopMiddleware(view)(rf.get("/page/"))
+        [record] = caplog.records
+        assert record.getMessage().startswith(
+            "GET /page/: 2 sync_to_async hops (1 thread sensitive)"
+        )
+        assert [hop.name for hop in record.hops] == ["render", "render"]
+
+    async def test_no_hops(self, caplog):
+        async def get_response(request):
+            return HttpResponse()
+
+        class Middleware(AsyncThreadHopMiddleware):
+            server_timing = False
+
+        with caplog.at_level(
+            logging.DEBUG, logger="django_async_extensions.thread_hops"
+        ):
+            response = await Middleware(get_response)(rf.get("/"))
+        assert not response.has_header("Server-Timing")
+        assert caplog.records == []
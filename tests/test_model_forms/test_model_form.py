@@ -38,6 +38,7 @@ from django.utils.choices import BlankChoiceIterator
 from django.utils.version import PYPY
 
 from django_async_extensions.forms.models import AsyncModelForm
+from django_async_extensions.utils.sync import get_sync_pool
 
 from .models import (
     Article,
@@ -3595,3 +3596,27 @@ class ModelToDictTests(TestCase):
         # If data were a QuerySet, it would be reevaluated here and give "red"
         # instead of the original value.
         self.assertEqual(data, [blue])
+
+
+class SyncPoolTests(SimpleTestCase):
+    async def test_model_choice_fields_stay_on_sync_thread(self):
+        class CategoryForm(AsyncModelForm):
+            use_sync_pool = True
+
+            class Meta:
+                model = Category
+                fields = "__all__"
+
+        class ArticleForm(CategoryForm):
+            class Meta:
+                model = Article
+                fields = "__all__"
+
+        self.assertIs(CategoryForm().get_use_sync_pool(), True)
+        # Rendering the writer and categories fields queries the database.
+        self.assertIs(ArticleForm().get_use_sync_pool(), False)
+
+        pool = get_sync_pool()
+        completed = pool.stats()["completed"]
+        self.assertIn("<input", await CategoryForm().aas_p())
+        self.assertEqual(pool.stats()["completed"], completed + 1)
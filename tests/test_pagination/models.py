@@ -7,3 +7,16 @@ class Article(models.Model):
 
     def __str__(self):
         return self.headline
+
+
+class Writer(models.Model):
+    name = models.CharField(max_length=50)
+
+    class Meta:
+        ordering = ("name",)
+
+
+class Review(models.Model):
+    article = models.ForeignKey(Article, models.CASCADE)
+    writer = models.ForeignKey(Writer, models.CASCADE)
+    status = models.IntegerField(null=True)
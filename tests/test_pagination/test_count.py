@@ -0,0 +1,337 @@
+import asyncio
+from datetime import datetime
+
+from asgiref.sync import sync_to_async
+
+import pytest
+
+from django.core.cache import caches
+from django.core.paginator import EmptyPage
+from django.db import transaction
+from django.utils.asyncio import async_unsafe
+
+from django_async_extensions.core.cache import get_invalidated_cache_aliases
+from django_async_extensions.core.count import (
+    CachedCount,
+    CappedCount,
+    CountStrategy,
+    EstimatedCount,
+    ExactCount,
+)
+from django_async_extensions.core.paginator import AsyncPaginator
+
+from .models import Article
+
+
+class FixedEstimateCount(EstimatedCount):
+    def __init__(self, estimate, **kwargs):
+        super().__init__(**kwargs)
+        self.estimate = estimate
+
+    async def aestimate(self, queryset):
+        return self.estimate
+
+
+class SyncOnlyObjectList:
+    """An object list whose sync methods can't be called from async code."""
+
+    def __init__(self, objects):
+        self.objects = objects
+        self.fetches = 0
+        self._result_cache = None
+
+    @async_unsafe
+    def __len__(self):
+        if self._result_cache is None:
+            self.fetches += 1
+            self._result_cache = list(self.objects)
+        return len(self._result_cache)
+
+    def __getitem__(self, index):
+        if self._result_cache is None:
+            self.fetches += 1
+            return list(self.objects)[index]
+        return self._result_cache[index]
+
+
+class SyncOnlyCountObjectList(SyncOnlyObjectList):
+    @async_unsafe
+    def count(self):
+        return len(self.objects)
+
+
+class AsyncIterable:
+    def __init__(self, objects):
+        self.objects = objects
+
+    async def __aiter__(self):
+        for obj in self.objects:
+            yield obj
+
+
+async def test_count_strategy_is_abstract():
+    with pytest.raises(NotImplementedError):
+        await CountStrategy().acount([])
+
+
+async def test_default_strategy_is_exact():
+    paginator = AsyncPaginator([1, 2, 3], 2)
+    assert isinstance(paginator.count_strategy, ExactCount)
+    assert await paginator.acount() == 3
+    assert await paginator.ais_count_exact()
+    assert await paginator.acount_display() == "3"
+
+
+async def test_exact_count_uses_sync_count_method():
+    object_list = SyncOnlyCountObjectList(range(7))
+    assert await ExactCount().acount(object_list) == (7, True)
+    assert object_list.fetches == 0
+
+
+async def test_exact_count_reuses_fetched_objects():
+    object_list = SyncOnlyObjectList(range(7))
+    paginator = AsyncPaginator(object_list, 5)
+    assert await paginator.acount() == 7
+    page = await paginator.apage(2)
+    assert await page.alist() == [5, 6]
+    assert object_list.fetches == 1
+
+
+async def test_exact_count_of_async_iterable():
+    assert await ExactCount().acount(AsyncIterable(range(7))) == (7, True)
+    with pytest.raises(TypeError):
+        await ExactCount().acount(object())
+
+
+async def test_capped_count_of_list_is_exact():
+    paginator = AsyncPaginator(list(range(10)), 2, count_strategy=CappedCount(5))
+    assert await paginator.acount() == 10
+    assert await paginator.ais_count_exact()
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCountStrategies:
+    @pytest.fixture(autouse=True)
+    async def setup(self):
+        pub_date = datetime(2005, 7, 29)
+        self.articles = [
+            await Article.objects.acreate(headline=f"Article {x}", pub_date=pub_date)
+            for x in range(1, 10)
+        ]
+
+    async def test_capped_count_below_cap(self):
+        strategy = CappedCount(cap=20)
+        assert await strategy.acount(Article.objects.all()) == (9, True)
+
+    async def test_capped_count_above_cap(self):
+        strategy = CappedCount(cap=4)
+        assert await strategy.acount(Article.objects.all()) == (4, False)
+        paginator = AsyncPaginator(
+            Article.objects.order_by("pk"), 2, count_strategy=strategy
+        )
+        assert await paginator.acount() == 4
+        assert await paginator.ais_count_exact() is False
+        assert await paginator.acount_display() == "4+"
+        assert await paginator.anum_pages() == 2
+
+    async def test_estimated_count_falls_back_without_estimate(self):
+        # SQLite has no planner estimate.
+        strategy = EstimatedCount(threshold=4)
+        assert await strategy.aestimate(Article.objects.all()) is None
+        assert await strategy.acount(Article.objects.all()) == (4, False)
+        strategy = EstimatedCount(threshold=100, fallback=ExactCount())
+        assert await strategy.acount(Article.objects.all()) == (9, True)
+
+    async def test_estimated_count(self):
+        strategy = FixedEstimateCount(5000, threshold=1000)
+        assert await strategy.acount(Article.objects.all()) == (5000, False)
+        assert strategy.display(5000, False) == "~5000"
+        # Small estimates are counted exactly.
+        strategy = FixedEstimateCount(10, threshold=1000)
+        assert await strategy.acount(Article.objects.all()) == (9, True)
+
+    async def test_pages_after_capped_count(self):
+        paginator = AsyncPaginator(
+            Article.objects.order_by("pk"), 2, count_strategy=CappedCount(4)
+        )
+        page = await paginator.apage(2)
+        assert await page.ahas_next()
+        assert await page.anext_page_number() == 3
+        page = await paginator.apage(5)
+        assert await page.alist() == self.articles[8:]
+        assert await page.ahas_next() is False
+        assert await page.astart_index() == 9
+        assert await page.aend_index() == 9
+        with pytest.raises(EmptyPage):
+            await page.anext_page_number()
+        with pytest.raises(EmptyPage):
+            await paginator.apage(6)
+        page = await paginator.aget_page(6)
+        assert page.number == 2
+
+    async def test_overestimated_count(self):
+        paginator = AsyncPaginator(
+            Article.objects.order_by("pk"),
+            2,
+            count_strategy=FixedEstimateCount(5000, threshold=1000),
+        )
+        assert await paginator.anum_pages() == 2500
+        page = await paginator.apage(5)
+        assert await page.ahas_next() is False
+        with pytest.raises(EmptyPage):
+            await paginator.apage(6)
+
+    async def test_elided_page_range_after_capped_count(self):
+        paginator = AsyncPaginator(
+            Article.objects.order_by("pk"), 1, count_strategy=CappedCount(4)
+        )
+        page_range = paginator.aget_elided_page_range(6, on_each_side=1, on_ends=1)
+        assert [page async for page in page_range] == [
+            1,
+            AsyncPaginator.ELLIPSIS,
+            5,
+            6,
+        ]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCachedCount:
+    @pytest.fixture(autouse=True)
+    async def setup(self):
+        await caches["default"].aclear()
+        pub_date = datetime(2005, 7, 29)
+        for x in range(1, 4):
+            await Article.objects.acreate(headline=f"Article {x}", pub_date=pub_date)
+
+    async def test_hits_and_misses(self):
+        strategy = CachedCount(timeout=30)
+        assert await strategy.acount(Article.objects.all()) == (3, True)
+        assert await strategy.acount(Article.objects.all()) == (3, True)
+        assert await strategy.acount(Article.objects.exclude(headline="Article 1")) == (
+            2,
+            True,
+        )
+        assert strategy.stats() == {
+            "hits": 1,
+            "misses": 2,
+            "coalesced": 0,
+            "hit_rate": 1 / 3,
+        }
+        strategy.reset_stats()
+        assert strategy.stats()["hit_rate"] == 0.0
+
+    async def test_shared_across_paginators(self, mocker):
+        strategy = CachedCount()
+        spy = mocker.spy(strategy.strategy, "acount")
+        for _ in range(3):
+            paginator = AsyncPaginator(
+                Article.objects.order_by("pk"), 2, count_strategy=strategy
+            )
+            assert await paginator.anum_pages() == 2
+        assert spy.call_count == 1
+
+    async def test_wrapped_strategy(self):
+        strategy = CachedCount(CappedCount(2))
+        assert await strategy.acount(Article.objects.all()) == (2, False)
+        assert await strategy.acount(Article.objects.all()) == (2, False)
+        assert strategy.display(2, False) == "2+"
+        assert strategy.hits == 1
+
+    async def test_invalidated_on_save_and_delete(self):
+        strategy = CachedCount()
+        assert await strategy.acount(Article.objects.all()) == (3, True)
+        article = await Article.objects.acreate(
+            headline="Article 4", pub_date=datetime(2005, 7, 29)
+        )
+        assert await strategy.acount(Article.objects.all()) == (4, True)
+        await article.adelete()
+        assert await strategy.acount(Article.objects.all()) == (3, True)
+        assert strategy.hits == 0
+
+    async def test_invalidated_in_every_cache_and_key_prefix(self):
+        # The receivers are connected at startup, so a save bumps the
+        # generations created by other processes, whatever their key prefix.
+        key = "async_extensions:generation:test_pagination.article"
+        other = CachedCount(key_prefix="other_prefix")
+        assert await other.acount(Article.objects.all()) == (3, True)
+        generation = await caches["default"].aget(key)
+        await Article.objects.acreate(
+            headline="Article 4", pub_date=datetime(2005, 7, 29)
+        )
+        assert await caches["default"].aget(key) == generation + 1
+        assert await other.acount(Article.objects.all()) == (4, True)
+        # Models without a generation don't get one on save.
+        await caches["default"].adelete(key)
+        await Article.objects.acreate(
+            headline="Article 5", pub_date=datetime(2005, 7, 30)
+        )
+        assert await caches["default"].aget(key) is None
+
+    async def test_invalidated_on_commit(self):
+        key = "async_extensions:generation:test_pagination.article"
+        strategy = CachedCount()
+        assert await strategy.acount(Article.objects.all()) == (3, True)
+        generation = await caches["default"].aget(key)
+
+        @sync_to_async
+        def create_in_transaction():
+            with transaction.atomic():
+                Article.objects.create(
+                    headline="Article 4", pub_date=datetime(2005, 7, 29)
+                )
+                # Another process could cache the old count until the commit.
+                assert caches["default"].get(key) == generation
+
+        await create_in_transaction()
+        assert await caches["default"].aget(key) == generation + 1
+        assert await strategy.acount(Article.objects.all()) == (4, True)
+
+    async def test_cache_errors_dont_fail_saves(self, mocker, caplog):
+        mocker.patch.object(
+            caches["default"], "incr", side_effect=ConnectionError("down")
+        )
+        with caplog.at_level("WARNING", logger="django_async_extensions.cache"):
+            await Article.objects.acreate(
+                headline="Article 4", pub_date=datetime(2005, 7, 29)
+            )
+        assert await Article.objects.acount() == 4
+        assert "Could not invalidate" in caplog.text
+
+    def test_invalidated_cache_aliases(self, settings):
+        # The caches used by this process are always invalidated.
+        assert "default" in get_invalidated_cache_aliases()
+        settings.ASYNC_EXTENSIONS_CACHE_ALIASES = ["counts"]
+        assert get_invalidated_cache_aliases() == ["counts", "default"]
+        settings.ASYNC_EXTENSIONS_CACHE_ALIASES = ["default", "counts"]
+        assert get_invalidated_cache_aliases() == ["default", "counts"]
+
+    async def test_keyed_by_strategy(self):
+        exact = CachedCount(ExactCount())
+        capped = CachedCount(CappedCount(2))
+        other_capped = CachedCount(CappedCount(1))
+        assert await capped.acount(Article.objects.all()) == (2, False)
+        assert await exact.acount(Article.objects.all()) == (3, True)
+        assert await other_capped.acount(Article.objects.all()) == (1, False)
+        assert await capped.acount(Article.objects.all()) == (2, False)
+        assert capped.hits == 1
+        assert exact.hits == other_capped.hits == 0
+        assert EstimatedCount(50).get_cache_key() == (
+            "EstimatedCount(50,CappedCount(50))"
+        )
+
+    async def test_concurrent_misses_are_coalesced(self, mocker):
+        strategy = CachedCount()
+        spy = mocker.spy(strategy.strategy, "acount")
+        results = await asyncio.gather(
+            *(strategy.acount(Article.objects.all()) for _ in range(5))
+        )
+        assert results == [(3, True)] * 5
+        assert spy.call_count == 1
+        assert strategy.misses == 1
+        assert strategy.coalesced == 4
+
+    async def test_not_cached(self):
+        strategy = CachedCount()
+        assert await strategy.acount([1, 2]) == (2, True)
+        assert await strategy.acount(Article.objects.none()) == (0, True)
+        assert strategy.stats()["misses"] == 0
@@ -1,8 +1,10 @@
+import asyncio
 import collections.abc
 import warnings
 from datetime import datetime
 
 import pytest
+from asgiref.sync import async_to_sync
 from pytest_django.asserts import assertWarnsMessage
 
 from django.core.paginator import (
@@ -11,11 +13,19 @@ from django.core.paginator import (
     PageNotAnInteger,
     UnorderedObjectListWarning,
 )
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 
-from django_async_extensions.core.paginator import AsyncPaginator
+from django_async_extensions.core.count import CappedCount
+from django_async_extensions.core.paginator import (
+    AsyncCursorPaginator,
+    AsyncPage,
+    AsyncPaginator,
+    InvalidCursor,
+)
 
 from .custom import AsyncValidAdjacentNumsPaginator
-from .models import Article
+from .models import Article, Review, Writer
 
 
 class TestPaginationTests:
@@ -580,6 +590,47 @@ class TestModelPagination:
         # After __getitem__ is called, object_list is a list
         assert isinstance(p.object_list, list)
 
+    def test_page_fetches_objects_once(self):
+        paginator = AsyncPaginator(Article.objects.order_by("id"), 5)
+        page = async_to_sync(paginator.apage)(1)
+
+        async def use_page():
+            assert await page.alen() == 5
+            assert await page.agetitem(1) == self.articles[1]
+            assert [obj async for obj in page] == self.articles[:5]
+            objects = await page.alist()
+            objects.append(None)
+            assert await page.alist() == self.articles[:5]
+
+        with CaptureQueriesContext(connection) as queries:
+            async_to_sync(use_page)()
+        assert len(queries) == 1
+
+    def test_page_without_materialize(self):
+        class StreamedPage(AsyncPage):
+            materialize = False
+
+        class StreamedPaginator(AsyncPaginator):
+            def _get_page(self, *args, **kwargs):
+                return StreamedPage(*args, **kwargs)
+
+        paginator = StreamedPaginator(Article.objects.order_by("id"), 5)
+        page = async_to_sync(paginator.apage)(2)
+
+        async def use_page():
+            assert await page.alen() == 4
+            assert await page.agetitem(1) == self.articles[6]
+            assert await page.agetitem(slice(2)) == self.articles[5:7]
+            with pytest.raises(IndexError):
+                await page.agetitem(4)
+            assert [obj async for obj in page] == self.articles[5:]
+
+        with CaptureQueriesContext(connection) as queries:
+            async_to_sync(use_page)()
+        # The out of range index is known to be empty without a query.
+        assert len(queries) == 4
+        assert not isinstance(page.object_list, list)
+
     def test_paginating_unordered_queryset_raises_warning(self):
         msg = (
             "Pagination may yield inconsistent results with an unordered "
@@ -633,3 +684,474 @@ class TestModelPagination:
         assert (
             await Article.objects.aget(headline="Article 1") not in await page2.alist()
         )
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentFetch:
+    """
+    Tests for AsyncPaginator with fetch_mode="concurrent".
+    """
+
+    @pytest.fixture(autouse=True)
+    async def setup(self):
+        pub_date = datetime(2005, 7, 29)
+        self.articles = [
+            await Article.objects.acreate(headline=f"Article {x}", pub_date=pub_date)
+            for x in range(1, 10)
+        ]
+
+    def test_invalid_fetch_mode(self):
+        msg = "fetch_mode must be one of 'lazy', 'concurrent', 'window', not 'eager'."
+        with pytest.raises(ValueError, match=msg):
+            AsyncPaginator([], 5, fetch_mode="eager")
+
+    async def test_pages(self):
+        paginator = AsyncPaginator(
+            Article.objects.order_by("id"), 4, fetch_mode="concurrent"
+        )
+        page = await paginator.apage(1)
+        assert isinstance(page.object_list, list)
+        assert page.object_list == self.articles[:4]
+        assert await page.ahas_next()
+        assert await page.anext_page_number() == 2
+        page = await paginator.apage(3)
+        assert page.object_list == self.articles[8:]
+        assert await page.ahas_next() is False
+        assert await page.aend_index() == 9
+        with pytest.raises(EmptyPage):
+            await paginator.apage(4)
+        with pytest.raises(PageNotAnInteger):
+            await paginator.apage("frog")
+
+    async def test_orphans(self):
+        paginator = AsyncPaginator(
+            Article.objects.order_by("id"), 4, orphans=1, fetch_mode="concurrent"
+        )
+        page = await paginator.apage(2)
+        assert page.object_list == self.articles[4:]
+        assert await page.ahas_next() is False
+        assert await paginator.anum_pages() == 2
+
+    async def test_list(self):
+        paginator = AsyncPaginator(list(range(7)), 5, fetch_mode="concurrent")
+        page = await paginator.apage(2)
+        assert page.object_list == [5, 6]
+        assert await page.ahas_previous()
+
+    def test_has_next_without_count(self):
+        paginator = AsyncPaginator(
+            Article.objects.order_by("id"), 4, fetch_mode="concurrent"
+        )
+        with CaptureQueriesContext(connection) as queries:
+            page = async_to_sync(paginator.apage)(1)
+            assert async_to_sync(page.ahas_next)()
+            assert async_to_sync(page.alen)() == 4
+        # One count and one fetch.
+        assert len(queries) == 2
+
+    async def test_capped_count(self):
+        paginator = AsyncPaginator(
+            Article.objects.order_by("id"),
+            4,
+            count_strategy=CappedCount(4),
+            fetch_mode="concurrent",
+        )
+        page = await paginator.apage(3)
+        assert page.object_list == self.articles[8:]
+        assert await page.ahas_next() is False
+        with pytest.raises(EmptyPage):
+            await paginator.apage(4)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestWindowFetch:
+    """
+    Tests for AsyncPaginator with fetch_mode="window".
+    """
+
+    @pytest.fixture(autouse=True)
+    async def setup(self):
+        pub_date = datetime(2005, 7, 29)
+        self.articles = [
+            await Article.objects.acreate(headline=f"Article {x}", pub_date=pub_date)
+            for x in range(1, 10)
+        ]
+
+    def test_single_query(self):
+        paginator = AsyncPaginator(
+            Article.objects.order_by("id"), 4, fetch_mode="window"
+        )
+        with CaptureQueriesContext(connection) as queries:
+            page = async_to_sync(paginator.apage)(2)
+            assert async_to_sync(paginator.acount)() == 9
+            assert async_to_sync(page.ahas_next)()
+            assert async_to_sync(page.aend_index)() == 8
+        assert len(queries) == 1
+        assert "OVER" in queries[0]["sql"].upper()
+        assert page.object_list == self.articles[4:8]
+        assert not hasattr(page.object_list[0], paginator.window_count_alias)
+
+    def test_empty_page_counts_separately(self):
+        paginator = AsyncPaginator(
+            Article.objects.order_by("id"), 4, fetch_mode="window"
+        )
+        with CaptureQueriesContext(connection) as queries:
+            with pytest.raises(EmptyPage):
+                async_to_sync(paginator.apage)(4)
+        assert len(queries) == 2
+        paginator = AsyncPaginator(
+            Article.objects.none(), 4, fetch_mode="window", allow_empty_first_page=False
+        )
+        with pytest.raises(EmptyPage):
+            async_to_sync(paginator.apage)(1)
+
+    async def test_last_page_with_orphans(self):
+        paginator = AsyncPaginator(
+            Article.objects.order_by("id"), 4, orphans=1, fetch_mode="window"
+        )
+        page = await paginator.apage(2)
+        assert page.object_list == self.articles[4:]
+        assert await page.ahas_next() is False
+        with pytest.raises(EmptyPage):
+            await paginator.apage(3)
+
+    async def test_values_queryset(self):
+        paginator = AsyncPaginator(
+            Article.objects.values("id", "headline").order_by("id"),
+            5,
+            fetch_mode="window",
+        )
+        page = await paginator.apage(2)
+        assert page.object_list == [
+            {"id": a.pk, "headline": a.headline} for a in self.articles[5:]
+        ]
+        assert await paginator.acount() == 9
+
+    async def test_falls_back_to_lazy_fetch(self):
+        for object_list in (
+            list(range(9)),
+            Article.objects.values_list("id", flat=True).order_by("id"),
+            Article.objects.order_by("id").distinct(),
+        ):
+            paginator = AsyncPaginator(object_list, 5, fetch_mode="window")
+            page = await paginator.apage(2)
+            assert await page.alen() == 4
+            assert await paginator.acount() == 9
+
+
+class RecordingList(list):
+    """A list recording the slices taken from it."""
+
+    def __init__(self, *args, fail_at=None):
+        super().__init__(*args)
+        self.slices = []
+        self.fail_at = fail_at
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            if index.start == self.fail_at:
+                raise RuntimeError("Broken slice")
+            self.slices.append(index)
+        return super().__getitem__(index)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestStreaming:
+    """
+    Tests for AsyncPaginator.aiter_chunks() and astream().
+    """
+
+    @pytest.fixture(autouse=True)
+    async def setup(self):
+        pub_date = datetime(2005, 7, 29)
+        self.articles = [
+            await Article.objects.acreate(headline=f"Article {x}", pub_date=pub_date)
+            for x in range(1, 10)
+        ]
+
+    def test_keyset_chunks(self):
+        paginator = AsyncPaginator(Article.objects.order_by("-pub_date"), 4)
+
+        async def chunks():
+            return [chunk async for chunk in paginator.aiter_chunks()]
+
+        with CaptureQueriesContext(connection) as queries:
+            result = async_to_sync(chunks)()
+        # All the articles have the same pub_date, the pk breaks the ties.
+        expected = self.articles[::-1]
+        assert result == [expected[:4], expected[4:8], expected[8:]]
+        assert len(queries) == 3
+        sql = " ".join(query["sql"] for query in queries.captured_queries).upper()
+        assert "OFFSET" not in sql
+        assert "COUNT(" not in sql
+
+    async def test_chunk_size(self):
+        paginator = AsyncPaginator(Article.objects.order_by("id"), 4)
+        chunks = [chunk async for chunk in paginator.aiter_chunks(5)]
+        assert chunks == [self.articles[:5], self.articles[5:]]
+        with pytest.raises(ValueError, match="chunk_size must be a positive"):
+            await anext(paginator.aiter_chunks(0))
+
+    def test_server_side_cursor(self):
+        paginator = AsyncPaginator(Article.objects.order_by("id"), 4)
+
+        async def chunks():
+            return [
+                chunk async for chunk in paginator.aiter_chunks(server_side_cursor=True)
+            ]
+
+        with CaptureQueriesContext(connection) as queries:
+            result = async_to_sync(chunks)()
+        assert result == [self.articles[:4], self.articles[4:8], self.articles[8:]]
+        assert len(queries) == 1
+
+    async def test_chunks_without_keyset(self):
+        ids = [a.pk for a in self.articles]
+        for object_list in (
+            Article.objects.values_list("id", flat=True).order_by("id"),
+            Article.objects.values("headline").order_by("id"),
+            Article.objects.order_by("headline")[:9],
+            ids,
+        ):
+            paginator = AsyncPaginator(object_list, 5)
+            chunks = [chunk async for chunk in paginator.aiter_chunks()]
+            assert [len(chunk) for chunk in chunks] == [5, 4]
+
+    async def test_chunks_foreign_key_ordering(self):
+        writers = [await Writer.objects.acreate(name=name) for name in "dcba"]
+        reviews = [
+            await Review.objects.acreate(article=article, writer=writer)
+            for article, writer in zip(self.articles[::-1], writers)
+        ]
+        for ordering, expected in (
+            # Walked in keyset chunks, by article_id.
+            ("article", reviews[::-1]),
+            # By Writer.Meta.ordering, walked with aiterator().
+            ("writer", reviews[::-1]),
+            ("-writer", reviews),
+        ):
+            paginator = AsyncPaginator(Review.objects.order_by(ordering), 3)
+            chunks = [chunk async for chunk in paginator.aiter_chunks()]
+            assert [obj for chunk in chunks for obj in chunk] == expected
+            pages = [page async for page in paginator.astream()]
+            assert [obj for page in pages for obj in page.object_list] == expected
+
+    async def test_stream(self):
+        paginator = AsyncPaginator(Article.objects.order_by("id"), 4)
+        pages = [page async for page in paginator.astream()]
+        assert [page.number for page in pages] == [1, 2, 3]
+        assert [page.object_list for page in pages] == [
+            self.articles[:4],
+            self.articles[4:8],
+            self.articles[8:],
+        ]
+        assert [await page.ahas_next() for page in pages] == [True, True, False]
+
+    async def test_stream_orphans(self):
+        paginator = AsyncPaginator(list(range(9)), 4, orphans=1)
+        pages = [page.object_list async for page in paginator.astream()]
+        assert pages == [[0, 1, 2, 3], [4, 5, 6, 7, 8]]
+        paginator = AsyncPaginator(list(range(8)), 4, orphans=1)
+        pages = [page.object_list async for page in paginator.astream()]
+        assert pages == [[0, 1, 2, 3], [4, 5, 6, 7]]
+
+    async def test_stream_empty(self):
+        paginator = AsyncPaginator([], 4)
+        pages = [page async for page in paginator.astream()]
+        assert len(pages) == 1
+        assert pages[0].object_list == []
+        assert await pages[0].ahas_other_pages() is False
+        paginator = AsyncPaginator([], 4, allow_empty_first_page=False)
+        assert [page async for page in paginator.astream()] == []
+
+    async def test_stream_buffer(self):
+        object_list = RecordingList(range(20))
+        paginator = AsyncPaginator(object_list, 1)
+        pages = paginator.astream(buffer=1)
+        page = await anext(pages)
+        assert page.object_list == [0]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        # The page being used, the page in the buffer and the chunk fetched
+        # ahead of it, the fetching then waits for the buffer to be emptied.
+        assert len(object_list.slices) <= 4
+        assert [page.number async for page in pages] == list(range(2, 21))
+        await pages.aclose()
+
+    async def test_stream_buffer_stops_fetching_when_closed(self):
+        object_list = RecordingList(range(20))
+        paginator = AsyncPaginator(object_list, 1)
+        pages = paginator.astream(buffer=2)
+        await anext(pages)
+        await pages.aclose()
+        fetched = len(object_list.slices)
+        for _ in range(10):
+            await asyncio.sleep(0)
+        assert len(object_list.slices) == fetched
+
+    async def test_stream_buffer_error(self):
+        paginator = AsyncPaginator(RecordingList(range(20), fail_at=4), 2)
+        pages = []
+        with pytest.raises(RuntimeError, match="Broken slice"):
+            async for page in paginator.astream(buffer=2):
+                pages.append(page.number)
+        assert pages == [1]
+
+
+@pytest.mark.django_db(transaction=True)
+class TestCursorPagination:
+    """
+    Tests for the keyset based AsyncCursorPaginator.
+    """
+
+    @pytest.fixture(autouse=True)
+    async def setup(self):
+        # Two articles share each pub_date, so the pk has to break ties.
+        self.articles = [
+            await Article.objects.acreate(
+                headline=f"Article {x}", pub_date=datetime(2005, 7, 1 + x // 2)
+            )
+            for x in range(1, 10)
+        ]
+
+    async def test_ordering_gets_primary_key(self):
+        paginator = AsyncCursorPaginator(Article.objects.order_by("-pub_date"), 2)
+        assert paginator.ordering == (("pub_date", True), ("id", True))
+        paginator = AsyncCursorPaginator(Article.objects.all(), 2, ordering="pk")
+        assert paginator.ordering == (("id", False),)
+
+    def test_unsupported_ordering(self):
+        with pytest.raises(ValueError, match="only supports ordering by field names"):
+            AsyncCursorPaginator(Article.objects.order_by("?"), 2)
+        with pytest.raises(ValueError, match="only supports ordering by fields"):
+            AsyncCursorPaginator(Article.objects.order_by("pub_date__year"), 2)
+
+    async def test_walk_forward_and_backward(self):
+        expected = sorted(self.articles, key=lambda a: (a.pub_date, a.pk))
+        paginator = AsyncCursorPaginator(Article.objects.order_by("pub_date"), 4)
+
+        page1 = await paginator.apage()
+        assert "<Async Cursor Page>" == str(page1)
+        assert page1.object_list == expected[:4]
+        assert await page1.ahas_next()
+        assert await page1.ahas_previous() is False
+
+        page2 = await paginator.apage(page1.next_cursor)
+        assert page2.object_list == expected[4:8]
+        assert await page2.ahas_next()
+        assert await page2.ahas_previous()
+
+        page3 = await paginator.apage(page2.next_cursor)
+        assert page3.object_list == expected[8:]
+        assert await page3.ahas_next() is False
+        assert await page3.ahas_other_pages()
+
+        back = await paginator.apage(page3.previous_cursor)
+        assert back.object_list == expected[4:8]
+        back = await paginator.apage(back.previous_cursor)
+        assert back.object_list == expected[:4]
+        assert await back.ahas_previous() is False
+        assert await back.ahas_next()
+
+    async def test_descending_ordering(self):
+        expected = sorted(self.articles, key=lambda a: (a.pub_date, a.pk))[::-1]
+        paginator = AsyncCursorPaginator(Article.objects.order_by("-pub_date"), 5)
+        page1 = await paginator.apage()
+        page2 = await paginator.apage(page1.next_cursor)
+        assert page1.object_list + page2.object_list == expected
+
+    async def test_orphans(self):
+        paginator = AsyncCursorPaginator(Article.objects.order_by("pk"), 4, orphans=1)
+        page1 = await paginator.apage()
+        page2 = await paginator.apage(page1.next_cursor)
+        assert await page2.alen() == 5
+        assert await page2.ahas_next() is False
+
+    def test_no_offset_or_count(self):
+        paginator = AsyncCursorPaginator(Article.objects.order_by("pk"), 4)
+        page1 = async_to_sync(paginator.apage)()
+        with CaptureQueriesContext(connection) as queries:
+            async_to_sync(paginator.apage)(page1.next_cursor)
+        assert len(queries) == 1
+        sql = " ".join(query["sql"] for query in queries.captured_queries).upper()
+        assert "OFFSET" not in sql
+        assert "COUNT(" not in sql
+
+    async def test_values_queryset(self):
+        paginator = AsyncCursorPaginator(
+            Article.objects.values("id", "headline").order_by("id"), 5
+        )
+        page1 = await paginator.apage()
+        page2 = await paginator.apage(page1.next_cursor)
+        assert [row["id"] for row in page2.object_list] == [
+            a.pk for a in self.articles[5:]
+        ]
+
+    async def test_sub_millisecond_datetimes(self):
+        await Article.objects.all().adelete()
+        articles = [
+            await Article.objects.acreate(
+                headline=f"A{x}", pub_date=datetime(2005, 7, 1, 12, 0, 0, x * 10)
+            )
+            for x in range(6)
+        ]
+        for ordering in ("pub_date", "-pub_date"):
+            paginator = AsyncCursorPaginator(Article.objects.order_by(ordering), 2)
+            seen = []
+            page = await paginator.apage()
+            seen += page.object_list
+            # Bounded, a cursor pointing before its row loops forever.
+            while page.next_cursor and len(seen) <= len(articles):
+                page = await paginator.apage(page.next_cursor)
+                seen += page.object_list
+            expected = articles if ordering == "pub_date" else articles[::-1]
+            assert seen == expected
+            back = await paginator.apage(page.previous_cursor)
+            assert back.object_list == expected[2:4]
+
+    async def test_foreign_key_ordering(self):
+        writers = [await Writer.objects.acreate(name=name) for name in "dcba"]
+        reviews = [
+            await Review.objects.acreate(article=article, writer=writer)
+            for article, writer in zip(self.articles[::-1], writers)
+        ]
+        # Compared by article_id, the ordering of order_by("article").
+        paginator = AsyncCursorPaginator(Review.objects.order_by("article"), 3)
+        assert paginator.ordering == (("article_id", False), ("id", False))
+        page1 = await paginator.apage()
+        page2 = await paginator.apage(page1.next_cursor)
+        assert page1.object_list + page2.object_list == reviews[::-1]
+        # order_by("writer") follows Writer.Meta.ordering, not writer_id.
+        with pytest.raises(ValueError, match="ordering of test_pagination.Writer"):
+            AsyncCursorPaginator(Review.objects.order_by("writer"), 3)
+
+    def test_nullable_ordering(self):
+        with pytest.raises(ValueError, match="nullable field 'status'"):
+            AsyncCursorPaginator(Review.objects.all(), 3, ordering="status")
+
+    async def test_invalid_cursor(self):
+        paginator = AsyncCursorPaginator(Article.objects.order_by("pk"), 4)
+        for cursor in (
+            "frog",
+            "e30",
+            paginator.encode_cursor([1, 2]),
+            paginator.encode_cursor(["not a pk"]),
+        ):
+            with pytest.raises(InvalidCursor, match="That cursor is not valid"):
+                await paginator.apage(cursor)
+        page = await paginator.aget_page("frog")
+        assert page.object_list == self.articles[:4]
+
+    async def test_empty_pages(self):
+        paginator = AsyncCursorPaginator(Article.objects.none(), 4)
+        page = await paginator.apage()
+        assert page.object_list == []
+        assert await page.ahas_other_pages() is False
+        paginator = AsyncCursorPaginator(
+            Article.objects.none(), 4, allow_empty_first_page=False
+        )
+        with pytest.raises(EmptyPage):
+            await paginator.apage()
+        paginator = AsyncCursorPaginator(Article.objects.order_by("pk"), 4)
+        with pytest.raises(EmptyPage):
+            await paginator.apage(paginator.encode_cursor([self.articles[-1].pk]))
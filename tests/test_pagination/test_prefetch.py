@@ -0,0 +1,99 @@
+import logging
+from datetime import datetime
+
+import pytest
+
+from django.core.cache import caches
+
+from django_async_extensions.core.paginator import AsyncPaginator
+from django_async_extensions.core.prefetch import PagePrefetcher
+
+from .models import Article
+
+
+@pytest.mark.django_db(transaction=True)
+class TestPagePrefetcher:
+    @pytest.fixture(autouse=True)
+    async def setup(self):
+        await caches["default"].aclear()
+        pub_date = datetime(2005, 7, 29)
+        self.articles = [
+            await Article.objects.acreate(headline=f"Article {x}", pub_date=pub_date)
+            for x in range(1, 10)
+        ]
+
+    async def test_next_page_is_prefetched(self):
+        prefetcher = PagePrefetcher()
+        paginator = AsyncPaginator(
+            Article.objects.order_by("id"), 4, prefetcher=prefetcher
+        )
+        page = await paginator.apage(1)
+        assert not isinstance(page.object_list, list)
+        await prefetcher.ajoin()
+
+        paginator = AsyncPaginator(
+            Article.objects.order_by("id"), 4, prefetcher=prefetcher
+        )
+        page = await paginator.apage(2)
+        assert page.object_list == self.articles[4:8]
+        await prefetcher.ajoin()
+        page = await paginator.apage(3)
+        assert page.object_list == self.articles[8:]
+        await prefetcher.ajoin()
+        assert prefetcher.stats() == {
+            "hits": 2,
+            "misses": 1,
+            "scheduled": 2,
+            "dropped": 0,
+            "hit_rate": 2 / 3,
+        }
+        prefetcher.reset_stats()
+        assert prefetcher.stats()["hit_rate"] == 0.0
+
+    async def test_orphans_are_prefetched_with_last_page(self):
+        prefetcher = PagePrefetcher()
+        paginator = AsyncPaginator(
+            Article.objects.order_by("id"), 4, orphans=1, prefetcher=prefetcher
+        )
+        await paginator.apage(1)
+        await prefetcher.ajoin()
+        page = await paginator.apage(2)
+        assert page.object_list == self.articles[4:]
+        assert prefetcher.scheduled == 1
+
+    async def test_invalidated_on_save(self):
+        prefetcher = PagePrefetcher()
+        paginator = AsyncPaginator(
+            Article.objects.order_by("id"), 4, prefetcher=prefetcher
+        )
+        await paginator.apage(1)
+        await prefetcher.ajoin()
+        article = self.articles[5]
+        article.headline = "Updated"
+        await article.asave()
+        page = await paginator.apage(2)
+        assert not isinstance(page.object_list, list)
+        assert (await page.alist())[1].headline == "Updated"
+
+    async def test_concurrency_limit(self):
+        prefetcher = PagePrefetcher(max_concurrency=1)
+        assert prefetcher.schedule(Article.objects.order_by("id")[:4]) is not None
+        assert prefetcher.schedule(Article.objects.order_by("id")[4:8]) is None
+        assert prefetcher.stats()["dropped"] == 1
+        await prefetcher.ajoin()
+        assert prefetcher.schedule(Article.objects.order_by("id")[4:8]) is not None
+        await prefetcher.ajoin()
+
+    async def test_aclose_cancels_prefetches(self):
+        prefetcher = PagePrefetcher()
+        task = prefetcher.schedule(Article.objects.order_by("id")[:4])
+        await prefetcher.aclose()
+        assert task.cancelled()
+        assert await prefetcher.aget(Article.objects.order_by("id")[:4]) is None
+
+    async def test_errors_are_logged(self, caplog):
+        prefetcher = PagePrefetcher()
+        prefetcher.schedule(Article.objects.extra(where=["no_such_column = 1"]))
+        with caplog.at_level(logging.ERROR, "django_async_extensions.prefetch"):
+            await prefetcher.ajoin()
+        assert "Error prefetching" in caplog.text